@@ -0,0 +1,49 @@
+"""
+Frequency Nesting Check - generate_from_depths against HMS ground truth
+
+Nests the HCFCD Model D 1% AEP depths (Brays Bayou, 5-minute interval, 67%
+peak) with FrequencyStorm.generate_from_depths and compares the result with
+the bundled TP-40 pattern, which was taken from HEC-HMS PRECIP-INC output
+(FrequencyStorm.generate_hyetograph(13.2)).
+
+Exits with status 1 if any step differs by more than the Task 055 acceptance
+limit of 0.01 inches.
+
+Usage:
+    python examples/frequency_nesting_check.py
+"""
+
+import sys
+
+import numpy as np
+
+from hms_commander import FrequencyStorm
+
+# HCFCD Model D 1% AEP Depth lines (5, 15, 60, 120, 180, 360, 720, 1440 min)
+MODEL_D_1PCT_DEPTHS = [1.2, 2.1, 4.3, 5.7, 6.7, 8.9, 10.8, 13.2]
+
+# Task 055 per-step acceptance limit (inches)
+TOLERANCE_INCHES = 0.01
+
+
+def main() -> int:
+    nested = FrequencyStorm.generate_from_depths(MODEL_D_1PCT_DEPTHS)
+    ground_truth = FrequencyStorm.generate_hyetograph(13.2)['incremental_depth'].to_numpy()
+
+    metrics = FrequencyStorm.validate_against_ground_truth(nested, ground_truth)
+    max_15min = np.convolve(nested[1:], np.ones(3), 'valid').max()
+
+    print("generate_from_depths vs HMS ground truth (HCFCD Model D 1%)")
+    for key, value in metrics.items():
+        print(f"  {key:<12}{value:>12.6f}")
+    print(f"  {'max_15min':<12}{max_15min:>12.6f}")
+
+    if metrics['max_diff'] > TOLERANCE_INCHES:
+        print(f"FAIL: max difference exceeds {TOLERANCE_INCHES} in")
+        return 1
+    print("PASS")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
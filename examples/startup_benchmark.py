@@ -0,0 +1,74 @@
+"""
+Startup Benchmark - import and first-storm cost of hms_commander
+
+Measures, in fresh interpreter processes (as a worker pool would see it):
+
+1. import hms_commander
+2. First access to every bundled storm pattern (memory-mapped
+   data/storm_patterns.npy)
+3. First SCS Type II and TP-40 hyetograph
+
+Usage:
+    python examples/startup_benchmark.py [--runs 20]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+# Timed in each child process; prints one JSON line of milliseconds
+CHILD_SCRIPT = """
+import json, time
+t0 = time.perf_counter()
+import hms_commander
+t1 = time.perf_counter()
+from hms_commander import FrequencyStorm, ScsTypeStorm
+for scs_type in ScsTypeStorm.SCS_TYPES:
+    ScsTypeStorm._load_pattern(scs_type)
+FrequencyStorm._load_pattern()
+t2 = time.perf_counter()
+ScsTypeStorm.generate_hyetograph(10.0, 'II', 15)
+FrequencyStorm.generate_hyetograph(13.2)
+t3 = time.perf_counter()
+print(json.dumps({
+    'import_ms': (t1 - t0) * 1e3,
+    'patterns_ms': (t2 - t1) * 1e3,
+    'first_storms_ms': (t3 - t2) * 1e3,
+}))
+"""
+
+
+def run_benchmark(runs: int) -> dict:
+    """Run the child script in `runs` fresh processes and collect timings."""
+    repo_root = Path(__file__).resolve().parent.parent
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", CHILD_SCRIPT],
+            cwd=repo_root, capture_output=True, text=True, check=True
+        ).stdout
+        samples.append(json.loads(output.strip().splitlines()[-1]))
+    return {key: [s[key] for s in samples] for key in samples[0]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=20, help="Number of fresh processes")
+    args = parser.parse_args()
+
+    timings = run_benchmark(args.runs)
+
+    print(f"hms_commander startup ({args.runs} fresh processes)")
+    print(f"{'stage':<18}{'median ms':>12}{'min ms':>10}{'max ms':>10}")
+    for key, values in timings.items():
+        print(
+            f"{key:<18}{statistics.median(values):>12.2f}"
+            f"{min(values):>10.2f}{max(values):>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
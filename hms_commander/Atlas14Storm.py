@@ -5,16 +5,33 @@ Generates precipitation hyetographs using NOAA Atlas 14 temporal distributions,
 matching the algorithm used by HEC-HMS internally.
 
 Algorithm:
-    1. Download/load Atlas 14 temporal distribution (cumulative % vs time)
+    1. Load Atlas 14 temporal distribution (cumulative % vs time) from the
+       offline store, or download it from NOAA
     2. Select appropriate quartile and probability
     3. Apply to total storm depth (from DDF table)
     4. Convert cumulative to incremental depths
 
 This matches HEC-HMS "Hypothetical Storm" with "Specified Pattern" storm type.
+
+Interpolation:
+    interpolate_hyetographs() blends the cumulative curves of the two
+    bracketing probability columns (and optionally quartiles) for continuous
+    AEPs instead of snapping to the nearest column, for Monte Carlo sampling.
+    AEPs only select columns between 10% and 50% (rarer storms share the 10%
+    curve); pass probabilities to sample the column independently.
+
+Offline Store:
+    All temporal distributions can be packed into one versioned .npy file
+    (build_temporal_store) that is memory-mapped on first use, so lookups
+    need no network access or CSV parsing. The store is searched at, in
+    order: the HMS_COMMANDER_ATLAS14_STORE environment variable,
+    ~/.hms-commander/atlas14/, and the package data folder.
 """
 
+import os
+import re
 from pathlib import Path
-from typing import Dict, Optional, Union, Tuple
+from typing import Dict, List, Optional, Union, Tuple
 from dataclasses import dataclass
 import pandas as pd
 import numpy as np
@@ -22,6 +39,7 @@ import requests
 
 from .LoggingConfig import get_logger
 from .Decorators import log_call
+from ._storms import as_list, as_vector, broadcast_depths
 
 logger = get_logger(__name__)
 
@@ -106,10 +124,26 @@ class Atlas14Storm:
 
     # Standard probability columns (as percentages)
     PROBABILITY_COLUMNS = ["90%", "80%", "70%", "60%", "50%", "40%", "30%", "20%", "10%"]
+    PROBABILITY_VALUES = np.array([90.0, 80.0, 70.0, 60.0, 50.0, 40.0, 30.0, 20.0, 10.0])
+
+    # AEP range mapped onto the probability columns (see _aep_to_probability)
+    AEP_PROBABILITY_RANGE = (10.0, 50.0)
 
     # Cache for temporal distributions (avoid re-downloading)
     _temporal_cache: Dict[str, Dict[str, pd.DataFrame]] = {}
 
+    # Cumulative (quartile, time, probability) arrays keyed like _temporal_cache
+    _cube_cache: Dict[str, Tuple[np.ndarray, List[str], np.ndarray]] = {}
+
+    # Offline temporal distribution store (see build_temporal_store)
+    TEMPORAL_STORE_VERSION = 1
+    TEMPORAL_STORE_FILE = f"atlas14_temporal_v{TEMPORAL_STORE_VERSION}.npy"
+    TEMPORAL_STORE_ENV = "HMS_COMMANDER_ATLAS14_STORE"
+
+    # Memory-mapped store records and {(state, region, duration): row indices}
+    _temporal_store: Optional[np.ndarray] = None
+    _temporal_store_index: Optional[Dict[Tuple[str, int, int], np.ndarray]] = None
+
     @staticmethod
     def _validate_duration(duration_hours: int) -> None:
         """
@@ -195,69 +229,262 @@ class Atlas14Storm:
             - Columns: Probability strings ("90%", "80%", ..., "10%")
             - Values: Cumulative percentages (0 to 100)
         """
-        lines = csv_content.strip().split('\n')
-
-        # Quartile markers in CSV
-        quartile_markers = {
-            "FIRST-QUARTILE": "First Quartile",
-            "SECOND-QUARTILE": "Second Quartile",
-            "THIRD-QUARTILE": "Third Quartile",
-            "FOURTH-QUARTILE": "Fourth Quartile",
-            "ALL CASES": "All Cases"
+        result = {
+            name: pd.DataFrame(
+                table, index=pd.Index(hours, name='hours'),
+                columns=Atlas14Storm.PROBABILITY_COLUMNS
+            )
+            for name, (hours, table) in Atlas14Storm._parse_temporal_sections(csv_content).items()
         }
+        if result:
+            logger.info(f"Parsed {len(result)} quartile tables with {len(next(iter(result.values())))} time steps each")
+        return result
+
+    @staticmethod
+    def parse_temporal_array(csv_content: str) -> Tuple[np.ndarray, List[str], np.ndarray]:
+        """
+        Parse Atlas 14 temporal distribution CSV into one contiguous array.
 
-        quartile_data = {}
-        current_quartile = None
-        current_data = []
+        Args:
+            csv_content: Raw CSV content as string
 
-        for line in lines:
-            line = line.strip()
-            if not line:
+        Returns:
+            Tuple of:
+                - np.ndarray of shape (quartile, time, probability) with
+                  cumulative percentages, probabilities in PROBABILITY_COLUMNS
+                  order; quartiles with fewer rows are padded with NaN
+                - List of quartile names (file order)
+                - np.ndarray of hours (from the longest quartile table)
+
+        Raises:
+            ValueError: If no quartile table is found
+
+        Example:
+            >>> cube, quartiles, hours = Atlas14Storm.parse_temporal_array(csv_content)
+            >>> cube[quartiles.index("All Cases"), :, 4]  # 50% curve
+        """
+        sections = Atlas14Storm._parse_temporal_sections(csv_content)
+        if not sections:
+            raise ValueError("No Atlas 14 quartile tables found in CSV content")
+
+        names = list(sections)
+        n_steps = max(len(hours) for hours, _ in sections.values())
+        cube = np.full((len(names), n_steps, len(Atlas14Storm.PROBABILITY_COLUMNS)), np.nan)
+        hours = None
+        for k, (section_hours, table) in enumerate(sections.values()):
+            cube[k, :len(table)] = table
+            if len(section_hours) == n_steps and hours is None:
+                hours = section_hours
+        return cube, names, hours
+
+    # Section headers in the NOAA temporal CSVs (checked in this order per line)
+    _QUARTILE_MARKERS = {
+        "FIRST-QUARTILE": "First Quartile",
+        "SECOND-QUARTILE": "Second Quartile",
+        "THIRD-QUARTILE": "Third Quartile",
+        "FOURTH-QUARTILE": "Fourth Quartile",
+        "ALL CASES": "All Cases"
+    }
+
+    # A data row: leading digit, then at least 10 comma-separated fields
+    _TEMPORAL_ROW = re.compile(r'^[ \t]*(\d[^,\n]*)' + r',([^,\n]*)' * 9, re.MULTILINE)
+
+    @staticmethod
+    def _parse_temporal_sections(csv_content: str) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """
+        Locate quartile sections once and bulk-convert each block.
+
+        Returns:
+            Dict mapping quartile name to (hours, (time, probability) array)
+        """
+        markers = Atlas14Storm._QUARTILE_MARKERS
+        upper = csv_content.upper()
+
+        # Header lines as (line start, line end), one per line
+        headers = []
+        for match in re.finditer('|'.join(re.escape(m) for m in markers), upper):
+            line_start = upper.rfind('\n', 0, match.start()) + 1
+            if headers and headers[-1][0] == line_start:
+                continue
+            line_end = upper.find('\n', match.end())
+            headers.append((line_start, len(upper) if line_end < 0 else line_end))
+
+        sections = {}
+        for k, (line_start, line_end) in enumerate(headers):
+            line = upper[line_start:line_end]
+            name = next(markers[m] for m in markers if m in line)
+            block_end = headers[k + 1][0] if k + 1 < len(headers) else len(csv_content)
+            fields = Atlas14Storm._TEMPORAL_ROW.findall(csv_content, line_end, block_end)
+            if not fields:
                 continue
 
-            # Check for quartile header
-            for marker, name in quartile_markers.items():
-                if marker in line.upper():
-                    # Save previous quartile
-                    if current_quartile and current_data:
-                        quartile_data[current_quartile] = current_data
-                    current_quartile = name
-                    current_data = []
-                    break
-            else:
-                # Parse data row
-                if current_quartile and line[0].isdigit():
-                    values = [v.strip() for v in line.split(',')]
-                    if len(values) >= 10:
-                        try:
-                            row = {
-                                'hours': float(values[0]),
-                                '90%': float(values[1]),
-                                '80%': float(values[2]),
-                                '70%': float(values[3]),
-                                '60%': float(values[4]),
-                                '50%': float(values[5]),
-                                '40%': float(values[6]),
-                                '30%': float(values[7]),
-                                '20%': float(values[8]),
-                                '10%': float(values[9])
-                            }
-                            current_data.append(row)
-                        except ValueError:
-                            pass
-
-        # Save last quartile
-        if current_quartile and current_data:
-            quartile_data[current_quartile] = current_data
-
-        # Convert to DataFrames
-        result = {}
-        for name, data in quartile_data.items():
-            df = pd.DataFrame(data)
-            df.set_index('hours', inplace=True)
-            result[name] = df
+            try:
+                values = np.array([float(v) for row in fields for v in row]).reshape(len(fields), 10)
+            except ValueError:
+                # Rare malformed rows: drop them, as the row-by-row parser did
+                values = pd.DataFrame(fields).apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+                values = values[~np.isnan(values).any(axis=1)]
+            if len(values):
+                sections[name] = (values[:, 0].copy(), np.ascontiguousarray(values[:, 1:]))
+        return sections
+
+    @staticmethod
+    @log_call
+    def build_temporal_store(
+        regions: List[Tuple[str, int]],
+        output_path: Optional[Union[str, Path]] = None,
+        durations_hours: Optional[List[int]] = None,
+        cache_dir: Optional[Path] = None
+    ) -> Path:
+        """
+        Download and pack temporal distributions into one offline store.
+
+        This is the refresh tool for the offline store: run it on a machine
+        with internet access (or with the CSVs already in ``cache_dir``) and
+        copy the file to compute nodes. Region/duration combinations that
+        NOAA does not publish are skipped.
+
+        Args:
+            regions: (state, region) pairs, e.g. [("tx", r) for r in range(1, 4)]
+            output_path: Store file (default: ~/.hms-commander/atlas14/
+                atlas14_temporal_v1.npy)
+            durations_hours: Durations to include (default: SUPPORTED_DURATIONS)
+            cache_dir: CSV cache directory (default: ~/.hms-commander/atlas14/)
 
-        logger.info(f"Parsed {len(result)} quartile tables with {len(df)} time steps each")
+        Returns:
+            Path to the written store
+
+        Raises:
+            ValueError: If no distribution could be loaded
+
+        Example:
+            >>> Atlas14Storm.build_temporal_store([("tx", r) for r in (1, 2, 3)])
+        """
+        if durations_hours is None:
+            durations_hours = Atlas14Storm.SUPPORTED_DURATIONS
+        if cache_dir is None:
+            cache_dir = Path.home() / ".hms-commander" / "atlas14"
+        if output_path is None:
+            output_path = Path.home() / ".hms-commander" / "atlas14" / Atlas14Storm.TEMPORAL_STORE_FILE
+        output_path = Path(output_path)
+
+        tables = []
+        for state, region in regions:
+            state = state.lower()
+            for duration in durations_hours:
+                Atlas14Storm._validate_duration(duration)
+                config = Atlas14Config(state=state, region=int(region), duration=int(duration))
+                try:
+                    csv_content = Atlas14Storm.download_temporal_csv(config, cache_dir)
+                except requests.HTTPError as e:
+                    if e.response is not None and e.response.status_code == 404:
+                        logger.info(f"Skipping {config.region_code} {duration}h (not published)")
+                        continue
+                    raise
+                sections = Atlas14Storm._parse_temporal_sections(csv_content)
+                for quartile, (hours, table) in sections.items():
+                    tables.append((state, int(region), int(duration), quartile, hours, table))
+
+        if not tables:
+            raise ValueError("No temporal distributions were loaded; nothing to store")
+
+        max_steps = max(len(table) for *_, table in tables)
+        n_probs = len(Atlas14Storm.PROBABILITY_COLUMNS)
+        records = np.zeros(len(tables), dtype=[
+            ('state', 'U2'), ('region', 'i4'), ('duration', 'i4'), ('quartile', 'U16'),
+            ('num_steps', 'i4'), ('hours', 'f8', (max_steps,)),
+            ('cumulative', 'f8', (max_steps, n_probs)),
+        ])
+        records['hours'] = np.nan
+        records['cumulative'] = np.nan
+        for k, (state, region, duration, quartile, hours, table) in enumerate(tables):
+            n = len(table)
+            records[k]['state'] = state
+            records[k]['region'] = region
+            records[k]['duration'] = duration
+            records[k]['quartile'] = quartile
+            records[k]['num_steps'] = n
+            records[k]['hours'][:n] = hours
+            records[k]['cumulative'][:n] = table
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = output_path.with_name(output_path.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            np.save(f, records)
+        os.replace(tmp_path, output_path)
+
+        # Drop a previously mapped store so the new file is used
+        Atlas14Storm._temporal_store = None
+        Atlas14Storm._temporal_store_index = None
+
+        logger.info(f"Wrote Atlas 14 temporal store: {output_path} ({len(records)} tables)")
+        return output_path
+
+    @staticmethod
+    def load_temporal_store(
+        store_path: Optional[Union[str, Path]] = None
+    ) -> Optional[np.ndarray]:
+        """
+        Memory-map the offline temporal distribution store.
+
+        Args:
+            store_path: Store file. If None, the first existing of
+                $HMS_COMMANDER_ATLAS14_STORE, ~/.hms-commander/atlas14/
+                atlas14_temporal_v1.npy and the bundled package data file.
+
+        Returns:
+            Structured record array (one record per state, region, duration
+            and quartile), or None if no store exists
+        """
+        if store_path is None and Atlas14Storm._temporal_store is not None:
+            return Atlas14Storm._temporal_store
+
+        if store_path is None:
+            candidates = [
+                os.environ.get(Atlas14Storm.TEMPORAL_STORE_ENV),
+                Path.home() / ".hms-commander" / "atlas14" / Atlas14Storm.TEMPORAL_STORE_FILE,
+                Path(__file__).parent / "data" / Atlas14Storm.TEMPORAL_STORE_FILE,
+            ]
+            store_path = next((Path(c) for c in candidates if c and Path(c).exists()), None)
+            if store_path is None:
+                return None
+
+        records = np.load(store_path, mmap_mode='r')
+        required = {'state', 'region', 'duration', 'quartile', 'num_steps', 'hours', 'cumulative'}
+        if records.dtype.names is None or not required.issubset(records.dtype.names):
+            raise ValueError(f"Not an Atlas 14 temporal store: {store_path}")
+
+        keys = zip(records['state'].tolist(), records['region'].tolist(), records['duration'].tolist())
+        index: Dict[Tuple[str, int, int], List[int]] = {}
+        for row, key in enumerate(keys):
+            index.setdefault(key, []).append(row)
+
+        Atlas14Storm._temporal_store = records
+        Atlas14Storm._temporal_store_index = {key: np.array(rows) for key, rows in index.items()}
+        logger.debug(f"Mapped Atlas 14 temporal store: {store_path} ({len(records)} tables)")
+        return records
+
+    @staticmethod
+    def _distribution_from_store(
+        state: str,
+        region: int,
+        duration_hours: int
+    ) -> Optional[Dict[str, pd.DataFrame]]:
+        """Quartile DataFrames for one region/duration from the store, if present."""
+        if Atlas14Storm.load_temporal_store() is None:
+            return None
+        rows = Atlas14Storm._temporal_store_index.get((state.lower(), int(region), int(duration_hours)))
+        if rows is None:
+            return None
+
+        result = {}
+        for record in Atlas14Storm._temporal_store[rows]:
+            n = int(record['num_steps'])
+            result[str(record['quartile'])] = pd.DataFrame(
+                np.array(record['cumulative'][:n]),
+                index=pd.Index(np.array(record['hours'][:n]), name='hours'),
+                columns=Atlas14Storm.PROBABILITY_COLUMNS
+            )
         return result
 
     @staticmethod
@@ -266,11 +493,15 @@ class Atlas14Storm:
         state: str,
         region: int,
         duration_hours: int = 24,
-        cache_dir: Optional[Path] = None
+        cache_dir: Optional[Path] = None,
+        offline: bool = False
     ) -> Dict[str, pd.DataFrame]:
         """
         Load Atlas 14 temporal distribution with caching.
 
+        Lookup order: in-memory cache, offline store (load_temporal_store),
+        CSV cache directory, NOAA download.
+
         Args:
             state: Two-letter state code (lowercase, e.g., "tx")
             region: Atlas 14 region number
@@ -278,12 +509,15 @@ class Atlas14Storm:
                 Supported: 6, 12, 24, 96 (NOAA published)
                 Note: 48h is NOT available - use FrequencyStorm instead
             cache_dir: Optional cache directory (default: ~/.hms-commander/atlas14/)
+            offline: Never download; raise if the distribution is not in the
+                store or CSV cache
 
         Returns:
             Dictionary mapping quartile names to temporal distribution DataFrames
 
         Raises:
-            ValueError: If duration is not supported (48h) or not available for region
+            ValueError: If duration is not supported (48h) or not available for
+                region, or (offline=True) not available locally
             requests.HTTPError: If NOAA server returns error
         """
         # Validate duration first
@@ -295,12 +529,24 @@ class Atlas14Storm:
             logger.info(f"Using cached temporal distribution: {cache_key}")
             return Atlas14Storm._temporal_cache[cache_key]
 
+        # Check offline store
+        temporal_distributions = Atlas14Storm._distribution_from_store(state, region, duration_hours)
+        if temporal_distributions is not None:
+            logger.info(f"Using stored temporal distribution: {cache_key}")
+            Atlas14Storm._temporal_cache[cache_key] = temporal_distributions
+            return temporal_distributions
+
         # Default cache directory
         if cache_dir is None:
             cache_dir = Path.home() / ".hms-commander" / "atlas14"
 
         # Download and parse with 404 handling
         config = Atlas14Config(state=state, region=region, duration=duration_hours)
+        if offline and not (Path(cache_dir) / f"{config.state}_{config.region}_{config.duration}h_temporal.csv").exists():
+            raise ValueError(
+                f"Temporal distribution {cache_key} is not in the offline store or CSV cache.\n"
+                f"Build the store on a connected machine with Atlas14Storm.build_temporal_store()."
+            )
         try:
             csv_content = Atlas14Storm.download_temporal_csv(config, cache_dir)
         except requests.HTTPError as e:
@@ -349,6 +595,203 @@ class Atlas14Storm:
         else:
             return "10%"  # For rarer events (1%, 0.5%, 0.2%)
 
+    @staticmethod
+    def _aep_to_probability(aep_percent: Union[float, np.ndarray]) -> np.ndarray:
+        """
+        Continuous counterpart of _aep_to_probability_column.
+
+        AEPs are clipped to AEP_PROBABILITY_RANGE and used directly as the
+        probability value, so at 10, 20, 30, 40 and 50 percent the result
+        equals the snapped column and in between it varies linearly.
+        """
+        low, high = Atlas14Storm.AEP_PROBABILITY_RANGE
+        return np.clip(np.asarray(aep_percent, dtype=float), low, high)
+
+    @staticmethod
+    def _temporal_cube(
+        state: str,
+        region: int,
+        duration_hours: int,
+        cache_dir: Optional[Path] = None
+    ) -> Tuple[np.ndarray, List[str], np.ndarray]:
+        """
+        Cumulative percentages as one contiguous array.
+
+        Returns:
+            Tuple of (cube of shape (quartile, time, probability) in
+            PROBABILITY_COLUMNS order, quartile names in QUARTILE_NAMES order,
+            hours)
+        """
+        cache_key = f"{state}_{region}_{duration_hours}h"
+        if cache_key not in Atlas14Storm._cube_cache:
+            distributions = Atlas14Storm.load_temporal_distribution(
+                state, region, duration_hours, cache_dir
+            )
+            names = [q for q in Atlas14Storm.QUARTILE_NAMES if q in distributions]
+            cube = np.stack([
+                distributions[q][Atlas14Storm.PROBABILITY_COLUMNS].to_numpy(dtype=float)
+                for q in names
+            ])
+            hours = distributions[names[0]].index.to_numpy(dtype=float)
+            Atlas14Storm._cube_cache[cache_key] = (np.ascontiguousarray(cube), names, hours)
+        return Atlas14Storm._cube_cache[cache_key]
+
+    @staticmethod
+    @log_call
+    def interpolate_hyetographs(
+        total_depths_inches: Union[float, List[float], np.ndarray],
+        aep_percents: Union[float, List[float], np.ndarray],
+        duration_hours: int = 24,
+        quartile: str = "All Cases",
+        quartile_positions: Optional[Union[float, List[float], np.ndarray]] = None,
+        state: str = "tx",
+        region: int = 3,
+        cache_dir: Optional[Path] = None,
+        probabilities: Optional[Union[float, List[float], np.ndarray]] = None
+    ) -> Tuple[np.ndarray, pd.DataFrame]:
+        """
+        Hyetographs for continuous AEPs, interpolating between distributions.
+
+        Instead of snapping each storm to the nearest probability column, the
+        cumulative curve is interpolated linearly between the two bracketing
+        columns (and, with ``quartile_positions``, between the two bracketing
+        quartiles), directly on the cached (quartile, time, probability)
+        array. Inputs are paired element-wise (broadcast), one storm per
+        element, so Monte Carlo samples need no per-sample lookups.
+
+        Which probability column a storm uses:
+            - By default it follows generate_hyetograph(): the AEP is used
+              as the probability, clipped to AEP_PROBABILITY_RANGE (10-50).
+              Every AEP rarer than 10% therefore gets the 10% curve, and at
+              AEPs of 10, 20, 30, 40 and 50 percent the result equals
+              generate_hyetograph().
+            - With ``probabilities``, the column is given per storm (10-90,
+              clipped) independently of the AEP. The Atlas 14 probability
+              columns describe how often a temporal pattern occurs among
+              observed storms, not the storm's AEP, so Monte Carlo studies
+              of rare storms should sample them this way to get distinct
+              patterns.
+
+        Args:
+            total_depths_inches: Total depth per storm (inches)
+            aep_percents: AEP per storm (percent); selects the temporal
+                pattern only when probabilities is None
+            duration_hours: Duration in hours (6, 12, 24, 96)
+            quartile: Quartile name used when quartile_positions is None
+            quartile_positions: Optional continuous quartile per storm, from
+                1.0 (First Quartile) to 4.0 (Fourth Quartile)
+            state: Two-letter state code (e.g., "tx")
+            region: Atlas 14 region number
+            cache_dir: Optional cache directory
+            probabilities: Optional temporal-pattern probability per storm
+                (percent, 10-90), overriding the AEP mapping
+
+        Returns:
+            Tuple of:
+                - np.ndarray of shape (storm, time) with incremental depths
+                  (inches)
+                - pd.DataFrame storm index with columns total_depth_inches,
+                  aep_percent, probability (interpolated column value),
+                  quartile or quartile_position, and time_interval_min
+
+        Raises:
+            ValueError: If inputs cannot be broadcast or a quartile is missing
+
+        Example:
+            >>> rng = np.random.default_rng(42)
+            >>> aeps = 10 ** rng.uniform(-1, 1, 10000)
+            >>> values, index = Atlas14Storm.interpolate_hyetographs(
+            ...     total_depths_inches=np.interp(aeps, [0.2, 1, 10], [20, 17.9, 11]),
+            ...     aep_percents=aeps,
+            ...     quartile_positions=rng.uniform(1, 4, 10000),
+            ...     probabilities=rng.uniform(10, 90, 10000)
+            ... )
+        """
+        cube, names, hours = Atlas14Storm._temporal_cube(state, region, duration_hours, cache_dir)
+
+        inputs = [
+            as_vector(total_depths_inches, "total_depths_inches"),
+            as_vector(aep_percents, "aep_percents"),
+        ]
+        if probabilities is not None:
+            inputs.append(as_vector(probabilities, "probabilities"))
+        if quartile_positions is not None:
+            inputs.append(as_vector(quartile_positions, "quartile_positions"))
+        inputs = np.broadcast_arrays(*inputs)
+        depths, aeps = inputs[0], inputs[1]
+
+        if probabilities is None:
+            probs = Atlas14Storm._aep_to_probability(aeps)
+        else:
+            probs = np.clip(inputs[2], Atlas14Storm.PROBABILITY_VALUES[-1], Atlas14Storm.PROBABILITY_VALUES[0])
+
+        if quartile_positions is None:
+            if quartile not in names:
+                raise ValueError(f"Quartile '{quartile}' not found. Available: {names}")
+            cumulative = Atlas14Storm._interpolate_columns(
+                cube, np.full(len(aeps), names.index(quartile)), probs
+            )
+            label = ('quartile', np.full(len(aeps), quartile, dtype=object))
+        else:
+            positions = inputs[-1]
+            quartile_idx = [names.index(q) for q in Atlas14Storm.QUARTILE_NAMES[:4] if q in names]
+            if len(quartile_idx) < 4:
+                raise ValueError(f"Quartile interpolation needs all four quartiles. Available: {names}")
+            x = np.clip(positions, 1.0, 4.0) - 1.0
+            lo = np.minimum(x.astype(int), 2)
+            w = (x - lo)[:, None]
+            quartile_idx = np.asarray(quartile_idx)
+            cumulative = Atlas14Storm._interpolate_columns(cube, quartile_idx[lo], probs)
+            cumulative *= 1.0 - w
+            upper = Atlas14Storm._interpolate_columns(cube, quartile_idx[lo + 1], probs)
+            upper *= w
+            cumulative += upper
+            del upper
+            label = ('quartile_position', positions.astype(float))
+
+        # Incremental depths, in place: cumulative[t] - cumulative[t - 1]
+        values = cumulative
+        values[:, 1:] -= cumulative[:, :-1].copy()
+        values *= depths[:, None] / 100.0
+        index = pd.DataFrame({
+            'total_depth_inches': depths.astype(float),
+            'aep_percent': aeps.astype(float),
+            'probability': probs.astype(float),
+            label[0]: label[1],
+            'time_interval_min': Atlas14Storm._time_interval_min(hours),
+        })
+        index.index.name = 'scenario'
+        return values, index
+
+    @staticmethod
+    def _interpolate_columns(
+        cube: np.ndarray,
+        quartile_idx: np.ndarray,
+        probabilities: np.ndarray
+    ) -> np.ndarray:
+        """
+        Cumulative curves (storm, time) interpolated across probability columns.
+
+        Only the two bracketing columns are gathered from the cube, so memory
+        stays at a few (storm, time) arrays.
+
+        Args:
+            cube: (quartile, time, probability) cumulative percentages
+            quartile_idx: Quartile index into cube per storm
+            probabilities: Probability value per storm (percent, 10-90)
+        """
+        probs = Atlas14Storm.PROBABILITY_VALUES
+        # Fractional position along the (descending) probability columns
+        x = (probs[0] - probabilities) / (probs[0] - probs[1])
+        lo = np.minimum(np.floor(x).astype(int), len(probs) - 2)
+        w = (x - lo)[:, None]
+        curves = cube[quartile_idx, :, lo]  # (storm, time)
+        curves *= 1.0 - w
+        upper = cube[quartile_idx, :, lo + 1]
+        upper *= w
+        curves += upper
+        return curves
+
     @staticmethod
     @log_call
     def generate_hyetograph(
@@ -469,6 +912,96 @@ class Atlas14Storm:
             'cumulative_depth': np.cumsum(incremental)
         })
 
+    @staticmethod
+    @log_call
+    def generate_hyetographs(
+        total_depths_inches: Union[float, List[float], np.ndarray],
+        aep_percents: Union[float, List[float], np.ndarray] = 1.0,
+        durations_hours: Union[int, List[int]] = 24,
+        quartiles: Union[str, List[str]] = "All Cases",
+        state: str = "tx",
+        region: int = 3,
+        cache_dir: Optional[Path] = None
+    ) -> Tuple[np.ndarray, pd.DataFrame]:
+        """
+        Generate many Atlas 14 hyetographs at once as a (scenario, time) array.
+
+        Each temporal distribution is loaded once per duration and each
+        (duration, quartile, probability column) curve is differenced once;
+        all depths are then scaled by broadcasting. Each row equals the
+        'incremental_depth' column of generate_hyetograph() for the same
+        arguments.
+
+        Args:
+            total_depths_inches: Total depth(s) in inches
+            aep_percents: Annual Exceedance Probabilities (percent)
+            durations_hours: Duration(s) in hours (6, 12, 24, 96)
+            quartiles: Quartile name(s) (default: "All Cases")
+            state: Two-letter state code (e.g., "tx")
+            region: Atlas 14 region number
+            cache_dir: Optional cache directory
+
+        Returns:
+            Tuple of:
+                - np.ndarray of shape (scenario, time) with incremental depths
+                  (inches) at the published time step of each distribution;
+                  rows of shorter durations are padded with NaN
+                - pd.DataFrame scenario index with columns total_depth_inches,
+                  duration_hours, quartile, aep_percent, probability_column,
+                  time_interval_min (published step of the distribution,
+                  e.g. for HmsDss.write_design_storms) and num_steps
+
+        Raises:
+            ValueError: If a duration or quartile is not available
+
+        Example:
+            >>> values, index = Atlas14Storm.generate_hyetographs(
+            ...     total_depths_inches=np.linspace(5, 20, 100),
+            ...     aep_percents=[10, 2, 1, 0.2],
+            ...     quartiles=Atlas14Storm.QUARTILE_NAMES
+            ... )
+            >>> values.shape
+            (2000, 49)
+        """
+        depths = as_vector(total_depths_inches, "total_depths_inches")
+        aeps = as_vector(aep_percents, "aep_percents")
+
+        patterns = []
+        for duration in as_list(durations_hours):
+            distributions = Atlas14Storm.load_temporal_distribution(
+                state, region, int(duration), cache_dir
+            )
+            for quartile in as_list(quartiles):
+                if quartile not in distributions:
+                    raise ValueError(
+                        f"Quartile '{quartile}' not found. "
+                        f"Available: {list(distributions.keys())}"
+                    )
+                temporal_df = distributions[quartile]
+                interval = Atlas14Storm._time_interval_min(temporal_df.index.values)
+                increments = {}
+                for aep in aeps:
+                    prob_col = Atlas14Storm._aep_to_probability_column(aep)
+                    if prob_col not in increments:
+                        increments[prob_col] = np.diff(temporal_df[prob_col].values / 100.0, prepend=0.0)
+                    params = {
+                        'duration_hours': int(duration),
+                        'quartile': quartile,
+                        'aep_percent': float(aep),
+                        'probability_column': prob_col,
+                        'time_interval_min': interval,
+                    }
+                    patterns.append((params, increments[prob_col]))
+
+        values, index = broadcast_depths(patterns, depths)
+        logger.info(f"Generated {len(index)} Atlas 14 hyetographs ({len(patterns)} patterns)")
+        return values, index
+
+    @staticmethod
+    def _time_interval_min(hours: np.ndarray) -> int:
+        """Published time step (minutes) of a temporal distribution's hours."""
+        return int(round(float(np.median(np.diff(hours))) * 60))
+
     @staticmethod
     @log_call
     def generate_hyetograph_from_ari(
@@ -0,0 +1,184 @@
+"""
+BasinModel - Mutable In-Memory Basin Model
+
+This module provides the BasinModel class, a line-indexed, editable view of a
+HEC-HMS basin model file (.basin). Unlike the static HmsBasin methods, which
+re-read and re-scan the file on every call, a BasinModel parses the file once
+and then gets/sets element parameters in O(1) before writing back once.
+
+Untouched lines are written back byte-for-byte, so diffs against the original
+file contain only the edited values.
+
+Example:
+    >>> from hms_commander import BasinModel
+    >>> model = BasinModel.from_file("model.basin")
+    >>> model.get_parameter("Sub1", "curve_number")
+    75.0
+    >>> model.set_parameter("Sub1", "curve_number", 78)
+    >>> model.save()
+"""
+
+from typing import Any, Dict, List, Optional
+
+from .LoggingConfig import get_logger
+from ._parsing import HmsBlockFile, HmsFileParser
+from ._constants import BASIN_ELEMENT_TYPES, BASIN_PARAMETER_KEYS
+
+logger = get_logger(__name__)
+
+
+class BasinModel(HmsBlockFile):
+    """
+    Editable basin model with an O(1) (element, parameter) index.
+
+    Element names are resolved across the basin element types (Subbasin,
+    Reach, Junction, Reservoir, ...). Parameters may be given as snake_case
+    names used by HmsBasin (e.g. 'curve_number', 'muskingum_k') or as literal
+    .basin keys (e.g. 'Curve Number').
+
+    Example:
+        >>> model = BasinModel.from_file("model.basin")
+        >>> for name in model.element_names("Subbasin"):
+        ...     cn = model.get_parameter(name, "curve_number")
+        ...     model.set_parameter(name, "curve_number", min(cn * 1.05, 98))
+        >>> model.save()
+    """
+
+    DEFAULT_BLOCK_TYPES = tuple(BASIN_ELEMENT_TYPES)
+
+    @staticmethod
+    def parameter_key(parameter: str) -> str:
+        """
+        Map a snake_case parameter name to its .basin key.
+
+        Unknown names are returned unchanged so literal keys can be used.
+
+        Example:
+            >>> BasinModel.parameter_key("curve_number")
+            'Curve Number'
+        """
+        return BASIN_PARAMETER_KEYS.get(parameter, parameter)
+
+    def element_names(self, element_type: Optional[str] = None) -> List[str]:
+        """
+        Element names in file order.
+
+        Args:
+            element_type: Optional filter ('Subbasin', 'Reach', ...)
+
+        Returns:
+            List of element names
+        """
+        if element_type is not None:
+            return self.names(element_type)
+        return [b.name for b in self.blocks() if b.block_type in self.DEFAULT_BLOCK_TYPES]
+
+    def element_type(self, element_name: str) -> str:
+        """Block type of an element (e.g. 'Subbasin' or 'Reach')."""
+        return self._find(element_name).block_type
+
+    def get_parameter(self, element_name: str, parameter: str, default: Any = None) -> Any:
+        """
+        Get an element parameter, converted to float when numeric.
+
+        Args:
+            element_name: Subbasin, reach or other element name
+            parameter: snake_case name or literal .basin key
+            default: Returned when the element has no such parameter
+
+        Returns:
+            Parameter value (float if numeric, otherwise string)
+
+        Raises:
+            ValueError: If the element does not exist
+        """
+        value = self.get(element_name, self.parameter_key(parameter))
+        if value is None:
+            return default
+        return HmsFileParser.to_numeric(value)
+
+    def get_parameters(self, element_name: str) -> Dict[str, Any]:
+        """
+        All parameters of an element keyed by .basin key, numeric values as float.
+
+        Example:
+            >>> model.get_parameters("Sub1")["Curve Number"]
+            75.0
+        """
+        return {
+            key: HmsFileParser.to_numeric(value)
+            for key, value in self.attributes(element_name).items()
+        }
+
+    def set_parameter(
+        self,
+        element_name: str,
+        parameter: str,
+        value: Any,
+        insert: bool = False
+    ) -> bool:
+        """
+        Set one element parameter in O(1).
+
+        Args:
+            element_name: Subbasin, reach or other element name
+            parameter: snake_case name or literal .basin key
+            value: New value
+            insert: Add the parameter line if it does not exist yet
+
+        Returns:
+            True if the line changed
+
+        Raises:
+            ValueError: If the element (or parameter, with insert=False) is missing
+        """
+        return self.set(element_name, self.parameter_key(parameter), value, insert=insert)
+
+    def set_parameters(self, edits: Dict[str, Dict[str, Any]]) -> int:
+        """
+        Apply {element_name: {parameter: value}} edits.
+
+        Every element and parameter is validated before anything is changed,
+        so a failed call leaves the model untouched.
+
+        Args:
+            edits: Mapping of element names to parameter/value mappings
+
+        Returns:
+            Number of parameter values written
+
+        Raises:
+            ValueError: If any element or parameter line is not found
+        """
+        resolved = {}
+        missing_elements = []
+        missing_params = {}
+        for element_name, params in edits.items():
+            if not self.has_block(element_name):
+                missing_elements.append(element_name)
+                continue
+            keys = {self.parameter_key(p): v for p, v in params.items()}
+            existing = self._find(element_name).params
+            absent = sorted(k for k in keys if k not in existing)
+            if absent:
+                missing_params[element_name] = absent
+            resolved[element_name] = keys
+
+        if missing_elements:
+            raise ValueError(f"Elements not found in basin file: {sorted(missing_elements)}")
+        if missing_params:
+            raise ValueError(f"Parameters not found in basin file: {missing_params}")
+
+        count = 0
+        for element_name, keys in resolved.items():
+            for key, value in keys.items():
+                self.set(element_name, key, value)
+                count += 1
+        return count
+
+    def __repr__(self) -> str:
+        source = self.file_path.name if self.file_path else '<string>'
+        return (
+            f"BasinModel('{source}', subbasins={len(self.names('Subbasin'))}, "
+            f"reaches={len(self.names('Reach'))}, modified={self.is_modified})"
+        )
@@ -45,6 +45,8 @@ from pathlib import Path
 from typing import Optional, Union, List, Tuple
 import logging
 
+from ._storms import PATTERN_CACHE, as_list, as_vector, broadcast_depths, bundled_pattern
+
 logger = logging.getLogger(__name__)
 
 
@@ -73,33 +75,26 @@ class FrequencyStorm:
     # Standard TP-40 durations (minutes)
     STANDARD_DURATIONS = [5, 15, 30, 60, 120, 180, 360, 1440]
 
-    # Pattern file location (relative to this module)
-    _PATTERN_FILE = "data/tp40_dimensionless_pattern.npy"
+    # Durations of the "Depth:" lines of an HMS Frequency Based Hypothetical
+    # met model, in order; a storm uses the first N up to its total duration
+    HMS_DEPTH_DURATIONS = [5, 15, 60, 120, 180, 360, 720, 1440, 2880, 5760, 10080, 14400]
+
+    # Hydro-35 weights for the durations HMS derives between its Depth lines:
+    # depth(target) = w_short * depth(short) + w_long * depth(long)
+    HYDRO35_DERIVED_DURATIONS = {10: (5, 15, 0.41, 0.59), 30: (15, 60, 0.51, 0.49)}
 
-    # Cached pattern
-    _dimensionless_pattern: Optional[np.ndarray] = None
+    # TP-40 partial-duration / annual-series depth ratios by exceedance (%)
+    ANNUAL_TO_PARTIAL_FACTORS = {50.0: 1.13, 20.0: 1.04, 10.0: 1.01}
 
     @staticmethod
     def _load_pattern() -> np.ndarray:
-        """Load the dimensionless temporal pattern from bundled data."""
-        if FrequencyStorm._dimensionless_pattern is not None:
-            return FrequencyStorm._dimensionless_pattern
-
-        pattern_path = Path(__file__).parent / FrequencyStorm._PATTERN_FILE
-
-        if not pattern_path.exists():
-            raise FileNotFoundError(
-                f"TP-40 pattern file not found: {pattern_path}\n"
-                "This file should be bundled with hms-commander.\n"
-                "Try reinstalling: pip install --upgrade hms-commander"
-            )
-
-        FrequencyStorm._dimensionless_pattern = np.load(pattern_path)
-        logger.debug(
-            f"Loaded TP-40 pattern: {len(FrequencyStorm._dimensionless_pattern)} values"
-        )
+        """
+        Load the dimensionless temporal pattern from bundled data.
 
-        return FrequencyStorm._dimensionless_pattern
+        Returns a read-only view of the memory-mapped pattern store shared
+        with ScsTypeStorm (data/storm_patterns.npy).
+        """
+        return bundled_pattern("TP40")
 
     @staticmethod
     def generate_hyetograph(
@@ -162,12 +157,100 @@ class FrequencyStorm:
         """
         # No warning - variable durations are supported
 
-        # Load dimensionless pattern (288 incremental values for 24hr/5min)
-        pattern = FrequencyStorm._load_pattern()
+        # Scale to total depth
+        hyetograph = FrequencyStorm._unit_hyetograph(
+            total_duration_min, time_interval_min, peak_position_pct
+        ) * total_depth_inches
+
+        # Calculate time axis
+        num_intervals = len(hyetograph)
+        interval_hours = time_interval_min / 60.0
+        hours = np.arange(1, num_intervals + 1) * interval_hours
+
+        # Return DataFrame with standard columns
+        return pd.DataFrame({
+            'hour': hours,
+            'incremental_depth': hyetograph,
+            'cumulative_depth': np.cumsum(hyetograph)
+        })
+
+    @staticmethod
+    def generate_hyetographs(
+        total_depths_inches: Union[float, List[float], np.ndarray],
+        total_durations_min: Union[int, List[int]] = 1440,
+        time_intervals_min: Union[int, List[int]] = 5,
+        peak_positions_pct: Union[float, List[float]] = 67.0
+    ) -> Tuple[np.ndarray, pd.DataFrame]:
+        """
+        Generate many hyetographs at once as a (scenario, time) array.
+
+        Every combination of duration, interval and peak position is
+        resolved to a dimensionless pattern once; all depths are then
+        scaled by broadcasting. Each row equals the 'incremental_depth'
+        column of generate_hyetograph() for the same arguments.
+
+        Args:
+            total_depths_inches: Total depth(s) in inches
+            total_durations_min: Storm duration(s) in minutes
+            time_intervals_min: Time step(s) in minutes
+            peak_positions_pct: Peak position(s) in percent of duration
+
+        Returns:
+            Tuple of:
+                - np.ndarray of shape (scenario, time) with incremental depths
+                  (inches), including the leading t=0 value; rows shorter than
+                  the longest storm are padded with NaN
+                - pd.DataFrame scenario index with columns total_depth_inches,
+                  total_duration_min, time_interval_min, peak_position_pct
+                  and num_steps
+
+        Example:
+            >>> values, index = FrequencyStorm.generate_hyetographs(
+            ...     [9.1, 11.0, 13.2], total_durations_min=[360, 1440],
+            ...     peak_positions_pct=[33, 50, 67]
+            ... )
+            >>> values.shape
+            (18, 289)
+        """
+        depths = as_vector(total_depths_inches, "total_depths_inches")
+        patterns = []
+        for duration in as_list(total_durations_min):
+            for interval in as_list(time_intervals_min):
+                for peak in as_list(peak_positions_pct):
+                    params = {
+                        'total_duration_min': int(duration),
+                        'time_interval_min': int(interval),
+                        'peak_position_pct': float(peak),
+                    }
+                    patterns.append((params, FrequencyStorm._unit_hyetograph(duration, interval, peak)))
+        return broadcast_depths(patterns, depths)
+
+    @staticmethod
+    def _unit_hyetograph(
+        total_duration_min: int,
+        time_interval_min: int,
+        peak_position_pct: float
+    ) -> np.ndarray:
+        """
+        Incremental hyetograph for a unit total depth, including t=0.
 
+        Memoized in the shared pattern cache; the returned array is read-only.
+        """
         # Calculate number of intervals (not including t=0)
         # HMS formula: duration/interval + 1, but we handle t=0 separately
-        num_intervals = total_duration_min // time_interval_min
+        num_intervals = int(total_duration_min // time_interval_min)
+        peak_position_pct = float(peak_position_pct)
+
+        return PATTERN_CACHE.get(
+            ('TP40', num_intervals, peak_position_pct),
+            lambda: FrequencyStorm._build_unit_hyetograph(num_intervals, peak_position_pct)
+        )
+
+    @staticmethod
+    def _build_unit_hyetograph(num_intervals: int, peak_position_pct: float) -> np.ndarray:
+        """Resample and peak-shift the TP-40 pattern (uncached)."""
+        # Load dimensionless pattern (288 incremental values for 24hr/5min)
+        pattern = FrequencyStorm._load_pattern()
 
         # Resample pattern if needed
         if len(pattern) != num_intervals:
@@ -181,24 +264,29 @@ class FrequencyStorm:
                 pattern, 67.0, peak_position_pct
             )
 
-        # Scale to total depth
-        incremental = pattern * total_depth_inches
-
         # Prepend 0.0 at t=0 to match HMS output format
         # HMS: dArray[0] = 0.0 (aY.java:143)
-        hyetograph = np.insert(incremental, 0, 0.0)
+        return np.insert(pattern, 0, 0.0)
 
-        # Calculate time axis
-        num_intervals = len(hyetograph)
-        interval_hours = time_interval_min / 60.0
-        hours = np.arange(1, num_intervals + 1) * interval_hours
+    @staticmethod
+    def get_pattern_cache_info() -> dict:
+        """
+        Statistics of the unit-pattern cache shared with ScsTypeStorm.
 
-        # Return DataFrame with standard columns
-        return pd.DataFrame({
-            'hour': hours,
-            'incremental_depth': hyetograph,
-            'cumulative_depth': np.cumsum(hyetograph)
-        })
+        Returns:
+            Dictionary with hits, misses, hit_rate, size and maxsize
+
+        Example:
+            >>> values, index = FrequencyStorm.generate_hyetographs(np.linspace(5, 15, 100))
+            >>> FrequencyStorm.get_pattern_cache_info()['size']
+            1
+        """
+        return PATTERN_CACHE.info()
+
+    @staticmethod
+    def clear_pattern_cache() -> None:
+        """Clear the unit-pattern cache shared with ScsTypeStorm."""
+        PATTERN_CACHE.clear()
 
     @staticmethod
     def _resample_pattern(
@@ -306,6 +394,233 @@ class FrequencyStorm:
             peak_position_pct=peak_position_pct
         )
 
+    @staticmethod
+    def generate_from_depths(
+        depths: Union[List[float], np.ndarray],
+        time_interval_min: int = 5,
+        peak_position_pct: float = 67.0,
+        durations_min: Optional[List[int]] = None
+    ) -> np.ndarray:
+        """
+        Nest depth-duration values into hyetographs (HMS Frequency Storm).
+
+        Reproduces the depth-duration nesting of the HEC-HMS "Frequency
+        Based Hypothetical" method for many depth vectors at once:
+
+        1. Add the 10- and 30-minute depths HMS derives from the 5/15- and
+           15/60-minute depths with the Hydro-35 weights
+           (HYDRO35_DERIVED_DURATIONS)
+        2. Interpolate cumulative depth at every multiple of the time interval
+           (log-log between durations, linear where a depth is zero)
+        3. Take successive differences as blocks
+        4. Place the first block at the peak position and the following
+           blocks in duration order alternately before and after it, so
+           every duration's depth falls in one contiguous window
+
+        The placement order and interpolation weights depend only on the
+        durations, interval and peak position, so they are computed once and
+        applied to all rows. For the HCFCD Model D 1% depths this matches the
+        bundled TP-40 pattern (HMS output) to within 1e-3 inches per step.
+
+        Args:
+            depths: Cumulative depths (inches), shape (n_durations,) or
+                (scenario, n_durations), ordered like durations_min
+            time_interval_min: Output time step in minutes (default 5)
+            peak_position_pct: Percent of duration before peak (default 67)
+            durations_min: Durations of the depth columns (default: the first
+                n_durations of HMS_DEPTH_DURATIONS); the last one is the
+                storm duration
+
+        Returns:
+            numpy array of incremental depths including the leading t=0 value,
+            shape (n_steps + 1,) or (scenario, n_steps + 1)
+
+        Raises:
+            ValueError: If depths and durations do not match or the interval
+                does not divide the storm duration
+
+        Example:
+            >>> depths = [1.20, 2.10, 4.30, 5.70, 6.70, 8.90, 10.80, 13.20]
+            >>> hyeto = FrequencyStorm.generate_from_depths(depths)
+            >>> len(hyeto), round(hyeto.sum(), 2)
+            (289, 13.2)
+        """
+        depths = np.asarray(depths, dtype=float)
+        single = depths.ndim == 1
+        depths = np.atleast_2d(depths)
+
+        if durations_min is None:
+            if depths.shape[1] > len(FrequencyStorm.HMS_DEPTH_DURATIONS):
+                raise ValueError(
+                    f"At most {len(FrequencyStorm.HMS_DEPTH_DURATIONS)} depths are supported"
+                )
+            durations_min = FrequencyStorm.HMS_DEPTH_DURATIONS[:depths.shape[1]]
+        if len(durations_min) != depths.shape[1]:
+            raise ValueError(
+                f"Number of depths ({depths.shape[1]}) must match "
+                f"number of durations ({len(durations_min)})"
+            )
+
+        total_duration = int(durations_min[-1])
+        if time_interval_min <= 0 or total_duration % time_interval_min != 0:
+            raise ValueError(
+                f"Time interval {time_interval_min} min must divide the "
+                f"storm duration ({total_duration} min)"
+            )
+        n_steps = total_duration // time_interval_min
+
+        durations, depths = FrequencyStorm._add_derived_durations(durations_min, depths)
+
+        # Interpolation weights for the cumulative depth at k * dt
+        times = np.arange(1, n_steps + 1) * float(time_interval_min)
+        hi = np.clip(np.searchsorted(durations, times), 1, len(durations) - 1)
+        lo = hi - 1
+        log_w = (np.log(times) - np.log(durations[lo])) / (np.log(durations[hi]) - np.log(durations[lo]))
+        lin_w = (times - durations[lo]) / (durations[hi] - durations[lo])
+
+        d_lo, d_hi = depths[:, lo], depths[:, hi]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cumulative = d_lo * (d_hi / d_lo) ** log_w
+        # Log-log is undefined when a bounding depth is zero
+        cumulative = np.where((d_lo > 0) & (d_hi > 0), cumulative, d_lo + lin_w * (d_hi - d_lo))
+        cumulative[:, -1] = depths[:, -1]
+        blocks = np.diff(cumulative, axis=1, prepend=0.0)
+
+        hyetograph = np.zeros((len(depths), n_steps + 1))
+        hyetograph[:, 1 + FrequencyStorm._nesting_order(n_steps, peak_position_pct)] = blocks
+
+        return hyetograph[0] if single else hyetograph
+
+    @staticmethod
+    def _add_derived_durations(
+        durations_min: List[int],
+        depths: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Insert the Hydro-35 10/30-minute depth columns HMS derives, if missing."""
+        columns = dict(zip((int(d) for d in durations_min), depths.T))
+        for target, (short, long, w_short, w_long) in FrequencyStorm.HYDRO35_DERIVED_DURATIONS.items():
+            if target not in columns and short in columns and long in columns:
+                columns[target] = w_short * columns[short] + w_long * columns[long]
+        durations = np.array(sorted(columns), dtype=float)
+        return durations, np.column_stack([columns[int(d)] for d in durations])
+
+    @staticmethod
+    def _nesting_order(n_steps: int, peak_position_pct: float) -> np.ndarray:
+        """Time-step index of the k-th block: peak, then alternately before and after."""
+        peak = min(int(peak_position_pct / 100 * n_steps), n_steps - 1)
+        offsets = np.arange(1, n_steps)
+        before = peak - offsets[:peak]
+        after = peak + offsets[:n_steps - 1 - peak]
+        # Interleave before/after while both sides have room, then the rest
+        paired = min(len(before), len(after))
+        order = np.empty(n_steps, dtype=int)
+        order[0] = peak
+        order[1:1 + 2 * paired:2] = before[:paired]
+        order[2:2 + 2 * paired:2] = after[:paired]
+        order[1 + 2 * paired:] = np.concatenate([before[paired:], after[paired:]])
+        return order
+
+    @staticmethod
+    def compute_met_precipitation(
+        met_path: Union[str, Path],
+        depths: Optional[Union[List[float], np.ndarray]] = None,
+        hms_object=None
+    ) -> Tuple[np.ndarray, List[str], np.ndarray]:
+        """
+        Precipitation for every subbasin of a frequency-storm met model.
+
+        Reads the Frequency Based Hypothetical parameters with
+        HmsMet.get_frequency_storm_params() and nests the depths with
+        generate_from_depths(), giving the incremental precipitation HMS
+        would apply to each subbasin without running HMS. Pass a table of
+        depth vectors to pre-check many scenarios of one met model at once.
+
+        The storm length is the met file's Total Duration; Depth lines for
+        longer durations are ignored.
+
+        Annual/partial-duration conversion uses ANNUAL_TO_PARTIAL_FACTORS.
+        Depth-area reduction for the storm size is not applied (point depths).
+
+        Args:
+            met_path: Path to the .met file
+            depths: Optional depths overriding the met file's Depth lines,
+                shape (n_durations,) or (scenario, n_durations)
+            hms_object: Optional HmsPrj instance
+
+        Returns:
+            Tuple of:
+                - np.ndarray of incremental depths (inches) with shape
+                  (subbasin, time), or (scenario, subbasin, time) for a depth
+                  table; subbasins share one read-only storm array
+                - List of subbasin names
+                - np.ndarray of times in hours (starting at 0)
+
+        Raises:
+            ValueError: If the met file has no frequency storm parameters, or
+                its Total Duration is not a Depth line duration
+
+        Example:
+            >>> values, subbasins, hours = FrequencyStorm.compute_met_precipitation(
+            ...     "1PCT_24HR.met", depths=atlas14_table.to_numpy()
+            ... )
+            >>> values.shape
+            (300, 12, 289)
+        """
+        from .HmsMet import HmsMet
+
+        met_path = Path(met_path)
+        params = HmsMet.get_frequency_storm_params(met_path, hms_object)
+        if params['method'] is None or params['time_interval'] is None:
+            raise ValueError(f"No frequency storm parameters found in {met_path}")
+
+        if depths is None:
+            depths = params['depths']
+        depths = np.asarray(depths, dtype=float)
+        if depths.shape[-1] == 0:
+            raise ValueError(f"No depth values found in {met_path}")
+
+        # The storm uses the Depth lines up to its Total Duration
+        total_duration = params['total_duration']
+        if total_duration is None:
+            total_duration = FrequencyStorm.HMS_DEPTH_DURATIONS[depths.shape[-1] - 1]
+        if total_duration not in FrequencyStorm.HMS_DEPTH_DURATIONS:
+            raise ValueError(
+                f"Total Duration {total_duration} min in {met_path} is not one of "
+                f"{FrequencyStorm.HMS_DEPTH_DURATIONS}"
+            )
+        n_durations = FrequencyStorm.HMS_DEPTH_DURATIONS.index(total_duration) + 1
+        if depths.shape[-1] < n_durations:
+            raise ValueError(
+                f"{met_path} needs {n_durations} depths for a {total_duration} min "
+                f"storm, found {depths.shape[-1]}"
+            )
+        depths = depths[..., :n_durations]
+
+        factor = FrequencyStorm.ANNUAL_TO_PARTIAL_FACTORS.get(
+            float(params['exceedance_frequency'] or 0.0), 1.0
+        )
+        if params['convert_from_annual']:
+            depths = depths * factor
+        elif params['convert_to_annual']:
+            depths = depths / factor
+
+        storms = FrequencyStorm.generate_from_depths(
+            depths,
+            time_interval_min=params['time_interval'],
+            peak_position_pct=params['peak_position'] if params['peak_position'] is not None else 50.0
+        )
+
+        subbasins = list(HmsMet._parse_subbasin_blocks(HmsMet._read_met_file(met_path)))
+        shape = storms.shape[:-1] + (len(subbasins), storms.shape[-1])
+        values = np.broadcast_to(storms[..., None, :], shape)
+        hours = np.arange(storms.shape[-1]) * params['time_interval'] / 60.0
+
+        logger.info(
+            f"Computed {met_path.name}: {len(subbasins)} subbasins, "
+            f"{storms.shape[-1]} steps" + (f", {len(storms)} scenarios" if storms.ndim == 2 else "")
+        )
+        return values, subbasins, hours
+
     @staticmethod
     def get_pattern_info() -> dict:
         """
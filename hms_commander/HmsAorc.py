@@ -15,6 +15,9 @@ Classes:
 Key Functions:
     download: Download AORC precipitation data for specified bounds and time range
     get_storm_catalog: Analyze AORC data and generate catalog of storm events
+    storm_catalog_from_series: Storm catalog from an already-loaded hourly series
+    build_storm_catalog: Multi-year, multi-basin storm catalog in one pass
+    reduce_grid_hourly: Hourly mean, max cell and max N-hour accumulation in one pass
     check_availability: Check if AORC data is available for region and time period
     get_info: Get metadata about the AORC dataset
     convert_to_dss_grid: Convert AORC NetCDF to DSS grid format for HMS
@@ -27,6 +30,7 @@ Dependencies:
         - netCDF4: NetCDF I/O
         - pandas: Time series handling
         - numpy: Numerical operations
+        - scipy: Sparse basin weights (build_storm_catalog)
 
     Optional:
         - ras-commander: For DSS grid conversion (RasDss)
@@ -34,7 +38,7 @@ Dependencies:
     Install with:
         pip install hms-commander[aorc]
         # OR
-        pip install xarray zarr s3fs netCDF4
+        pip install xarray zarr s3fs netCDF4 scipy
 
 Example:
     >>> from hms_commander import HmsAorc
@@ -60,7 +64,7 @@ Notes:
 """
 
 from pathlib import Path
-from typing import Tuple, Optional, Union, List
+from typing import Callable, Dict, Tuple, Optional, Union, List
 from datetime import datetime
 import logging
 
@@ -70,8 +74,8 @@ from .Decorators import log_call
 logger = get_logger(__name__)
 
 
-def _check_aorc_dependencies():
-    """Check that AORC dependencies are installed."""
+def _check_aorc_dependencies(remote: bool = True):
+    """Check that AORC dependencies are installed (s3fs only when reading S3)."""
     missing = []
     try:
         import xarray
@@ -81,10 +85,11 @@ def _check_aorc_dependencies():
         import zarr
     except ImportError:
         missing.append("zarr")
-    try:
-        import s3fs
-    except ImportError:
-        missing.append("s3fs")
+    if remote:
+        try:
+            import s3fs
+        except ImportError:
+            missing.append("s3fs")
     try:
         import netCDF4
     except ImportError:
@@ -128,6 +133,16 @@ class HmsAorc:
     # CONUS bounding box (approximate)
     CONUS_BOUNDS = (-125.0, 25.0, -67.0, 53.0)  # west, south, east, north
 
+    # Storm catalog columns, in output order
+    CATALOG_COLUMNS = [
+        'storm_id', 'start_time', 'end_time', 'sim_start', 'sim_end',
+        'total_depth_in', 'peak_intensity_in_hr', 'duration_hours',
+        'wet_hours', 'rank'
+    ]
+
+    # Hourly depth (inches) above which an hour counts as wet (trace)
+    WET_THRESHOLD_IN = 0.01
+
     @staticmethod
     @log_call
     def download(
@@ -135,13 +150,23 @@ class HmsAorc:
         start_time: Union[str, datetime],
         end_time: Union[str, datetime],
         output_path: Union[str, Path],
-        variable: str = "APCP_surface"
+        variable: str = "APCP_surface",
+        source: Optional[Union[str, Path]] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
+        max_workers: int = 8
     ) -> Path:
         """
         Download AORC precipitation data for specified bounds and time range.
 
-        Downloads data from AWS S3 Zarr store, subsets spatially and temporally,
-        and exports to NetCDF format. Data remains in WGS84 (lat/lon) for HMS.
+        Reads the yearly Zarr stores, subsets spatially and temporally, and
+        writes NetCDF (or Zarr when ``output_path`` ends in ``.zarr``). Data
+        remains in WGS84 (lat/lon) for HMS.
+
+        Store chunks overlapping the request are fetched concurrently across
+        all years and saved in an on-disk chunk cache keyed by store and chunk
+        id, so later requests for overlapping bounds or periods reuse them.
+        The output is written one year at a time; only a single year's subset
+        is held in memory.
 
         Parameters
         ----------
@@ -152,14 +177,24 @@ class HmsAorc:
         end_time : str or datetime
             End of time window. Same format as start_time.
         output_path : str or Path
-            Output NetCDF file path. Will be created if it doesn't exist.
+            Output file path. A ``.zarr`` suffix writes a Zarr store, anything
+            else writes NetCDF. Will be created if it doesn't exist.
         variable : str, default "APCP_surface"
             AORC variable name. Default is hourly precipitation (kg/m²).
+        source : str or Path, optional
+            Root holding the ``{year}.zarr`` stores. Defaults to the public
+            S3 bucket; a local directory (e.g. a mirror or a test fixture)
+            is read without s3fs.
+        cache_dir : str or Path, optional
+            Directory for the chunk cache. When None, chunks are staged in a
+            temporary directory that is removed afterwards.
+        max_workers : int, default 8
+            Number of concurrent chunk fetches.
 
         Returns
         -------
         Path
-            Path to the output NetCDF file.
+            Path to the output file.
 
         Raises
         ------
@@ -178,7 +213,8 @@ class HmsAorc:
         ...     bounds=bounds,
         ...     start_time="2020-05-01",
         ...     end_time="2020-05-15",
-        ...     output_path="precip/aorc_may2020.nc"
+        ...     output_path="precip/aorc_may2020.nc",
+        ...     cache_dir="aorc_cache"
         ... )
 
         Notes
@@ -189,12 +225,12 @@ class HmsAorc:
         - AORC resolution: ~800m, hourly timesteps
         - Units: kg/m² (equivalent to mm of precipitation)
         """
-        _check_aorc_dependencies()
+        source = f"s3://{HmsAorc.BUCKET}" if source is None else str(source)
+        _check_aorc_dependencies(remote=source.startswith("s3://"))
 
-        import xarray as xr
-        import s3fs
+        import tempfile
+        from concurrent.futures import ThreadPoolExecutor
         import pandas as pd
-        import numpy as np
 
         output_path = Path(output_path)
 
@@ -225,107 +261,231 @@ class HmsAorc:
         logger.info(f"  Bounds: W={west:.4f}, S={south:.4f}, E={east:.4f}, N={north:.4f}")
         logger.info(f"  Time range: {start_dt} to {end_dt}")
         logger.info(f"  Variable: {variable}")
+        logger.info(f"  Source: {source}")
+
+        temp_cache = None
+        if cache_dir is None:
+            temp_cache = tempfile.TemporaryDirectory(prefix="aorc_chunks_")
+            cache_dir = temp_cache.name
+        cache_dir = Path(cache_dir)
+
+        # Plan every year's subset first so chunk fetches for all years can
+        # run concurrently; years are then assembled and written in order.
+        plans = []
+        for year in range(start_dt.year, end_dt.year + 1):
+            year_start = max(start_dt, pd.Timestamp(f"{year}-01-01"))
+            year_end = min(end_dt, pd.Timestamp(f"{year}-12-31 23:59:59"))
+            logger.info(f"  Opening year {year}")
+            try:
+                plan = HmsAorc._plan_year_subset(
+                    source, year, variable, bounds, year_start, year_end, cache_dir
+                )
+            except Exception as e:
+                logger.error(f"Error opening year {year}: {e}")
+                raise
+            if plan is None:
+                logger.warning(f"    No data found for year {year}")
+            else:
+                plans.append(plan)
 
-        # Connect to S3 (anonymous access)
-        logger.info("Connecting to AWS S3...")
-        s3 = s3fs.S3FileSystem(anon=True)
-
-        # Build Zarr store paths for each year in range
-        years = range(start_dt.year, end_dt.year + 1)
-        datasets = []
+        if not plans:
+            if temp_cache is not None:
+                temp_cache.cleanup()
+            raise ValueError("No data found for the specified bounds and time range")
 
-        for year in years:
-            store_path = f"s3://{HmsAorc.BUCKET}/{year}.zarr"
-            logger.info(f"  Loading year {year} from {store_path}")
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        history = f'Downloaded by hms-commander on {datetime.now().isoformat()}'
 
-            try:
-                store = s3fs.S3Map(root=store_path, s3=s3)
-                ds = xr.open_zarr(store)
-
-                # AORC uses latitude/longitude naming
-                lat_dim = 'latitude' if 'latitude' in ds.dims else 'lat'
-                lon_dim = 'longitude' if 'longitude' in ds.dims else 'lon'
-
-                # Get the actual dimension names from the variable
-                if variable in ds:
-                    var_dims = ds[variable].dims
-                    lat_candidates = [d for d in var_dims if 'lat' in d.lower()]
-                    lon_candidates = [d for d in var_dims if 'lon' in d.lower()]
-                    if lat_candidates:
-                        lat_dim = lat_candidates[0]
-                    if lon_candidates:
-                        lon_dim = lon_candidates[0]
-
-                # Subset the variable
-                ds_var = ds[variable]
-
-                # Check coordinate ordering for latitude
-                lat_coords = ds_var[lat_dim].values
-                if lat_coords[0] > lat_coords[-1]:
-                    # Latitude is descending (north to south)
-                    ds_subset = ds_var.sel(
-                        **{lat_dim: slice(north, south)},
-                        **{lon_dim: slice(west, east)}
-                    )
-                else:
-                    # Latitude is ascending (south to north)
-                    ds_subset = ds_var.sel(
-                        **{lat_dim: slice(south, north)},
-                        **{lon_dim: slice(west, east)}
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+                futures = [
+                    [pool.submit(HmsAorc._fetch_chunk, plan, chunk_id) for chunk_id in plan['chunk_ids']]
+                    for plan in plans
+                ]
+                for index, (plan, year_futures) in enumerate(zip(plans, futures)):
+                    hits = sum(f.result() for f in year_futures)
+                    logger.info(
+                        f"    Year {plan['year']}: {len(year_futures)} chunks "
+                        f"({hits} from cache)"
                     )
+                    subset = HmsAorc._assemble_year_subset(plan)
+                    subset.attrs['title'] = 'AORC Precipitation Data'
+                    subset.attrs['source'] = f'NOAA NWS AORC v1.1 from {source}'
+                    subset.attrs['history'] = history
+                    subset.attrs['units'] = 'kg/m^2'  # AORC precipitation units (equivalent to mm)
+                    subset.attrs['long_name'] = 'Hourly Total Precipitation'
+                    subset.attrs['crs'] = 'EPSG:4326'  # WGS84 lat/lon (no reprojection for HMS)
+                    logger.info(f"    Writing {dict(subset.sizes)} to {output_path}")
+                    HmsAorc._write_year_subset(subset, output_path, append=index > 0)
+                    del subset
+        finally:
+            if temp_cache is not None:
+                temp_cache.cleanup()
+
+        if output_path.is_dir():
+            size_bytes = sum(f.stat().st_size for f in output_path.rglob('*') if f.is_file())
+        else:
+            size_bytes = output_path.stat().st_size
+        logger.info(f"Download complete: {output_path} ({size_bytes / (1024 * 1024):.1f} MB)")
 
-                # Subset temporally - use date-only strings for proper inclusive slicing
-                year_start = max(start_dt, pd.Timestamp(f"{year}-01-01"))
-                year_end = min(end_dt, pd.Timestamp(f"{year}-12-31 23:59:59"))
-                # Use date format YYYY-MM-DD for proper inclusive time slicing
-                start_str = year_start.strftime('%Y-%m-%d')
-                end_str = year_end.strftime('%Y-%m-%d')
-                ds_subset = ds_subset.sel(time=slice(start_str, end_str))
-
-                if ds_subset.size > 0:
-                    # Load data from S3 now (force lazy evaluation)
-                    ds_subset = ds_subset.load()
-                    datasets.append(ds_subset)
-                    logger.info(f"    Loaded {ds_subset.sizes}")
-                else:
-                    logger.warning(f"    No data found for year {year}")
+        return output_path
 
-            except Exception as e:
-                logger.error(f"Error loading year {year}: {e}")
-                raise
+    @staticmethod
+    def _open_year_store(source: str, year: int):
+        """Open one yearly AORC Zarr store lazily (no dask required)."""
+        import xarray as xr
 
-        if not datasets:
-            raise ValueError("No data found for the specified bounds and time range")
+        if source.startswith("s3://"):
+            import s3fs
+            s3 = s3fs.S3FileSystem(anon=True)
+            store = s3fs.S3Map(root=f"{source.rstrip('/')}/{year}.zarr", s3=s3)
+            return xr.open_zarr(store, chunks=None)
+        return xr.open_zarr(Path(source) / f"{year}.zarr", chunks=None)
+
+    @staticmethod
+    def _plan_year_subset(source, year, variable, bounds, year_start, year_end, cache_dir):
+        """
+        Resolve one year's subset to index ranges and overlapping store chunks.
+
+        Returns None when the subset is empty.
+        """
+        import hashlib
+        import itertools
+
+        west, south, east, north = bounds
+        ds = HmsAorc._open_year_store(source, year)
+        da = ds[variable]
 
-        # Combine all years
-        logger.info("Combining datasets...")
-        if len(datasets) == 1:
-            combined = datasets[0]
+        # AORC uses latitude/longitude naming
+        lat_dim = 'latitude' if 'latitude' in ds.dims else 'lat'
+        lon_dim = 'longitude' if 'longitude' in ds.dims else 'lon'
+        lat_candidates = [d for d in da.dims if 'lat' in d.lower()]
+        lon_candidates = [d for d in da.dims if 'lon' in d.lower()]
+        if lat_candidates:
+            lat_dim = lat_candidates[0]
+        if lon_candidates:
+            lon_dim = lon_candidates[0]
+
+        lat_index = ds.indexes[lat_dim]
+        if lat_index[0] > lat_index[-1]:
+            # Latitude is descending (north to south)
+            lat_slice = lat_index.slice_indexer(north, south)
         else:
-            combined = xr.concat(datasets, dim='time')
+            lat_slice = lat_index.slice_indexer(south, north)
+        # Use date-only strings for inclusive time slicing
+        time_slice = ds.indexes['time'].slice_indexer(
+            year_start.strftime('%Y-%m-%d'), year_end.strftime('%Y-%m-%d')
+        )
+        ranges = {
+            'time': time_slice,
+            lat_dim: lat_slice,
+            lon_dim: ds.indexes[lon_dim].slice_indexer(west, east),
+        }
+        ranges = {dim: sl.indices(da.sizes[dim])[:2] for dim, sl in ranges.items()}
+        if any(stop <= start for start, stop in ranges.values()):
+            return None
+
+        chunk_shape = da.encoding.get('chunks') or da.shape
+        starts = [ranges.get(dim, (0, size))[0] for dim, size in zip(da.dims, da.shape)]
+        stops = [ranges.get(dim, (0, size))[1] for dim, size in zip(da.dims, da.shape)]
+        axes = [range(a // c, (b - 1) // c + 1) for a, b, c in zip(starts, stops, chunk_shape)]
+        chunk_ids = list(itertools.product(*axes))
+
+        store_url = f"{str(source).rstrip('/')}/{year}.zarr"
+        store_key = f"{year}.zarr-{hashlib.sha1(store_url.encode()).hexdigest()[:10]}"
+        chunk_key = 'x'.join(str(c) for c in chunk_shape)
+        return {
+            'year': year,
+            'data': da,
+            'dims': da.dims,
+            'chunk_shape': tuple(chunk_shape),
+            'starts': starts,
+            'stops': stops,
+            'chunk_ids': chunk_ids,
+            'cache_path': cache_dir / store_key / f"{variable}.{chunk_key}",
+        }
 
-        # Sort by time
-        combined = combined.sortby('time')
+    @staticmethod
+    def _fetch_chunk(plan: dict, chunk_id: tuple) -> bool:
+        """
+        Ensure one store chunk is in the on-disk cache.
 
-        # Add metadata for HMS
-        combined.attrs['title'] = 'AORC Precipitation Data'
-        combined.attrs['source'] = f'NOAA NWS AORC v1.1 from s3://{HmsAorc.BUCKET}'
-        combined.attrs['history'] = f'Downloaded by hms-commander on {datetime.now().isoformat()}'
-        combined.attrs['units'] = 'kg/m^2'  # AORC precipitation units (equivalent to mm)
-        combined.attrs['long_name'] = 'Hourly Total Precipitation'
-        combined.attrs['crs'] = 'EPSG:4326'  # WGS84 lat/lon (no reprojection for HMS)
+        Returns True on a cache hit, False if the chunk was fetched.
+        """
+        import os
+        import numpy as np
 
-        # Create output directory if needed
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        chunk_file = plan['cache_path'] / ('.'.join(str(i) for i in chunk_id) + '.npy')
+        if chunk_file.exists():
+            return True
 
-        # Write to NetCDF
-        logger.info(f"Writing to NetCDF: {output_path}")
-        combined.to_netcdf(output_path)
+        selector = {
+            dim: slice(i * c, min((i + 1) * c, size))
+            for dim, i, c, size in zip(plan['dims'], chunk_id, plan['chunk_shape'], plan['data'].shape)
+        }
+        values = plan['data'].isel(selector).values
 
-        file_size_mb = output_path.stat().st_size / (1024 * 1024)
-        logger.info(f"Download complete: {output_path} ({file_size_mb:.1f} MB)")
+        # Write then rename so concurrent or interrupted downloads never
+        # leave a partial chunk behind
+        chunk_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = chunk_file.with_name(f"{chunk_file.stem}.{os.getpid()}.{id(values)}.tmp.npy")
+        np.save(tmp_file, values)
+        os.replace(tmp_file, chunk_file)
+        return False
 
-        return output_path
+    @staticmethod
+    def _assemble_year_subset(plan: dict) -> 'xr.DataArray':
+        """Build one year's subset DataArray from cached chunks."""
+        import numpy as np
+        import xarray as xr
+
+        da = plan['data']
+        starts, stops, chunk_shape = plan['starts'], plan['stops'], plan['chunk_shape']
+        out = np.empty([b - a for a, b in zip(starts, stops)], dtype=da.dtype)
+
+        for chunk_id in plan['chunk_ids']:
+            chunk = np.load(plan['cache_path'] / ('.'.join(str(i) for i in chunk_id) + '.npy'), mmap_mode='r')
+            src, dst = [], []
+            for i, c, a, b in zip(chunk_id, chunk_shape, starts, stops):
+                lo, hi = max(i * c, a), min((i + 1) * c, b)
+                src.append(slice(lo - i * c, hi - i * c))
+                dst.append(slice(lo - a, hi - a))
+            out[tuple(dst)] = chunk[tuple(src)]
+
+        selector = {dim: slice(a, b) for dim, a, b in zip(plan['dims'], starts, stops)}
+        coords = {name: coord.isel({d: selector[d] for d in coord.dims}) for name, coord in da.coords.items()}
+        subset = xr.DataArray(out, dims=da.dims, coords=coords, name=da.name, attrs=dict(da.attrs))
+        return subset.sortby('time')
+
+    @staticmethod
+    def _write_year_subset(subset: 'xr.DataArray', output_path: Path, append: bool) -> None:
+        """Write (or append along time) one year's subset to NetCDF or Zarr."""
+        import numpy as np
+
+        if output_path.suffix == '.zarr':
+            if append:
+                subset.to_dataset().to_zarr(output_path, append_dim='time')
+            else:
+                subset.to_dataset().to_zarr(output_path, mode='w')
+            return
+
+        if not append:
+            subset.to_netcdf(
+                output_path,
+                unlimited_dims=['time'],
+                encoding={'time': {'units': 'hours since 1970-01-01 00:00:00', 'dtype': 'float64'}},
+            )
+            return
+
+        import netCDF4
+
+        hours = (subset['time'].values - np.datetime64('1970-01-01T00:00:00')) / np.timedelta64(1, 'h')
+        with netCDF4.Dataset(output_path, 'a') as nc:
+            n = len(nc.variables['time'])
+            k = len(hours)
+            nc.variables['time'][n:n + k] = hours
+            region = tuple(slice(n, n + k) if dim == 'time' else slice(None) for dim in subset.dims)
+            nc.variables[subset.name][region] = subset.values
 
     @staticmethod
     @log_call
@@ -336,7 +496,10 @@ class HmsAorc:
         min_depth_inches: float = 0.5,
         min_wet_hours: int = 1,
         buffer_hours: int = 48,
-        percentile_threshold: Optional[float] = None
+        percentile_threshold: Optional[float] = None,
+        spatial_stats: bool = False,
+        accumulation_hours: int = 6,
+        rank_by: str = "total_depth_in"
     ) -> 'pd.DataFrame':
         """
         Analyze AORC data and generate catalog of storm events.
@@ -360,7 +523,18 @@ class HmsAorc:
             Hours to add before and after event for simulation warm-up.
         percentile_threshold : float, optional
             If specified (0-100), only return storms above this percentile
-            by total depth. E.g., 95 returns only top 5% storms.
+            by the rank_by metric. E.g., 95 returns only top 5% storms.
+        spatial_stats : bool, default False
+            If True, reduce the grid in a single pass to the hourly mean, the
+            maximum cell and the maximum ``accumulation_hours`` cell
+            accumulation (see reduce_grid_hourly), and add per-event
+            peak_cell_in_hr and max_{N}h_cell_in columns.
+        accumulation_hours : int, default 6
+            Window (hours) of the moving accumulation used with spatial_stats.
+        rank_by : str, default "total_depth_in"
+            Catalog column used for ranking and the percentile filter, e.g.
+            "max_6h_cell_in" to rank by the most intense local accumulation
+            rather than the box mean.
 
         Returns
         -------
@@ -375,7 +549,10 @@ class HmsAorc:
             - peak_intensity_in_hr: Maximum hourly rate (inches/hour)
             - duration_hours: Event duration (hours)
             - wet_hours: Hours with measurable precipitation
-            - rank: Rank by total depth (1 = largest)
+            - peak_cell_in_hr: Maximum single-cell hourly depth (spatial_stats only)
+            - max_{N}h_cell_in: Maximum single-cell N-hour accumulation ending
+              within the event (spatial_stats only)
+            - rank: Rank by rank_by (1 = largest)
 
         Examples
         --------
@@ -447,9 +624,14 @@ class HmsAorc:
                 )
 
             logger.info(f"Loading spatial subset...")
-            # Compute spatial mean for each timestep (lazy then load)
-            precip_mean = ds_subset.mean(dim=[lat_dim, lon_dim])
-            precip_mean = precip_mean.load()
+            if spatial_stats:
+                hourly_stats = HmsAorc.reduce_grid_hourly(ds_subset, accumulation_hours)
+                precip_mean = hourly_stats['mean']
+            else:
+                # Compute spatial mean for each timestep (lazy then load)
+                hourly_stats = None
+                precip_mean = ds_subset.mean(dim=[lat_dim, lon_dim])
+                precip_mean = precip_mean.load().to_series()
 
             logger.info(f"Loaded {len(precip_mean)} hourly timesteps")
 
@@ -457,113 +639,133 @@ class HmsAorc:
             logger.error(f"Error loading AORC data: {e}")
             raise
 
-        # Convert to pandas Series for easier manipulation
-        precip_series = precip_mean.to_series()
-        precip_series.name = 'precip_mm'
-
-        # Convert mm to inches (AORC kg/m² = mm)
-        precip_inches = precip_series / 25.4
+        precip_series = precip_mean.rename('precip_mm')
+
+        return HmsAorc.storm_catalog_from_series(
+            precip_series,
+            units="mm",
+            inter_event_hours=inter_event_hours,
+            min_depth_inches=min_depth_inches,
+            min_wet_hours=min_wet_hours,
+            buffer_hours=buffer_hours,
+            percentile_threshold=percentile_threshold,
+            spatial_stats=hourly_stats,
+            rank_by=rank_by,
+        )
 
-        # Define threshold for "wet" hour (0.01 inches = trace)
-        wet_threshold = 0.01
-        is_wet = precip_inches > wet_threshold
+    @staticmethod
+    @log_call
+    def storm_catalog_from_series(
+        precip: Union['pd.Series', 'np.ndarray'],
+        times: Optional[Union['pd.DatetimeIndex', 'np.ndarray']] = None,
+        units: str = "mm",
+        inter_event_hours: float = 8.0,
+        min_depth_inches: float = 0.5,
+        min_wet_hours: int = 1,
+        buffer_hours: int = 48,
+        percentile_threshold: Optional[float] = None,
+        spatial_stats: Optional['pd.DataFrame'] = None,
+        rank_by: str = "total_depth_in"
+    ) -> 'pd.DataFrame':
+        """
+        Generate a storm catalog from an already-loaded hourly series.
 
-        # Identify event boundaries using inter-event gap
-        events = []
-        event_start = None
-        dry_count = 0
+        Same event definition and output as get_storm_catalog, without any
+        data access, so locally stored or precomputed basin-average series
+        can be cataloged directly.
 
-        for i, (timestamp, wet) in enumerate(is_wet.items()):
-            if wet:
-                if event_start is None:
-                    event_start = timestamp
-                dry_count = 0
-            else:
-                if event_start is not None:
-                    dry_count += 1
-                    if dry_count >= inter_event_hours:
-                        # Event ended - find actual end (last wet hour)
-                        event_end_idx = i - int(dry_count)
-                        if event_end_idx >= 0:
-                            event_end = is_wet.index[event_end_idx]
-                            events.append((event_start, event_end))
-                        event_start = None
-                        dry_count = 0
-
-        # Handle event still in progress at end of year
-        if event_start is not None:
-            last_wet_idx = is_wet[is_wet].index[-1] if is_wet.any() else None
-            if last_wet_idx is not None and last_wet_idx >= event_start:
-                events.append((event_start, last_wet_idx))
-
-        logger.info(f"Identified {len(events)} raw events")
-
-        # Analyze each event
-        storm_records = []
-        for start, end in events:
-            # Get precipitation for this event
-            event_precip = precip_inches[start:end]
-
-            if len(event_precip) == 0:
-                continue
+        Parameters
+        ----------
+        precip : pd.Series or np.ndarray
+            Hourly precipitation. A Series must have a DatetimeIndex.
+        times : pd.DatetimeIndex or np.ndarray, optional
+            Timestamps for an array ``precip``. Ignored for a Series.
+        units : str, default "mm"
+            Units of ``precip``: "mm" (AORC kg/m²) or "in".
+        inter_event_hours : float, default 8.0
+            Minimum hours of no precipitation between storm events.
+        min_depth_inches : float, default 0.5
+            Minimum total precipitation depth (inches) to include event.
+        min_wet_hours : int, default 1
+            Minimum hours with measurable precipitation during event.
+        buffer_hours : int, default 48
+            Hours to add before and after event for simulation warm-up.
+        percentile_threshold : float, optional
+            If specified (0-100), only return storms above this percentile
+            by the rank_by metric.
+        spatial_stats : pd.DataFrame, optional
+            Hourly 'max_cell' and 'max_{N}h' columns from reduce_grid_hourly,
+            one row per value of ``precip`` and in the same units. Adds the
+            per-event peak_cell_in_hr and max_{N}h_cell_in columns.
+        rank_by : str, default "total_depth_in"
+            Catalog column used for ranking and the percentile filter.
 
-            # Calculate event statistics
-            total_depth = event_precip.sum()
-            peak_intensity = event_precip.max()
-            duration = (end - start).total_seconds() / 3600 + 1  # hours (inclusive)
-            wet_hours_count = (event_precip > wet_threshold).sum()
+        Returns
+        -------
+        pd.DataFrame
+            Storm catalog with the columns described in get_storm_catalog.
 
-            # Apply filters
-            if total_depth < min_depth_inches:
-                continue
-            if wet_hours_count < min_wet_hours:
-                continue
+        Raises
+        ------
+        ValueError
+            If units are unknown, times are missing/mismatched for an array,
+            spatial_stats does not align with precip, or rank_by is not a
+            catalog column.
 
-            # Calculate simulation window with buffer
-            sim_start = start - pd.Timedelta(hours=buffer_hours)
-            sim_end = end + pd.Timedelta(hours=buffer_hours)
-
-            storm_records.append({
-                'start_time': start,
-                'end_time': end,
-                'sim_start': sim_start,
-                'sim_end': sim_end,
-                'total_depth_in': round(total_depth, 3),
-                'peak_intensity_in_hr': round(peak_intensity, 3),
-                'duration_hours': int(duration),
-                'wet_hours': int(wet_hours_count),
-            })
-
-        if not storm_records:
-            logger.warning("No storms found matching criteria")
-            import pandas as pd
-            return pd.DataFrame(columns=[
-                'storm_id', 'start_time', 'end_time', 'sim_start', 'sim_end',
-                'total_depth_in', 'peak_intensity_in_hr', 'duration_hours',
-                'wet_hours', 'rank'
-            ])
-
-        # Create DataFrame
+        Examples
+        --------
+        >>> series = xr.open_dataarray("aorc.nc").mean(["latitude", "longitude"]).to_series()
+        >>> storms = HmsAorc.storm_catalog_from_series(series, units="mm")
+        """
+        import numpy as np
         import pandas as pd
-        df = pd.DataFrame(storm_records)
-
-        # Apply percentile filter if specified
-        if percentile_threshold is not None:
-            threshold_value = np.percentile(df['total_depth_in'], percentile_threshold)
-            df = df[df['total_depth_in'] >= threshold_value]
-            logger.info(f"Filtered to {len(df)} storms above {percentile_threshold}th percentile ({threshold_value:.2f} in)")
 
-        # Rank by total depth (1 = largest)
-        df['rank'] = df['total_depth_in'].rank(ascending=False, method='min').astype(int)
+        if isinstance(precip, pd.Series):
+            times = pd.DatetimeIndex(precip.index)
+            values = precip.to_numpy(dtype=float)
+        else:
+            values = np.asarray(precip, dtype=float).ravel()
+            if times is None or len(times) != len(values):
+                raise ValueError("times must be given with one timestamp per value for array input")
+            times = pd.DatetimeIndex(times)
+
+        if units not in ("mm", "in"):
+            raise ValueError(f"Unknown units '{units}'. Use 'mm' or 'in'.")
+        to_inches = 1 / 25.4 if units == "mm" else 1.0  # AORC kg/m² = mm
+        values = values * to_inches
+
+        stat_columns = []
+        if spatial_stats is not None:
+            if len(spatial_stats) != len(values):
+                raise ValueError(
+                    f"spatial_stats has {len(spatial_stats)} rows but precip has {len(values)} values"
+                )
+            stat_columns = [c for c in spatial_stats.columns if c != 'mean']
+            stat_values = spatial_stats[stat_columns].to_numpy(dtype=float) * to_inches
 
-        # Add storm ID (sorted by date)
-        df = df.sort_values('start_time').reset_index(drop=True)
-        df['storm_id'] = range(1, len(df) + 1)
+        wet = values > HmsAorc.WET_THRESHOLD_IN
+        starts, ends = HmsAorc._segment_events(wet, inter_event_hours)
+        logger.info(f"Identified {len(starts)} raw events")
 
-        # Reorder columns
-        df = df[['storm_id', 'start_time', 'end_time', 'sim_start', 'sim_end',
-                 'total_depth_in', 'peak_intensity_in_hr', 'duration_hours',
-                 'wet_hours', 'rank']]
+        if len(starts) == 0:
+            logger.warning("No storms found matching criteria")
+            return pd.DataFrame(columns=HmsAorc.CATALOG_COLUMNS)
+
+        total_depth, peak_intensity, wet_hours = HmsAorc._event_aggregates(values, wet, starts, ends)
+        extra = {}
+        if stat_columns:
+            # Per-event maxima of the hourly spatial statistics
+            bounds = np.column_stack([starts, ends + 1]).ravel()
+            padded = np.vstack([stat_values, np.full((1, len(stat_columns)), np.nan)])
+            stat_peaks = np.fmax.reduceat(padded, bounds, axis=0)[::2]
+            for k, column in enumerate(stat_columns):
+                name = 'peak_cell_in_hr' if column == 'max_cell' else f"{column}_cell_in"
+                extra[name] = stat_peaks[:, k]
+        df = HmsAorc._catalog_table(
+            times[starts], times[ends], total_depth, peak_intensity, wet_hours,
+            min_depth_inches, min_wet_hours, buffer_hours, percentile_threshold,
+            extra=extra, rank_by=rank_by
+        )
 
         logger.info(f"Storm catalog complete: {len(df)} storms")
         if len(df) > 0:
@@ -572,13 +774,434 @@ class HmsAorc:
 
         return df
 
+    @staticmethod
+    @log_call
+    def build_storm_catalog(
+        basins: Union[Dict[str, 'shapely.geometry.Polygon'], str, Path, Tuple['scipy.sparse.csr_matrix', List[str]]],
+        start_year: int,
+        end_year: int,
+        source: Optional[Union[str, Path, 'xr.DataArray', 'xr.Dataset']] = None,
+        variable: str = "APCP_surface",
+        method: str = "intersection",
+        weight_cache: Optional[Union[str, Path]] = None,
+        grid_origin: Tuple[int, int] = (600, 300),
+        time_chunk: int = 720,
+        inter_event_hours: float = 8.0,
+        min_depth_inches: float = 0.5,
+        min_wet_hours: int = 1,
+        buffer_hours: int = 48,
+        percentile_threshold: Optional[float] = None
+    ) -> 'pd.DataFrame':
+        """
+        Storm catalog for many basins over a range of years in one pass.
+
+        Each time chunk of grid data is read once, over the window covering
+        all basins, and reduced to every basin's area-weighted average with a
+        single sparse product (HmsGrid.subbasin_average). Storms are then
+        segmented for all basins at once with the same event definition as
+        get_storm_catalog. Events spanning a year boundary stay whole.
+
+        Parameters
+        ----------
+        basins : dict, str/Path or (csr_matrix, List[str])
+            Basin definitions, one of:
+                - {name: shapely Polygon} in WGS84, mapped to the grid with
+                  HmsGrid.get_weight_matrix()
+                - path to an hrapcells file written for this grid
+                  (see HmsGrid.weights_from_hrapcells())
+                - (weights, names) from HmsGrid.get_weight_matrix()
+        start_year, end_year : int
+            Inclusive range of years to catalog.
+        source : str, Path, xr.DataArray or xr.Dataset, optional
+            Root holding ``{year}.zarr`` stores (default: the AORC S3 bucket;
+            a local mirror is read without s3fs), or an already-opened
+            (lazy) dataset covering the years.
+        variable : str, default "APCP_surface"
+            Precipitation variable (kg/m² = mm).
+        method : str, default "intersection"
+            Grid mapping method for geometry basins.
+        weight_cache : str or Path, optional
+            .npz cache for the weight matrix of geometry basins.
+        grid_origin : Tuple[int, int], default (600, 300)
+            Grid index origin (x, y) used when the hrapcells file was written.
+        time_chunk : int, default 720
+            Hours read per chunk (bounds memory use).
+        inter_event_hours, min_depth_inches, min_wet_hours, buffer_hours, percentile_threshold
+            Event definition and filters, as in get_storm_catalog. The
+            percentile filter and ranks apply per basin.
+
+        Returns
+        -------
+        pd.DataFrame
+            Catalog with a 'basin' column followed by the get_storm_catalog
+            columns; storm_id and rank are numbered within each basin.
+
+        Examples
+        --------
+        >>> geoms = {row['huc12']: row['geometry'] for _, row in hucs.iterrows()}
+        >>> catalog = HmsAorc.build_storm_catalog(
+        ...     geoms, 1981, 2020, source="/data/aorc", weight_cache="aorc_weights.npz"
+        ... )
+        >>> catalog[catalog['rank'] <= 10]
+        """
+        import numpy as np
+        import pandas as pd
+        from .HmsGrid import HmsGrid
+
+        try:
+            import scipy.sparse  # noqa: F401 - basin weight matrices
+        except ImportError:
+            raise ImportError(
+                "HmsAorc.build_storm_catalog() requires scipy.\n"
+                "Install with: pip install hms-commander[aorc]"
+            )
+
+        opened = source if source is not None and hasattr(source, 'dims') else None
+        if opened is None:
+            source = f"s3://{HmsAorc.BUCKET}" if source is None else str(source)
+        _check_aorc_dependencies(remote=opened is None and source.startswith("s3://"))
+
+        series_parts = []
+        time_parts = []
+        weights = names = window = None
+
+        for year in range(start_year, end_year + 1):
+            if opened is not None:
+                da = opened[variable] if hasattr(opened, 'data_vars') else opened
+                da = da.sel(time=str(year))
+            else:
+                da = HmsAorc._open_year_store(source, year)[variable]
+            if da.sizes.get('time', 0) == 0:
+                logger.warning(f"No data found for year {year}")
+                continue
+
+            lat_dim = next(d for d in da.dims if 'lat' in d.lower())
+            lon_dim = next(d for d in da.dims if 'lon' in d.lower())
+            lon = da[lon_dim].values
+            lat = da[lat_dim].values
+
+            if weights is None:
+                weights, names = HmsAorc._basin_weights(basins, lon, lat, method, weight_cache, grid_origin)
+                window = HmsAorc._weight_window(weights, len(lon))
+                logger.info(
+                    f"Cataloging {len(names)} basins over a "
+                    f"{window[0].stop - window[0].start} x {window[1].stop - window[1].start} cell window"
+                )
+            elif weights.shape[1] != len(lat) * len(lon):
+                raise ValueError(f"Grid for year {year} differs from the grid used to build basin weights")
+
+            lat_window, lon_window, window_weights = window
+            n_time = da.sizes['time']
+            for t0 in range(0, n_time, time_chunk):
+                block = da.isel({
+                    'time': slice(t0, t0 + time_chunk), lat_dim: lat_window, lon_dim: lon_window
+                }).transpose('time', lat_dim, lon_dim).values
+                series_parts.append(
+                    HmsGrid.subbasin_average(block, window_weights).to_numpy(dtype=np.float32)
+                )
+            time_parts.append(da['time'].values)
+            logger.info(f"  {year}: {n_time} hours")
+
+        if not series_parts:
+            raise ValueError(f"No data found for years {start_year}-{end_year}")
+
+        series = np.concatenate(series_parts)  # (time, basin)
+        times = pd.DatetimeIndex(np.concatenate(time_parts))
+        del series_parts
+
+        # Segment every basin in one call: basins are laid end to end with a
+        # dry gap long enough to always split events between them. The same
+        # gap is inserted wherever the hours are not contiguous (skipped
+        # years, missing hours), so no event spans missing data.
+        n_time = len(times)
+        gap = max(int(np.ceil(inter_event_hours)), 1) + 1
+        breaks = np.flatnonzero(np.diff(times.values) != np.timedelta64(1, 'h'))
+        if len(breaks):
+            logger.info(f"Splitting events at {len(breaks)} gaps in the hourly record")
+        position = np.arange(n_time) + gap * np.searchsorted(breaks, np.arange(n_time), side='left')
+        n_positions = int(position[-1]) + 1
+        stride = n_positions + gap
+        position_times = np.full(n_positions, np.datetime64('NaT'), dtype=times.values.dtype)
+        position_times[position] = times.values
+        position_times = pd.DatetimeIndex(position_times)
+        values = np.zeros(stride * len(names), dtype=np.float32)
+        values.reshape(len(names), stride)[:, position] = series.T / 25.4  # AORC kg/m² = mm
+        wet = values > HmsAorc.WET_THRESHOLD_IN
+        starts, ends = HmsAorc._segment_events(wet, inter_event_hours)
+        logger.info(f"Identified {len(starts)} raw events across {len(names)} basins")
+        if len(starts) == 0:
+            logger.warning("No storms found matching criteria")
+            return pd.DataFrame(columns=['basin'] + HmsAorc.CATALOG_COLUMNS)
+
+        total_depth, peak_intensity, wet_hours = HmsAorc._event_aggregates(values, wet, starts, ends)
+        df = HmsAorc._catalog_table(
+            position_times[starts % stride], position_times[ends % stride], total_depth, peak_intensity, wet_hours,
+            min_depth_inches, min_wet_hours, buffer_hours, percentile_threshold,
+            basin=np.asarray(names, dtype=object)[starts // stride]
+        )
+        logger.info(f"Storm catalog complete: {len(df)} storms for {df['basin'].nunique()} basins")
+        return df
+
+    @staticmethod
+    def _basin_weights(basins, lon, lat, method, weight_cache, grid_origin):
+        """Resolve build_storm_catalog basins to a (weights, names) pair on the grid."""
+        from .HmsGrid import HmsGrid
+
+        if isinstance(basins, tuple):
+            weights, names = basins
+            if weights.shape[1] != len(lat) * len(lon):
+                raise ValueError(
+                    f"Weight matrix has {weights.shape[1]} columns but grid has {len(lat) * len(lon)} cells"
+                )
+            return weights.tocsr(), list(names)
+        if isinstance(basins, (str, Path)):
+            return HmsGrid.weights_from_hrapcells(basins, (len(lat), len(lon)), grid_origin)
+        return HmsGrid.get_weight_matrix(basins, (lon, lat), method=method, cache_file=weight_cache)
+
+    @staticmethod
+    def _weight_window(weights: 'scipy.sparse.csr_matrix', n_lon: int) -> Tuple[slice, slice, 'scipy.sparse.csr_matrix']:
+        """
+        Smallest (lat, lon) window holding every weighted cell, with the
+        weight matrix re-indexed to that window.
+        """
+        import numpy as np
+        import scipy.sparse as sp
+
+        if weights.nnz == 0:
+            raise ValueError("No basin overlaps the grid")
+        rows, cols = np.divmod(weights.indices, n_lon)
+        r0, r1, c0, c1 = rows.min(), rows.max() + 1, cols.min(), cols.max() + 1
+        window_weights = sp.csr_matrix(
+            (weights.data, (rows - r0) * (c1 - c0) + (cols - c0), weights.indptr),
+            shape=(weights.shape[0], (r1 - r0) * (c1 - c0))
+        )
+        return slice(int(r0), int(r1)), slice(int(c0), int(c1)), window_weights
+
+    @staticmethod
+    def _catalog_table(
+        start_times: 'pd.DatetimeIndex',
+        end_times: 'pd.DatetimeIndex',
+        total_depth: 'np.ndarray',
+        peak_intensity: 'np.ndarray',
+        wet_hours: 'np.ndarray',
+        min_depth_inches: float,
+        min_wet_hours: int,
+        buffer_hours: int,
+        percentile_threshold: Optional[float],
+        basin: Optional['np.ndarray'] = None,
+        extra: Optional[Dict[str, 'np.ndarray']] = None,
+        rank_by: str = "total_depth_in"
+    ) -> 'pd.DataFrame':
+        """
+        Filter, rank and number raw events into a catalog table.
+
+        With ``basin`` given, the percentile filter, ranks and storm ids are
+        applied within each basin and a leading 'basin' column is added.
+        ``extra`` per-event columns (in inches) are placed before 'rank'.
+        """
+        import numpy as np
+        import pandas as pd
+
+        extra = extra or {}
+        columns = HmsAorc.CATALOG_COLUMNS[:-1] + list(extra) + ['rank']
+        if basin is not None:
+            columns = ['basin'] + columns
+        if rank_by not in columns or rank_by in ('basin', 'storm_id', 'rank'):
+            raise ValueError(f"Cannot rank by '{rank_by}'. Available: {columns[columns.index('total_depth_in'):-1]}")
+        duration = (end_times - start_times) / pd.Timedelta(hours=1) + 1  # hours (inclusive)
+
+        keep = (total_depth >= min_depth_inches) & (wet_hours >= min_wet_hours)
+        if not keep.any():
+            logger.warning("No storms found matching criteria")
+            return pd.DataFrame(columns=columns)
+
+        buffer = pd.Timedelta(hours=buffer_hours)
+        df = pd.DataFrame({
+            'start_time': start_times[keep],
+            'end_time': end_times[keep],
+            'sim_start': start_times[keep] - buffer,
+            'sim_end': end_times[keep] + buffer,
+            'total_depth_in': np.round(total_depth[keep], 3),
+            'peak_intensity_in_hr': np.round(peak_intensity[keep], 3),
+            'duration_hours': np.asarray(duration[keep], dtype=int),
+            'wet_hours': wet_hours[keep].astype(int),
+        })
+        for name, values in extra.items():
+            df[name] = np.round(values[keep], 3)
+
+        if basin is None:
+            # Apply percentile filter if specified
+            if percentile_threshold is not None:
+                threshold_value = np.percentile(df[rank_by], percentile_threshold)
+                df = df[df[rank_by] >= threshold_value]
+                logger.info(f"Filtered to {len(df)} storms above {percentile_threshold}th percentile of {rank_by} ({threshold_value:.2f})")
+
+            # Rank by the chosen metric (1 = largest)
+            df['rank'] = df[rank_by].rank(ascending=False, method='min').astype(int)
+
+            # Add storm ID (sorted by date)
+            df = df.sort_values('start_time').reset_index(drop=True)
+            df['storm_id'] = range(1, len(df) + 1)
+            return df[columns]
+
+        df.insert(0, 'basin', basin[keep])
+        depth = df.groupby('basin', sort=False)[rank_by]
+        if percentile_threshold is not None:
+            df = df[df[rank_by] >= depth.transform('quantile', percentile_threshold / 100)]
+            depth = df.groupby('basin', sort=False)[rank_by]
+        df['rank'] = depth.rank(ascending=False, method='min').astype(int)
+        df = df.sort_values(['basin', 'start_time'], kind='stable').reset_index(drop=True)
+        df['storm_id'] = df.groupby('basin', sort=False).cumcount() + 1
+        return df[columns]
+
+    @staticmethod
+    @log_call
+    def reduce_grid_hourly(
+        data: 'xr.DataArray',
+        accumulation_hours: int = 6,
+        time_chunk: int = 720
+    ) -> 'pd.DataFrame':
+        """
+        Hourly areal mean, maximum cell and maximum N-hour cell accumulation.
+
+        Makes a single pass over the grid in time chunks. The moving
+        N-hour accumulation of every cell is taken as the difference of
+        cumulative sums along time, carrying the last N-1 hours across chunk
+        boundaries, so no field is re-read. Windows at the start of the data
+        are partial (fewer than N hours).
+
+        Parameters
+        ----------
+        data : xr.DataArray
+            Gridded precipitation with a 'time' dimension (lazy is fine).
+        accumulation_hours : int, default 6
+            Moving accumulation window N (hours).
+        time_chunk : int, default 720
+            Hours loaded per chunk.
+
+        Returns
+        -------
+        pd.DataFrame
+            Indexed by time with columns 'mean' (areal mean), 'max_cell'
+            (largest cell value) and 'max_{N}h' (largest N-hour cell
+            accumulation ending at that hour), in the units of ``data``.
+            NaN cells are ignored.
+
+        Examples
+        --------
+        >>> da = xr.open_dataarray("aorc.nc")
+        >>> stats = HmsAorc.reduce_grid_hourly(da, accumulation_hours=24)
+        >>> storms = HmsAorc.storm_catalog_from_series(
+        ...     stats['mean'], spatial_stats=stats, rank_by="max_24h_cell_in"
+        ... )
+        """
+        import numpy as np
+        import pandas as pd
+
+        if accumulation_hours < 1:
+            raise ValueError(f"accumulation_hours must be >= 1, got {accumulation_hours}")
+
+        spatial_dims = [d for d in data.dims if d != 'time']
+        data = data.transpose('time', *spatial_dims)
+        n_time = data.sizes['time']
+        field_shape = tuple(data.sizes[d] for d in spatial_dims)
+        n = accumulation_hours
+
+        mean = np.full(n_time, np.nan)
+        max_cell = np.full(n_time, np.nan)
+        max_accum = np.full(n_time, np.nan)
+        tail = np.zeros((n - 1, int(np.prod(field_shape))))
+
+        for t0 in range(0, n_time, time_chunk):
+            block = np.asarray(data.isel(time=slice(t0, t0 + time_chunk)).values, dtype=float)
+            block = block.reshape(len(block), -1)
+            t1 = t0 + len(block)
+            valid = ~np.isnan(block)
+            filled = np.where(valid, block, 0.0)
+
+            count = valid.sum(axis=1)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                mean[t0:t1] = np.where(count > 0, filled.sum(axis=1) / count, np.nan)
+            peak = np.where(valid, block, -np.inf).max(axis=1, initial=-np.inf)
+            max_cell[t0:t1] = np.where(np.isfinite(peak), peak, np.nan)
+
+            # Rolling N-hour sum per cell: C[i + N] - C[i] over the chunk
+            # extended with the previous N-1 hours
+            extended = np.concatenate([tail, filled])
+            csum = np.concatenate([np.zeros((1, extended.shape[1])), np.cumsum(extended, axis=0)])
+            accum = csum[n:] - csum[:-n]
+            covered = count > 0
+            max_accum[t0:t1] = np.where(covered, accum.max(axis=1, initial=-np.inf), np.nan)
+            tail = extended[len(extended) - (n - 1):] if n > 1 else tail
+
+        index = pd.Index(data['time'].values, name='time')
+        return pd.DataFrame(
+            {'mean': mean, 'max_cell': max_cell, f'max_{n}h': max_accum},
+            index=index
+        )
+
+    @staticmethod
+    def _segment_events(wet: 'np.ndarray', inter_event_hours: float) -> Tuple['np.ndarray', 'np.ndarray']:
+        """
+        Split a wet/dry mask into events separated by long dry runs.
+
+        Dry runs between consecutive wet hours are run-length encoded from
+        the gaps between wet indices; a run of at least ``inter_event_hours``
+        ends the current event at its last wet hour.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            Inclusive start and end indices of each event.
+        """
+        import math
+        import numpy as np
+
+        wet_idx = np.flatnonzero(wet)
+        if wet_idx.size == 0:
+            empty = np.zeros(0, dtype=np.intp)
+            return empty, empty
+
+        dry_run = np.diff(wet_idx) - 1
+        breaks = np.flatnonzero(dry_run >= max(math.ceil(inter_event_hours), 1))
+        starts = wet_idx[np.concatenate(([0], breaks + 1))]
+        ends = wet_idx[np.concatenate((breaks, [wet_idx.size - 1]))]
+        return starts, ends
+
+    @staticmethod
+    def _event_aggregates(
+        values: 'np.ndarray',
+        wet: 'np.ndarray',
+        starts: 'np.ndarray',
+        ends: 'np.ndarray'
+    ) -> Tuple['np.ndarray', 'np.ndarray', 'np.ndarray']:
+        """
+        Total, peak and wet-hour count of each [start, end] event along axis 0.
+
+        Works on 1D series or 2D (time, series) arrays; NaN hours are skipped.
+        """
+        import numpy as np
+
+        # Interleave start and end+1 so every other reduceat segment is an
+        # event; a padding row keeps end+1 in range for an event at the end.
+        bounds = np.column_stack([starts, ends + 1]).ravel()
+        pad = np.zeros((1,) + values.shape[1:], dtype=values.dtype)
+        filled = np.concatenate([np.nan_to_num(values, nan=0.0), pad])
+        total = np.add.reduceat(filled, bounds, axis=0, dtype=np.float64)[::2]
+        peak = np.fmax.reduceat(np.concatenate([values, pad]), bounds, axis=0)[::2]
+        wet_hours = np.add.reduceat(np.concatenate([wet, pad.astype(bool)]).astype(np.int64), bounds, axis=0)[::2]
+        return total, peak, wet_hours
+
     @staticmethod
     @log_call
     def convert_to_dss_grid(
         netcdf_file: Union[str, Path],
         output_dss_file: Union[str, Path],
         pathname: str,
-        units: str = "MM"
+        units: str = "MM",
+        time_chunk: int = 24,
+        resume: bool = False,
+        progress_callback: Optional[Callable[[int, Optional[int]], None]] = None
     ) -> Path:
         """
         Convert AORC NetCDF to DSS grid format for HMS.
@@ -586,16 +1209,28 @@ class HmsAorc:
         Uses HmsDssGrid to write DSS grids using HEC Monolith libraries,
         following the pattern from HEC-Vortex.
 
+        The dataset is opened lazily and streamed to the DSS writer
+        ``time_chunk`` timesteps at a time, so memory use does not grow with
+        the length of the record. With resume=True, timesteps already in the
+        target DSS catalog under ``pathname`` are skipped without being read.
+
         Parameters
         ----------
         netcdf_file : str or Path
-            Input NetCDF file (from download())
+            Input NetCDF file or Zarr store (from download())
         output_dss_file : str or Path
             Output DSS file path
         pathname : str
             DSS pathname (e.g., "/AORC/GRID/PRECIP////")
         units : str, default "MM"
             Output units. AORC data is in kg/m^2 which equals mm.
+        time_chunk : int, default 24
+            Timesteps read from the dataset at once.
+        resume : bool, default False
+            Skip timesteps already stored in ``output_dss_file`` (e.g. after
+            an interrupted conversion).
+        progress_callback : callable, optional
+            Called as ``progress_callback(done, total)`` after each timestep.
 
         Returns
         -------
@@ -627,6 +1262,12 @@ class HmsAorc:
         >>>
         >>> # Use in HMS met model
         >>> HmsMet.set_gridded_precipitation("model.met", dss_file, pathname)
+        >>>
+        >>> # Resume an interrupted multi-year conversion
+        >>> HmsAorc.convert_to_dss_grid(
+        ...     "aorc_1980_2020.zarr", "aorc.dss", "/AORC/GRID/PRECIP////",
+        ...     resume=True, progress_callback=lambda done, total: print(done, total)
+        ... )
 
         Notes
         -----
@@ -641,11 +1282,9 @@ class HmsAorc:
         HmsDssGrid.write_grid_timeseries : Lower-level DSS grid writing
         HmsAorc.download : Download AORC data to NetCDF
         """
-        _check_aorc_dependencies()
+        _check_aorc_dependencies(remote=False)
 
         import xarray as xr
-        import pandas as pd
-        import numpy as np
 
         from .dss import HmsDssGrid
 
@@ -660,49 +1299,60 @@ class HmsAorc:
         logger.info(f"  Output: {output_dss_file}")
         logger.info(f"  Pathname: {pathname}")
 
-        # Open NetCDF
-        ds = xr.open_dataarray(netcdf_file)
+        # Open lazily; only the chunk being written is read
+        if netcdf_file.suffix == '.zarr':
+            ds = xr.open_zarr(netcdf_file, chunks=None)
+        else:
+            ds = xr.open_dataset(netcdf_file)
+        if HmsAorc.PRECIP_VAR in ds.data_vars:
+            da = ds[HmsAorc.PRECIP_VAR]
+        elif len(ds.data_vars) == 1:
+            da = ds[next(iter(ds.data_vars))]
+        else:
+            raise ValueError(
+                f"Cannot choose a variable from {list(ds.data_vars)}; "
+                f"expected '{HmsAorc.PRECIP_VAR}'"
+            )
 
-        # Get coordinates
         # AORC uses 'latitude' and 'longitude' naming
-        lat_dim = 'latitude' if 'latitude' in ds.dims else 'lat'
-        lon_dim = 'longitude' if 'longitude' in ds.dims else 'lon'
-
-        lat_coords = ds[lat_dim].values
-        lon_coords = ds[lon_dim].values
-        time_coords = ds['time'].values
-
-        # Get grid data (time, lat, lon)
-        grid_data = ds.values
+        lat_dim = 'latitude' if 'latitude' in da.dims else 'lat'
+        lon_dim = 'longitude' if 'longitude' in da.dims else 'lon'
 
-        # Handle case where lat might be first (time, lat, lon expected)
-        if grid_data.ndim == 3:
-            # Already in (time, lat, lon) shape
-            pass
-        elif grid_data.ndim == 2:
-            # Single timestep - add time dimension
-            grid_data = grid_data[np.newaxis, :, :]
-            time_coords = np.array([time_coords]) if time_coords.ndim == 0 else time_coords
+        # Single timestep - add time dimension
+        if 'time' not in da.dims:
+            da = da.expand_dims('time')
+        da = da.transpose('time', lat_dim, lon_dim)
 
-        # Convert time to datetime list
-        timestamps = pd.to_datetime(time_coords).to_pydatetime().tolist()
+        lat_coords = da[lat_dim].values
+        lon_coords = da[lon_dim].values
+        time_coords = da['time'].values
 
-        logger.info(f"  Grid shape: {grid_data.shape} (time, lat, lon)")
-        logger.info(f"  Time range: {timestamps[0]} to {timestamps[-1]}")
+        logger.info(f"  Grid shape: {da.shape} (time, lat, lon)")
+        logger.info(f"  Time range: {time_coords[0]} to {time_coords[-1]}")
         logger.info(f"  Lat range: {lat_coords.min():.4f} to {lat_coords.max():.4f}")
         logger.info(f"  Lon range: {lon_coords.min():.4f} to {lon_coords.max():.4f}")
 
+        skip_times = None
+        if resume:
+            skip_times = HmsDssGrid.get_grid_times(output_dss_file, pathname)
+            logger.info(f"  Resuming: {len(skip_times)} timesteps already in {output_dss_file.name}")
+
         # Write to DSS using HmsDssGrid
-        result = HmsDssGrid.write_grid_timeseries(
-            dss_file=output_dss_file,
-            pathname=pathname,
-            grid_data=grid_data,
-            lat_coords=lat_coords,
-            lon_coords=lon_coords,
-            timestamps=timestamps,
-            units=units,
-            data_type="PER-CUM"  # Precipitation is period cumulative
-        )
+        try:
+            result = HmsDssGrid.write_grid_timeseries(
+                dss_file=output_dss_file,
+                pathname=pathname,
+                grid_data=da,
+                lat_coords=lat_coords,
+                lon_coords=lon_coords,
+                units=units,
+                data_type="PER-CUM",  # Precipitation is period cumulative
+                chunk_size=time_chunk,
+                skip_times=skip_times,
+                progress_callback=progress_callback,
+            )
+        finally:
+            ds.close()
 
         logger.info(f"DSS conversion complete: {result}")
         return result
@@ -15,7 +15,12 @@ import pandas as pd
 from .LoggingConfig import get_logger
 from .Decorators import log_call
 from ._parsing import HmsFileParser
-from ._constants import LOSS_METHODS, TRANSFORM_METHODS, BASEFLOW_METHODS, ROUTING_METHODS
+from ._constants import (
+    LOSS_METHODS, TRANSFORM_METHODS, BASEFLOW_METHODS, ROUTING_METHODS,
+    BASIN_PARAMETER_KEYS
+)
+from .BasinModel import BasinModel
+from .SubbasinTable import SubbasinTable
 
 logger = get_logger(__name__)
 
@@ -157,6 +162,93 @@ class HmsBasin:
 
         return pd.DataFrame(records)
 
+    @staticmethod
+    @log_call
+    def get_basin_summary(
+        basin_path: Union[str, Path],
+        hms_object=None
+    ) -> Dict[str, Any]:
+        """
+        Summarize a basin model file in a single streaming pass.
+
+        Element blocks are read one at a time from a memory-mapped view of
+        the file, so summaries of very large basin files do not require
+        holding the file (or all parsed elements) in memory.
+
+        Args:
+            basin_path: Path to the .basin file
+            hms_object: Optional HmsPrj instance
+
+        Returns:
+            Dictionary with element counts (num_subbasins, num_reaches,
+            num_junctions, num_reservoirs, num_sources, num_sinks), total
+            subbasin area, and comma-separated loss/transform/baseflow/routing
+            methods in use
+
+        Example:
+            >>> summary = HmsBasin.get_basin_summary("model.basin")
+            >>> print(summary['num_subbasins'], summary['total_area'])
+        """
+        basin_path = Path(basin_path)
+
+        counts = {
+            'Subbasin': 0, 'Reach': 0, 'Junction': 0,
+            'Reservoir': 0, 'Source': 0, 'Sink': 0,
+        }
+        total_area = 0.0
+        methods = {'LossRate': set(), 'Transform': set(), 'Baseflow': set(), 'Route': set()}
+
+        for block_type, _, attrs in HmsFileParser.iter_blocks(basin_path, block_types=counts):
+            counts[block_type] += 1
+            if block_type == 'Subbasin':
+                area = HmsFileParser.to_numeric(attrs.get('Area'))
+                if isinstance(area, float):
+                    total_area += area
+            for key, found in methods.items():
+                if attrs.get(key):
+                    found.add(attrs[key])
+
+        return {
+            'num_subbasins': counts['Subbasin'],
+            'num_reaches': counts['Reach'],
+            'num_junctions': counts['Junction'],
+            'num_reservoirs': counts['Reservoir'],
+            'num_sources': counts['Source'],
+            'num_sinks': counts['Sink'],
+            'total_area': round(total_area, 2),
+            'loss_methods': ', '.join(sorted(methods['LossRate'])),
+            'transform_methods': ', '.join(sorted(methods['Transform'])),
+            'baseflow_methods': ', '.join(sorted(methods['Baseflow'])),
+            'routing_methods': ', '.join(sorted(methods['Route'])),
+        }
+
+    @staticmethod
+    @log_call
+    def get_subbasin_table(
+        basin_path: Union[str, Path],
+        hms_object=None
+    ) -> SubbasinTable:
+        """
+        Load all subbasin parameters as a columnar SubbasinTable.
+
+        Each parameter is a NumPy array with one value per subbasin, so
+        calibration and sensitivity sweeps can transform whole parameter
+        vectors and write the changes back in one batched pass.
+
+        Args:
+            basin_path: Path to the .basin file
+            hms_object: Optional HmsPrj instance
+
+        Returns:
+            SubbasinTable with one row per subbasin
+
+        Example:
+            >>> table = HmsBasin.get_subbasin_table("model.basin")
+            >>> table.scale("curve_number", 1.05, rows=table.select("^HUC0401"), upper=98)
+            >>> table.write(hms_object=hms)
+        """
+        return SubbasinTable.from_file(basin_path)
+
     @staticmethod
     @log_call
     def get_loss_parameters(
@@ -174,53 +266,20 @@ class HmsBasin:
 
         Returns:
             Dictionary of loss parameters (varies by method type)
+            (a numeric attribute that cannot be parsed is omitted and
+            logged as a warning)
 
         Example:
             >>> params = HmsBasin.get_loss_parameters("model.basin", "Subbasin-1")
             >>> print(params)
             {'method': 'Deficit and Constant', 'initial_deficit': 25.4, ...}
         """
-        basin_path = Path(basin_path)
-        content = HmsBasin._read_basin_file(basin_path)
-        subbasins = HmsBasin._parse_elements(content, "Subbasin")
+        table = SubbasinTable.from_file(basin_path, names=[subbasin_name])
 
-        if subbasin_name not in subbasins:
+        if subbasin_name not in table:
             raise ValueError(f"Subbasin '{subbasin_name}' not found in basin file")
 
-        attrs = subbasins[subbasin_name]
-        loss_method = attrs.get('Loss', 'None')
-
-        params = {'method': loss_method}
-
-        # Common loss parameters
-        if 'Initial Deficit' in attrs:
-            params['initial_deficit'] = float(attrs['Initial Deficit'])
-        if 'Maximum Deficit' in attrs:
-            params['maximum_deficit'] = float(attrs['Maximum Deficit'])
-        if 'Constant Rate' in attrs:
-            params['constant_rate'] = float(attrs['Constant Rate'])
-        if 'Percolation Rate' in attrs:
-            params['percolation_rate'] = float(attrs['Percolation Rate'])
-        if 'Percent Impervious Area' in attrs:
-            params['percent_impervious'] = float(attrs['Percent Impervious Area'])
-
-        # SCS Curve Number parameters
-        if 'Curve Number' in attrs:
-            params['curve_number'] = float(attrs['Curve Number'])
-        if 'Initial Abstraction' in attrs:
-            params['initial_abstraction'] = float(attrs['Initial Abstraction'])
-
-        # Green and Ampt parameters
-        if 'Conductivity' in attrs:
-            params['conductivity'] = float(attrs['Conductivity'])
-        if 'Suction' in attrs:
-            params['suction'] = float(attrs['Suction'])
-        if 'Initial Content' in attrs:
-            params['initial_content'] = float(attrs['Initial Content'])
-        if 'Saturated Content' in attrs:
-            params['saturated_content'] = float(attrs['Saturated Content'])
-
-        return params
+        return table.loss_parameters(subbasin_name)
 
     @staticmethod
     @log_call
@@ -317,6 +376,9 @@ class HmsBasin:
 
             logger.info(f"Updated loss parameters for subbasin '{subbasin_name}'")
 
+            from .HmsPrj import HmsPrj
+            HmsPrj.notify_file_changed(basin_path, subbasin_name, hms_object=hms_object)
+
         return True
 
     @staticmethod
@@ -336,41 +398,18 @@ class HmsBasin:
 
         Returns:
             Dictionary of transform parameters
+            (a numeric attribute that cannot be parsed is omitted and
+            logged as a warning)
 
         Example:
             >>> params = HmsBasin.get_transform_parameters("model.basin", "Subbasin-1")
         """
-        basin_path = Path(basin_path)
-        content = HmsBasin._read_basin_file(basin_path)
-        subbasins = HmsBasin._parse_elements(content, "Subbasin")
+        table = SubbasinTable.from_file(basin_path, names=[subbasin_name])
 
-        if subbasin_name not in subbasins:
+        if subbasin_name not in table:
             raise ValueError(f"Subbasin '{subbasin_name}' not found")
 
-        attrs = subbasins[subbasin_name]
-        transform_method = attrs.get('Transform', 'None')
-
-        params = {'method': transform_method}
-
-        # Clark Unit Hydrograph parameters
-        if 'Time of Concentration' in attrs:
-            params['time_of_concentration'] = float(attrs['Time of Concentration'])
-        if 'Storage Coefficient' in attrs:
-            params['storage_coefficient'] = float(attrs['Storage Coefficient'])
-
-        # SCS Unit Hydrograph parameters
-        if 'Lag Time' in attrs:
-            params['lag_time'] = float(attrs['Lag Time'])
-        if 'Graph Type' in attrs:
-            params['graph_type'] = attrs['Graph Type']
-
-        # Snyder parameters
-        if 'Snyder Tp' in attrs:
-            params['snyder_tp'] = float(attrs['Snyder Tp'])
-        if 'Snyder Cp' in attrs:
-            params['snyder_cp'] = float(attrs['Snyder Cp'])
-
-        return params
+        return table.transform_parameters(subbasin_name)
 
     @staticmethod
     @log_call
@@ -389,38 +428,15 @@ class HmsBasin:
 
         Returns:
             Dictionary of baseflow parameters
+            (a numeric attribute that cannot be parsed is omitted and
+            logged as a warning)
         """
-        basin_path = Path(basin_path)
-        content = HmsBasin._read_basin_file(basin_path)
-        subbasins = HmsBasin._parse_elements(content, "Subbasin")
+        table = SubbasinTable.from_file(basin_path, names=[subbasin_name])
 
-        if subbasin_name not in subbasins:
+        if subbasin_name not in table:
             raise ValueError(f"Subbasin '{subbasin_name}' not found")
 
-        attrs = subbasins[subbasin_name]
-        baseflow_method = attrs.get('Baseflow', 'None')
-
-        params = {'method': baseflow_method}
-
-        # Recession parameters
-        if 'Recession Factor' in attrs:
-            params['recession_factor'] = float(attrs['Recession Factor'])
-        if 'Initial Discharge' in attrs:
-            params['initial_discharge'] = float(attrs['Initial Discharge'])
-        if 'Threshold Type' in attrs:
-            params['threshold_type'] = attrs['Threshold Type']
-
-        # Linear Reservoir parameters
-        if 'GW 1 Initial' in attrs:
-            params['gw1_initial'] = float(attrs['GW 1 Initial'])
-        if 'GW 1 Coefficient' in attrs:
-            params['gw1_coefficient'] = float(attrs['GW 1 Coefficient'])
-        if 'GW 2 Initial' in attrs:
-            params['gw2_initial'] = float(attrs['GW 2 Initial'])
-        if 'GW 2 Coefficient' in attrs:
-            params['gw2_coefficient'] = float(attrs['GW 2 Coefficient'])
-
-        return params
+        return table.baseflow_parameters(subbasin_name)
 
     @staticmethod
     @log_call
@@ -441,13 +457,11 @@ class HmsBasin:
             Dictionary of routing parameters
         """
         basin_path = Path(basin_path)
-        content = HmsBasin._read_basin_file(basin_path)
-        reaches = HmsBasin._parse_elements(content, "Reach")
+        attrs = HmsBasin._read_element(basin_path, "Reach", reach_name)
 
-        if reach_name not in reaches:
+        if attrs is None:
             raise ValueError(f"Reach '{reach_name}' not found")
 
-        attrs = reaches[reach_name]
         route_method = attrs.get('Route', 'None')
 
         params = {'method': route_method}
@@ -474,6 +488,70 @@ class HmsBasin:
 
         return params
 
+    @staticmethod
+    @log_call
+    def set_parameters_batch(
+        basin_path: Union[str, Path],
+        edits: Union[pd.DataFrame, Dict[str, Dict[str, Any]]],
+        hms_object=None
+    ) -> int:
+        """
+        Set loss, transform, baseflow and routing parameters for many elements.
+
+        The file is indexed once as a BasinModel, every edit is an O(1) line
+        replacement, and the result is written once, atomically, instead of
+        one read/regex/write cycle per element as with set_loss_parameters().
+        Intended for calibration and sensitivity loops.
+
+        Args:
+            basin_path: Path to the .basin file
+            edits: Either a dict of {element_name: {parameter: value}} or a
+                DataFrame with one row per element (element names in a 'name'
+                column or the index, parameters in the remaining columns).
+                Parameters may be snake_case names as returned by the
+                get_*_parameters methods (e.g. 'curve_number', 'muskingum_k')
+                or literal .basin keys (e.g. 'Curve Number').
+                None/NaN values are skipped.
+            hms_object: Optional HmsPrj instance
+
+        Returns:
+            Number of parameter values written
+
+        Raises:
+            ValueError: If an element or one of its parameter lines is not
+                found. The file is left unchanged in that case.
+
+        Example:
+            >>> HmsBasin.set_parameters_batch("model.basin", {
+            ...     "Sub1": {"curve_number": 78, "lag_time": 45.0},
+            ...     "Reach-1": {"muskingum_k": 1.2},
+            ... })
+            3
+            >>> # Or scale every curve number from the project table
+            >>> cn = hms.subbasin_df[['name', 'curve_number']].copy()
+            >>> cn['curve_number'] *= 1.05
+            >>> HmsBasin.set_parameters_batch("model.basin", cn)
+        """
+        basin_path = Path(basin_path)
+        element_edits = HmsBasin._normalize_parameter_edits(edits)
+        if not element_edits:
+            return 0
+
+        model = BasinModel.from_file(basin_path)
+        count = model.set_parameters(element_edits)
+
+        if model.is_modified:
+            model.save(atomic=True)
+
+            from .HmsPrj import HmsPrj
+            HmsPrj.notify_file_changed(basin_path, hms_object=hms_object)
+
+        logger.info(
+            f"Set {count} parameter values across {len(element_edits)} elements "
+            f"in {basin_path.name}"
+        )
+        return count
+
     @staticmethod
     @log_call
     def clone_basin(
@@ -608,6 +686,15 @@ class HmsBasin:
         """Read basin file content with encoding fallback."""
         return HmsFileParser.read_file(basin_path)
 
+    @staticmethod
+    def _read_element(
+        basin_path: Path,
+        element_type: str,
+        element_name: str
+    ) -> Optional[Dict[str, str]]:
+        """Stream a basin file up to one element block and return its attributes."""
+        return HmsFileParser.read_block(basin_path, element_type, element_name)
+
     @staticmethod
     def _parse_elements(content: str, element_type: str) -> Dict[str, Dict[str, Any]]:
         """
@@ -635,3 +722,25 @@ class HmsBasin:
             Tuple of (modified content, whether change was made)
         """
         return HmsFileParser.update_parameter(block_content, param_name, new_value)
+
+    @staticmethod
+    def _normalize_parameter_edits(
+        edits: Union[pd.DataFrame, Dict[str, Dict[str, Any]]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Convert batch edits to {element_name: {basin_key: value}}.
+
+        Maps snake_case parameter names to .basin keys and drops None/NaN values.
+        """
+        if isinstance(edits, pd.DataFrame):
+            frame = edits.set_index('name') if 'name' in edits.columns else edits
+            edits = frame.to_dict(orient='index')
+
+        normalized = {}
+        for element_name, params in edits.items():
+            for param, value in params.items():
+                if value is None or (not isinstance(value, str) and pd.isna(value)):
+                    continue
+                key = BASIN_PARAMETER_KEYS.get(param, param)
+                normalized.setdefault(str(element_name), {})[key] = value
+        return normalized
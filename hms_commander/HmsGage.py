@@ -227,8 +227,96 @@ Gage: {name}
             f.write(content)
 
         logger.info(f"Created gage '{name}' in {gage_path}")
+
+        from .HmsPrj import HmsPrj
+        HmsPrj.notify_file_changed(gage_path, name, hms_object=hms_object)
         return True
 
+    @staticmethod
+    @log_call
+    def create_gages(
+        gage_path: Union[str, Path],
+        gages: Union[pd.DataFrame, List[Dict[str, Any]]],
+        overwrite: bool = False,
+        hms_object=None
+    ) -> int:
+        """
+        Create many gage entries in one read/write of the gage file.
+
+        Use for ensembles (e.g. the pathnames returned by
+        HmsDss.write_design_storms) where calling create_gage() per gage
+        would rewrite the file once per gage.
+
+        Args:
+            gage_path: Path to the .gage file (created if doesn't exist)
+            gages: DataFrame or list of dicts with columns name, dss_file and
+                pathname, plus optional gage_type, units, data_type and
+                description (defaults as in create_gage)
+            overwrite: Replace existing gages with the same name instead of
+                raising
+            hms_object: Optional HmsPrj instance
+
+        Returns:
+            Number of gages written
+
+        Raises:
+            ValueError: If required columns are missing, names are duplicated,
+                or a gage already exists and overwrite is False
+
+        Example:
+            >>> HmsGage.create_gages("model.gage", pd.DataFrame({
+            ...     'name': ['Storm-0001', 'Storm-0002'],
+            ...     'dss_file': 'storms.dss',
+            ...     'pathname': ['/A/B/PRECIP-INC/01JAN2000/15MIN/S0001/',
+            ...                  '/A/B/PRECIP-INC/01JAN2000/15MIN/S0002/'],
+            ... }))
+        """
+        gage_path = Path(gage_path)
+        gages = pd.DataFrame(gages)
+
+        missing = {'name', 'dss_file', 'pathname'} - set(gages.columns)
+        if missing:
+            raise ValueError(f"gages is missing required columns: {sorted(missing)}")
+        if gages['name'].duplicated().any():
+            raise ValueError(f"Duplicate gage names: {gages.loc[gages['name'].duplicated(), 'name'].tolist()}")
+
+        content = HmsGage._read_gage_file(gage_path) if gage_path.exists() else ""
+
+        existing = set(HmsGage._parse_gage_blocks(content)) & set(gages['name'])
+        if existing:
+            if not overwrite:
+                raise ValueError(f"Gages already exist: {sorted(existing)}")
+            for name in existing:
+                pattern = rf'Gage:\s*{re.escape(name)}\s*\n.*?End:\s*\n?'
+                content = re.sub(pattern, '', content, flags=re.DOTALL | re.IGNORECASE)
+
+        defaults = {'gage_type': 'Precipitation', 'units': 'IN', 'data_type': 'PER-CUM', 'description': ''}
+        gages = gages.assign(**{k: v for k, v in defaults.items() if k not in gages.columns})
+        gages = gages.fillna(defaults)
+
+        blocks = []
+        for gage in gages.itertuples(index=False):
+            block = (
+                f"\nGage: {gage.name}\n"
+                f"     Type: {gage.gage_type}\n"
+                f"     Units: {gage.units}\n"
+                f"     Data Type: {gage.data_type}\n"
+                f"     DSS File Name: {gage.dss_file}\n"
+                f"     DSS Pathname: {gage.pathname}\n"
+            )
+            if gage.description:
+                block += f"     Description: {gage.description}\n"
+            blocks.append(block + "End:\n")
+
+        with open(gage_path, 'w', encoding='utf-8') as f:
+            f.write(content + "".join(blocks))
+
+        logger.info(f"Created {len(blocks)} gages in {gage_path}")
+
+        from .HmsPrj import HmsPrj
+        HmsPrj.notify_file_changed(gage_path, hms_object=hms_object)
+        return len(blocks)
+
     @staticmethod
     @log_call
     def update_gage(
@@ -287,6 +375,9 @@ Gage: {name}
 
             logger.info(f"Updated gage '{gage_name}'")
 
+            from .HmsPrj import HmsPrj
+            HmsPrj.notify_file_changed(gage_path, gage_name, hms_object=hms_object)
+
         return True
 
     @staticmethod
@@ -321,6 +412,9 @@ Gage: {name}
             f.write(new_content)
 
         logger.info(f"Deleted gage '{gage_name}'")
+
+        from .HmsPrj import HmsPrj
+        HmsPrj.notify_file_changed(gage_path, gage_name, hms_object=hms_object)
         return True
 
     @staticmethod
@@ -9,7 +9,7 @@ All methods in this class are static and designed to be used without instantiati
 
 import json
 from pathlib import Path
-from typing import Dict, List, Tuple, Any, Optional, Union
+from typing import Dict, Iterable, Iterator, List, Tuple, Any, Optional, Union
 
 from .LoggingConfig import get_logger
 from .Decorators import log_call
@@ -309,9 +309,57 @@ class HmsGeo:
         boundaries = []
         rivers = []
 
+        for feature in HmsGeo.iter_map_segments(map_path, map_types=('BoundaryMap', 'RiverMap')):
+            if feature['map_type'] == 'BoundaryMap':
+                boundaries.append(feature)
+            elif feature['map_type'] == 'RiverMap':
+                rivers.append(feature)
+
+        logger.info(f"Found {len(boundaries)} boundaries, {len(rivers)} rivers")
+        return {
+            'boundaries': boundaries,
+            'rivers': rivers
+        }
+
+    @staticmethod
+    def iter_map_segments(
+        map_path: Union[str, Path],
+        map_types: Optional[Iterable[str]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream segments from a HEC-HMS .map file one at a time.
+
+        Only the current segment's coordinates are held in memory, so large
+        map files can be filtered, counted, or converted incrementally.
+
+        Args:
+            map_path: Path to the .map file
+            map_types: Optional MapGeo types to yield (e.g. ['BoundaryMap'])
+
+        Yields:
+            Feature dicts with 'coordinates' ([[x, y], ...]), 'segment_type'
+            ('closed' or 'open') and 'map_type' (e.g. 'BoundaryMap')
+
+        Example:
+            >>> for seg in HmsGeo.iter_map_segments("model.map", ['RiverMap']):
+            ...     print(len(seg['coordinates']))
+        """
+        map_types = set(map_types) if map_types is not None else None
+
         current_map_type = None
+        segment_map_type = None
         current_segment_type = None
         current_coordinates = []
+        keep = False
+
+        def finish():
+            if keep and current_coordinates and segment_map_type:
+                return {
+                    'coordinates': current_coordinates,
+                    'segment_type': current_segment_type,
+                    'map_type': segment_map_type
+                }
+            return None
 
         with open(map_path, 'r', encoding='utf-8') as f:
             for line in f:
@@ -321,63 +369,81 @@ class HmsGeo:
                     continue
 
                 # Identify map type
+                # A new MapGeo section also ends the previous segment
                 if line.startswith('MapGeo:'):
-                    map_type = line.split(':', 1)[1].strip()
-                    current_map_type = map_type
-                    logger.debug(f"Processing {map_type}...")
+                    feature = finish()
+                    if feature is not None:
+                        yield feature
+                    current_coordinates = []
+                    keep = False
+                    current_map_type = line.split(':', 1)[1].strip()
+                    logger.debug(f"Processing {current_map_type}...")
                     continue
 
                 # Identify segment type (closed=polygon, open=polyline)
                 if line.startswith('MapSegment:'):
-                    # Save previous segment if it exists
-                    if current_coordinates and current_map_type:
-                        feature = {
-                            'coordinates': current_coordinates.copy(),
-                            'segment_type': current_segment_type,
-                            'map_type': current_map_type
-                        }
-
-                        if current_map_type == 'BoundaryMap':
-                            boundaries.append(feature)
-                        elif current_map_type == 'RiverMap':
-                            rivers.append(feature)
+                    feature = finish()
+                    if feature is not None:
+                        yield feature
 
                     # Start new segment
-                    segment_type = line.split(':', 1)[1].strip()
-                    current_segment_type = segment_type
+                    current_segment_type = line.split(':', 1)[1].strip()
                     current_coordinates = []
+                    segment_map_type = current_map_type
+                    keep = map_types is None or segment_map_type in map_types
                     continue
 
-                # Parse coordinate pairs
-                if ',' in line:
-                    try:
-                        parts = line.split(',')
-                        if len(parts) == 2:
-                            x = float(parts[0].strip())
-                            y = float(parts[1].strip())
-                            current_coordinates.append([x, y])
-                    except (ValueError, IndexError):
-                        # Skip invalid coordinate lines (common in HMS map files)
-                        continue
+                # Parse coordinate pairs (skipped for filtered-out segments)
+                if keep and ',' in line:
+                    parts = line.split(',')
+                    if len(parts) == 2:
+                        try:
+                            current_coordinates.append([float(parts[0]), float(parts[1])])
+                        except ValueError:
+                            # Skip invalid coordinate lines (common in HMS map files)
+                            continue
 
         # Don't forget the last segment
-        if current_coordinates and current_map_type:
-            feature = {
-                'coordinates': current_coordinates.copy(),
-                'segment_type': current_segment_type,
-                'map_type': current_map_type
-            }
+        feature = finish()
+        if feature is not None:
+            yield feature
 
-            if current_map_type == 'BoundaryMap':
-                boundaries.append(feature)
-            elif current_map_type == 'RiverMap':
-                rivers.append(feature)
+    @staticmethod
+    def get_map_summary(map_path: Union[str, Path]) -> Dict[str, Dict[str, Any]]:
+        """
+        Count segments and points per map type in one streaming pass.
 
-        logger.info(f"Found {len(boundaries)} boundaries, {len(rivers)} rivers")
-        return {
-            'boundaries': boundaries,
-            'rivers': rivers
-        }
+        Args:
+            map_path: Path to the .map file
+
+        Returns:
+            Dictionary keyed by map type with 'num_segments', 'num_points'
+            and 'bounds' (min_x, min_y, max_x, max_y)
+
+        Example:
+            >>> summary = HmsGeo.get_map_summary("model.map")
+            >>> print(summary['BoundaryMap']['num_segments'])
+        """
+        summary: Dict[str, Dict[str, Any]] = {}
+        for feature in HmsGeo.iter_map_segments(map_path):
+            entry = summary.setdefault(feature['map_type'], {
+                'num_segments': 0,
+                'num_points': 0,
+                'bounds': [float('inf'), float('inf'), float('-inf'), float('-inf')],
+            })
+            xs = [c[0] for c in feature['coordinates']]
+            ys = [c[1] for c in feature['coordinates']]
+            bounds = entry['bounds']
+            entry['num_segments'] += 1
+            entry['num_points'] += len(xs)
+            entry['bounds'] = [
+                min(bounds[0], min(xs)), min(bounds[1], min(ys)),
+                max(bounds[2], max(xs)), max(bounds[3], max(ys)),
+            ]
+
+        for entry in summary.values():
+            entry['bounds'] = tuple(entry['bounds'])
+        return summary
 
     @staticmethod
     def create_geojson_subbasins(subbasins: Dict[str, Dict[str, Any]],
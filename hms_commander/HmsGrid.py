@@ -26,11 +26,12 @@ Dependencies:
         - xarray: NetCDF grid handling
         - pandas: Data manipulation
         - numpy: Numerical operations
+        - scipy: Sparse weight matrices (get_weight_matrix)
 
     Install with:
         pip install hms-commander[gis]
         # OR
-        pip install geopandas shapely xarray pandas numpy
+        pip install geopandas shapely xarray pandas numpy scipy
 
 Example:
     >>> from hms_commander import HmsGrid, HmsHuc, HmsAorc
@@ -67,6 +68,7 @@ Notes:
 from pathlib import Path
 from typing import Union, Optional, Tuple, Dict, List
 from datetime import datetime
+import hashlib
 import logging
 import re
 
@@ -104,6 +106,16 @@ class HmsGrid:
         ... )
     """
 
+    MAPPING_METHODS = ("intersection", "centroid", "nearest")
+
+    HRAPCELLS_DTYPE = [
+        ('subbasin_id', '<i4'),
+        ('x', '<i4'),
+        ('y', '<i4'),
+        ('travel_length', '<f8'),
+        ('area', '<f8'),
+    ]
+
     @staticmethod
     @log_call
     def create_grid_definition(
@@ -211,8 +223,10 @@ End:
         output_hrapcells: Union[str, Path],
         outlet_points: Optional[Dict[str, Tuple[float, float]]] = None,
         cell_size_km: Optional[float] = None,
-        grid_origin: Optional[Tuple[int, int]] = None
-    ) -> Path:
+        grid_origin: Optional[Tuple[int, int]] = None,
+        method: str = "intersection",
+        return_area_report: bool = False
+    ) -> Union[Path, Tuple[Path, 'pd.DataFrame']]:
         """
         Generate grid cell mapping file (hrapcells format).
 
@@ -234,11 +248,27 @@ End:
             Grid cell size in km. If None, calculated from coordinates.
         grid_origin : Tuple[int, int], optional
             Grid index origin (x_min, y_min). If None, calculated from coordinates.
+        method : str, default "intersection"
+            Mapping method:
+                - "intersection": Exact cell/polygon intersection areas
+                - "centroid": Cells whose center lies inside the subbasin,
+                  each counted with its full area (fast, screening level)
+                - "nearest": Every cell touching any subbasin is assigned,
+                  with its full area, to the subbasin nearest its center
+            With "centroid" and "nearest", a subbasin that is assigned no
+            cell gets the cell nearest to its representative point,
+            weighted by its polygon area.
+        return_area_report : bool, default False
+            If True, also return a per-subbasin area report (see Returns).
 
         Returns
         -------
-        Path
-            Path to created hrapcells file
+        Path or (Path, DataFrame)
+            Path to created hrapcells file. With return_area_report=True, a
+            tuple of the path and a DataFrame with columns: subbasin,
+            num_cells, exact_area_km2, mapped_area_km2, area_error_km2,
+            area_error_pct (mapped area versus the "intersection" mapping
+            of the same grid; zero for method="intersection").
 
         Examples
         --------
@@ -274,17 +304,24 @@ End:
         """
         try:
             import numpy as np
-            from shapely.geometry import box, Point
+            import shapely
         except ImportError:
             raise ImportError(
                 "HmsGrid.map_grid_to_subbasins() requires geopandas and shapely.\n"
                 "Install with: pip install hms-commander[gis]"
             )
 
+        if method not in HmsGrid.MAPPING_METHODS:
+            raise ValueError(
+                f"Invalid method '{method}'. Valid methods: {HmsGrid.MAPPING_METHODS}"
+            )
+
         output_path = Path(output_hrapcells)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         lon_coords, lat_coords = grid_coords
+        lon_coords = np.asarray(lon_coords, dtype=float)
+        lat_coords = np.asarray(lat_coords, dtype=float)
         n_lon = len(lon_coords)
         n_lat = len(lat_coords)
 
@@ -312,72 +349,502 @@ End:
         else:
             x_origin, y_origin = grid_origin
 
-        # Build output content
-        lines = []
-        lines.append("Parameter Order: xCoord yCoord TravelLength Area")
-        lines.append("End:")
-
-        total_cells = 0
+        names = list(subbasin_geometries)
+        sub_idx, i_lon, i_lat, fraction = HmsGrid._cell_fractions(
+            list(subbasin_geometries.values()), lon_coords, lat_coords, d_lon, d_lat, method
+        )
 
-        for subbasin_name, subbasin_geom in subbasin_geometries.items():
-            subbasin_lines = []
+        # Only include cells with meaningful area (threshold: 0.001 km²)
+        area_km2 = fraction * cell_area_km2
+        keep = area_km2 > 0.001
+        sub_idx, i_lon, i_lat, area_km2 = sub_idx[keep], i_lon[keep], i_lat[keep], area_km2[keep]
 
-            # Determine outlet point for travel length calculation
+        # Travel length: Euclidean distance from cell center to subbasin outlet
+        outlets = np.empty((len(names), 2))
+        for k, (subbasin_name, subbasin_geom) in enumerate(subbasin_geometries.items()):
             if outlet_points and subbasin_name in outlet_points:
-                outlet_lon, outlet_lat = outlet_points[subbasin_name]
+                outlets[k] = outlet_points[subbasin_name]
             else:
                 # Use centroid as outlet (approximation)
                 centroid = subbasin_geom.centroid
-                outlet_lon, outlet_lat = centroid.x, centroid.y
-
-            # Iterate through grid cells
-            for i_lon, lon in enumerate(lon_coords):
-                for i_lat, lat in enumerate(lat_coords):
-                    # Create grid cell polygon
-                    cell_minx = lon - d_lon / 2
-                    cell_maxx = lon + d_lon / 2
-                    cell_miny = lat - d_lat / 2
-                    cell_maxy = lat + d_lat / 2
-                    cell_poly = box(cell_minx, cell_miny, cell_maxx, cell_maxy)
-
-                    # Check intersection with subbasin
-                    if subbasin_geom.intersects(cell_poly):
-                        intersection = subbasin_geom.intersection(cell_poly)
-
-                        # Calculate area of intersection in km²
-                        # Use fraction of cell area based on intersection fraction
-                        cell_fraction = intersection.area / cell_poly.area
-                        area_km2 = cell_fraction * cell_area_km2
-
-                        # Only include cells with meaningful area
-                        if area_km2 > 0.001:  # Threshold: 0.001 km²
-                            # Calculate travel length (Euclidean distance to outlet)
-                            cell_center = Point(lon, lat)
-                            dx_km = (lon - outlet_lon) * km_per_deg_lon
-                            dy_km = (lat - outlet_lat) * km_per_deg_lat
-                            travel_length_km = np.sqrt(dx_km**2 + dy_km**2)
-
-                            # Grid indices (HRAP-style)
-                            x_idx = x_origin + i_lon
-                            y_idx = y_origin + i_lat
-
-                            subbasin_lines.append(
-                                f"GRIDCELL:  {x_idx}  {y_idx}  {travel_length_km:.2f}  {area_km2:.2f}"
-                            )
-                            total_cells += 1
-
-            # Add subbasin section if it has cells
-            if subbasin_lines:
-                lines.append(f"SUBBASIN:  {subbasin_name}")
-                lines.extend(subbasin_lines)
-                lines.append("END:")
+                outlets[k] = (centroid.x, centroid.y)
 
-        # Write file
-        content = "\n".join(lines) + "\n"
-        output_path.write_text(content, encoding='utf-8')
-        logger.info(f"Created hrapcells file: {output_path} ({total_cells} cells)")
+        dx_km = (lon_coords[i_lon] - outlets[sub_idx, 0]) * km_per_deg_lon
+        dy_km = (lat_coords[i_lat] - outlets[sub_idx, 1]) * km_per_deg_lat
+        travel_length_km = np.sqrt(dx_km**2 + dy_km**2)
 
-        return output_path
+        # Grid indices (HRAP-style)
+        x_idx = x_origin + i_lon
+        y_idx = y_origin + i_lat
+
+        # Only subbasins that have cells get a section in the file
+        mapped, section_idx = np.unique(sub_idx, return_inverse=True)
+        cells = np.empty(len(sub_idx), dtype=HmsGrid.HRAPCELLS_DTYPE)
+        cells['subbasin_id'] = section_idx
+        cells['x'] = x_idx
+        cells['y'] = y_idx
+        cells['travel_length'] = travel_length_km
+        cells['area'] = area_km2
+
+        HmsGrid.write_hrapcells_array(output_path, cells, [names[k] for k in mapped])
+        logger.info(f"Created hrapcells file: {output_path} ({len(cells)} cells)")
+
+        if not return_area_report:
+            return output_path
+
+        if method == "intersection":
+            exact_km2 = np.bincount(sub_idx, weights=area_km2, minlength=len(names))
+        else:
+            # Reference: exact intersection areas on the same grid
+            exact_idx, _, _, exact_fraction = HmsGrid._cell_fractions(
+                list(subbasin_geometries.values()), lon_coords, lat_coords, d_lon, d_lat, "intersection"
+            )
+            exact_km2 = np.bincount(exact_idx, weights=exact_fraction * cell_area_km2, minlength=len(names))
+
+        report = HmsGrid._area_report(names, sub_idx, area_km2, exact_km2)
+        if method != "intersection" and len(report):
+            logger.info(
+                f"{method} mapping area error vs intersection: "
+                f"max {report['area_error_pct'].abs().max():.1f}%, "
+                f"total {report['area_error_km2'].sum():.2f} km²"
+            )
+        return output_path, report
+
+    @staticmethod
+    def _area_report(
+        names: List[str],
+        sub_idx: 'np.ndarray',
+        area_km2: 'np.ndarray',
+        exact_km2: 'np.ndarray'
+    ) -> 'pd.DataFrame':
+        """Per-subbasin mapped area versus the exact (intersection) area."""
+        import numpy as np
+        import pandas as pd
+
+        mapped_km2 = np.bincount(sub_idx, weights=area_km2, minlength=len(names))
+        error_km2 = mapped_km2 - exact_km2
+        with np.errstate(divide='ignore', invalid='ignore'):
+            error_pct = np.where(exact_km2 > 0, 100.0 * error_km2 / exact_km2, np.nan)
+
+        return pd.DataFrame({
+            'subbasin': names,
+            'num_cells': np.bincount(sub_idx, minlength=len(names)),
+            'exact_area_km2': exact_km2,
+            'mapped_area_km2': mapped_km2,
+            'area_error_km2': error_km2,
+            'area_error_pct': error_pct,
+        })
+
+    @staticmethod
+    def _cell_fractions(
+        geometries: List['shapely.geometry.Polygon'],
+        lon_coords: 'np.ndarray',
+        lat_coords: 'np.ndarray',
+        d_lon: float,
+        d_lat: float,
+        method: str = "intersection"
+    ) -> Tuple['np.ndarray', 'np.ndarray', 'np.ndarray', 'np.ndarray']:
+        """
+        Fraction of each grid cell covered by each geometry.
+
+        Candidate cells are pruned per geometry by bounding box on the
+        regular grid. For "intersection", cells fully inside are accepted
+        with a single vectorized contains() test, and exact intersection
+        areas are computed (again vectorized, shapely 2.x) only for cells on
+        the boundary. For "centroid", a vectorized point-in-polygon test
+        over the candidate cell centers replaces the polygon overlay; for
+        "nearest", see _nearest_cell_fractions (area rules in
+        map_grid_to_subbasins).
+
+        Returns:
+            Arrays (geometry_index, lon_index, lat_index, fraction) for every
+            intersecting cell, ordered by geometry, then longitude, then latitude
+        """
+        import numpy as np
+        import shapely
+
+        if method == "nearest":
+            return HmsGrid._nearest_cell_fractions(geometries, lon_coords, lat_coords, d_lon, d_lat)
+
+        half_lon, half_lat = d_lon / 2, d_lat / 2
+        cell_area = d_lon * d_lat
+        parts = []
+
+        for k, geom in enumerate(geometries):
+            minx, miny, maxx, maxy = geom.bounds
+            cand_lon = np.flatnonzero((lon_coords + half_lon >= minx) & (lon_coords - half_lon <= maxx))
+            cand_lat = np.flatnonzero((lat_coords + half_lat >= miny) & (lat_coords - half_lat <= maxy))
+            if cand_lon.size == 0 or cand_lat.size == 0:
+                continue
+
+            i_lon, i_lat = (a.ravel() for a in np.meshgrid(cand_lon, cand_lat, indexing='ij'))
+            cx, cy = lon_coords[i_lon], lat_coords[i_lat]
+            shapely.prepare(geom)
+
+            if method == "intersection":
+                cells = shapely.box(cx - half_lon, cy - half_lat, cx + half_lon, cy + half_lat)
+                fraction = np.zeros(len(cells))
+                inside = shapely.contains(geom, cells)
+                fraction[inside] = 1.0
+                edge = ~inside & shapely.intersects(geom, cells)
+                if edge.any():
+                    fraction[edge] = shapely.area(shapely.intersection(geom, cells[edge])) / cell_area
+            else:
+                fraction = shapely.contains_xy(geom, cx, cy).astype(float)
+                if not fraction.any():
+                    # Subbasin smaller than a cell: use the nearest cell center
+                    i_lon, i_lat, fraction = HmsGrid._representative_cell(geom, lon_coords, lat_coords, cell_area)
+
+            hit = fraction > 0
+            parts.append((np.full(hit.sum(), k), i_lon[hit], i_lat[hit], fraction[hit]))
+
+        if not parts:
+            empty = np.array([], dtype=np.intp)
+            return empty, empty, empty, np.array([], dtype=float)
+        return tuple(np.concatenate(arrays) for arrays in zip(*parts))
+
+    @staticmethod
+    def _representative_cell(
+        geom: 'shapely.geometry.Polygon',
+        lon_coords: 'np.ndarray',
+        lat_coords: 'np.ndarray',
+        cell_area: float
+    ) -> Tuple['np.ndarray', 'np.ndarray', 'np.ndarray']:
+        """Cell nearest the geometry's representative point, weighted by its area."""
+        import numpy as np
+
+        point = geom.representative_point()
+        return (
+            np.array([np.abs(lon_coords - point.x).argmin()]),
+            np.array([np.abs(lat_coords - point.y).argmin()]),
+            np.array([geom.area / cell_area]),
+        )
+
+    @staticmethod
+    def _nearest_cell_fractions(
+        geometries: List['shapely.geometry.Polygon'],
+        lon_coords: 'np.ndarray',
+        lat_coords: 'np.ndarray',
+        d_lon: float,
+        d_lat: float
+    ) -> Tuple['np.ndarray', 'np.ndarray', 'np.ndarray', 'np.ndarray']:
+        """
+        Nearest-subbasin assignment of every cell touching any geometry.
+
+        An STRtree finds the cells that intersect a geometry and, for each,
+        the geometry nearest its center (distance 0 when the center is
+        inside); the cell is assigned to that geometry with fraction 1.
+        Geometries on the grid left without a cell get their representative
+        cell.
+
+        Returns:
+            Arrays (geometry_index, lon_index, lat_index, fraction), ordered
+            like _cell_fractions
+        """
+        import numpy as np
+        import shapely
+
+        half_lon, half_lat = d_lon / 2, d_lat / 2
+        geoms = np.asarray(geometries, dtype=object)
+        minx, miny, maxx, maxy = shapely.total_bounds(geoms)
+        cand_lon = np.flatnonzero((lon_coords + half_lon >= minx) & (lon_coords - half_lon <= maxx))
+        cand_lat = np.flatnonzero((lat_coords + half_lat >= miny) & (lat_coords - half_lat <= maxy))
+        i_lon, i_lat = (a.ravel() for a in np.meshgrid(cand_lon, cand_lat, indexing='ij'))
+        cx, cy = lon_coords[i_lon], lat_coords[i_lat]
+
+        tree = shapely.STRtree(geoms)
+        cells = shapely.box(cx - half_lon, cy - half_lat, cx + half_lon, cy + half_lat)
+        touching = np.unique(tree.query(cells, predicate='intersects')[0])
+        i_lon, i_lat = i_lon[touching], i_lat[touching]
+
+        # Ties (center on a shared boundary) go to the lowest geometry index
+        cell_idx, geom_idx = tree.query_nearest(shapely.points(cx[touching], cy[touching]), all_matches=True)
+        sub_idx = np.full(len(touching), len(geoms), dtype=np.intp)
+        np.minimum.at(sub_idx, cell_idx, geom_idx)
+        fraction = np.ones(len(touching))
+
+        # Unassigned geometries inside the grid extent (as with "centroid")
+        extent = shapely.box(
+            lon_coords.min() - half_lon, lat_coords.min() - half_lat,
+            lon_coords.max() + half_lon, lat_coords.max() + half_lat
+        )
+        missing = np.setdiff1d(np.flatnonzero(shapely.intersects(geoms, extent)), sub_idx)
+        if missing.size:
+            extra = [HmsGrid._representative_cell(geoms[k], lon_coords, lat_coords, d_lon * d_lat) for k in missing]
+            sub_idx = np.concatenate([sub_idx, missing])
+            i_lon = np.concatenate([i_lon] + [e[0] for e in extra])
+            i_lat = np.concatenate([i_lat] + [e[1] for e in extra])
+            fraction = np.concatenate([fraction] + [e[2] for e in extra])
+
+        order = np.lexsort((i_lat, i_lon, sub_idx))
+        return sub_idx[order], i_lon[order], i_lat[order], fraction[order]
+
+    @staticmethod
+    @log_call
+    def get_weight_matrix(
+        subbasin_geometries: Dict[str, 'shapely.geometry.Polygon'],
+        grid_coords: Tuple['np.ndarray', 'np.ndarray'],
+        method: str = "intersection",
+        cache_file: Optional[Union[str, Path]] = None
+    ) -> Tuple['scipy.sparse.csr_matrix', List[str]]:
+        """
+        Build (or load) a sparse subbasin x grid-cell area-weight matrix.
+
+        Uses the same cell/polygon mapping as map_grid_to_subbasins(). Row k
+        holds the area fractions of subbasin k over the flattened grid,
+        normalized to sum to 1, so multiplying by a flattened (lat, lon)
+        field gives the area-weighted subbasin average.
+
+        Parameters
+        ----------
+        subbasin_geometries : Dict[str, Polygon]
+            Dictionary mapping subbasin names to Shapely Polygon geometries
+        grid_coords : Tuple[np.ndarray, np.ndarray]
+            Tuple of (longitude_array, latitude_array) of grid cell centers
+        method : str, default "intersection"
+            Mapping method ("intersection", "centroid" or "nearest")
+        cache_file : str or Path, optional
+            .npz file to load the matrix from when it was built for the same
+            subbasin names and geometries (compared by a digest of their
+            WKB), grid and method, and to save it to otherwise.
+
+        Returns
+        -------
+        Tuple[scipy.sparse.csr_matrix, List[str]]
+            Weight matrix of shape (n_subbasins, n_lat * n_lon), with cells
+            flattened in (lat, lon) row-major order, and the subbasin names
+            in row order
+
+        Examples
+        --------
+        >>> weights, names = HmsGrid.get_weight_matrix(
+        ...     geoms, (lon, lat), cache_file="grids/aorc_weights.npz"
+        ... )
+        >>> df = HmsGrid.subbasin_average(precip, weights, names, time_index=times)
+        """
+        try:
+            import numpy as np
+            import scipy.sparse as sp
+        except ImportError:
+            raise ImportError(
+                "HmsGrid.get_weight_matrix() requires scipy.\n"
+                "Install with: pip install hms-commander[gis]"
+            )
+
+        if method not in HmsGrid.MAPPING_METHODS:
+            raise ValueError(
+                f"Invalid method '{method}'. Valid methods: {HmsGrid.MAPPING_METHODS}"
+            )
+
+        names = [str(name) for name in subbasin_geometries]
+        geometry_digest = HmsGrid._geometry_digest(list(subbasin_geometries.values()))
+        lon_coords = np.asarray(grid_coords[0], dtype=float)
+        lat_coords = np.asarray(grid_coords[1], dtype=float)
+        n_cells = len(lat_coords) * len(lon_coords)
+
+        cache_path = Path(cache_file) if cache_file else None
+        if cache_path is not None and cache_path.exists():
+            with np.load(cache_path, allow_pickle=False) as cached:
+                if (
+                    str(cached['method']) == method
+                    and cached['names'].tolist() == names
+                    and 'geometry_digest' in cached.files
+                    and str(cached['geometry_digest']) == geometry_digest
+                    and np.array_equal(cached['lon'], lon_coords)
+                    and np.array_equal(cached['lat'], lat_coords)
+                ):
+                    weights = sp.csr_matrix(
+                        (cached['data'], cached['indices'], cached['indptr']),
+                        shape=(len(names), n_cells)
+                    )
+                    logger.info(f"Loaded weight matrix from cache: {cache_path}")
+                    return weights, names
+            logger.info(f"Weight matrix cache is stale, rebuilding: {cache_path}")
+
+        d_lon = abs(lon_coords[1] - lon_coords[0]) if len(lon_coords) > 1 else 0.01
+        d_lat = abs(lat_coords[1] - lat_coords[0]) if len(lat_coords) > 1 else 0.01
+        sub_idx, i_lon, i_lat, fraction = HmsGrid._cell_fractions(
+            list(subbasin_geometries.values()), lon_coords, lat_coords, d_lon, d_lat, method
+        )
+
+        weights = sp.csr_matrix(
+            (fraction, (sub_idx, i_lat * len(lon_coords) + i_lon)),
+            shape=(len(names), n_cells)
+        )
+        row_sums = np.asarray(weights.sum(axis=1)).ravel()
+        with np.errstate(divide='ignore'):
+            weights = sp.diags(np.where(row_sums > 0, 1.0 / row_sums, 0.0)) @ weights
+        weights = weights.tocsr()
+
+        empty = [name for name, total in zip(names, row_sums) if total == 0]
+        if empty:
+            logger.warning(f"{len(empty)} subbasins do not overlap the grid: {empty[:5]}")
+
+        if cache_path is not None:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            np.savez(
+                cache_path,
+                data=weights.data, indices=weights.indices, indptr=weights.indptr,
+                names=np.array(names), lon=lon_coords, lat=lat_coords, method=np.array(method),
+                geometry_digest=np.array(geometry_digest)
+            )
+            logger.info(f"Saved weight matrix cache: {cache_path}")
+
+        logger.info(f"Built {weights.shape[0]} x {weights.shape[1]} weight matrix ({weights.nnz} cells)")
+        return weights, names
+
+    @staticmethod
+    def _geometry_digest(geometries: List['shapely.geometry.Polygon']) -> str:
+        """SHA-1 of the geometries' WKB, to detect edited subbasins in caches."""
+        import numpy as np
+        import shapely
+
+        digest = hashlib.sha1()
+        for wkb in shapely.to_wkb(np.asarray(geometries, dtype=object)):
+            digest.update(wkb)
+        return digest.hexdigest()
+
+    @staticmethod
+    def weights_from_hrapcells(
+        hrapcells_file: Union[str, Path],
+        grid_shape: Tuple[int, int],
+        grid_origin: Tuple[int, int] = (600, 300)
+    ) -> Tuple['scipy.sparse.csr_matrix', List[str]]:
+        """
+        Build a subbasin x grid-cell weight matrix from an hrapcells file.
+
+        The inverse of map_grid_to_subbasins(): cell (x, y) is taken as grid
+        index (x - x_origin, y - y_origin), and each subbasin's cell areas are
+        normalized to sum to 1.
+
+        Parameters
+        ----------
+        hrapcells_file : str or Path
+            hrapcells file written for the grid
+        grid_shape : Tuple[int, int]
+            Grid shape as (n_lat, n_lon)
+        grid_origin : Tuple[int, int], default (600, 300)
+            Grid index origin (x_min, y_min) the file was written with
+
+        Returns
+        -------
+        Tuple[scipy.sparse.csr_matrix, List[str]]
+            Weight matrix laid out as in get_weight_matrix() and the
+            subbasin names in row order
+
+        Raises
+        ------
+        ValueError
+            If a cell falls outside the grid
+
+        Examples
+        --------
+        >>> weights, names = HmsGrid.weights_from_hrapcells(
+        ...     "regions/hrapcells", (len(lat), len(lon))
+        ... )
+        """
+        try:
+            import numpy as np
+            import scipy.sparse as sp
+        except ImportError:
+            raise ImportError(
+                "HmsGrid.weights_from_hrapcells() requires scipy.\n"
+                "Install with: pip install hms-commander[gis]"
+            )
+
+        cells, names = HmsGrid.read_hrapcells_array(hrapcells_file)
+        n_lat, n_lon = grid_shape
+        i_lon = cells['x'] - grid_origin[0]
+        i_lat = cells['y'] - grid_origin[1]
+        outside = (i_lon < 0) | (i_lon >= n_lon) | (i_lat < 0) | (i_lat >= n_lat)
+        if outside.any():
+            raise ValueError(
+                f"{int(outside.sum())} hrapcells cells fall outside the {n_lat} x {n_lon} grid "
+                f"with origin {grid_origin}"
+            )
+
+        weights = sp.csr_matrix(
+            (cells['area'], (cells['subbasin_id'], i_lat * n_lon + i_lon)),
+            shape=(len(names), n_lat * n_lon)
+        )
+        row_sums = np.asarray(weights.sum(axis=1)).ravel()
+        with np.errstate(divide='ignore'):
+            weights = sp.diags(np.where(row_sums > 0, 1.0 / row_sums, 0.0)) @ weights
+        return weights.tocsr(), names
+
+    @staticmethod
+    def subbasin_average(
+        data: Union['np.ndarray', 'xr.DataArray'],
+        weights: 'scipy.sparse.csr_matrix',
+        subbasin_names: Optional[List[str]] = None,
+        time_index: Optional[Union[List, 'pd.Index']] = None,
+        chunk_size: int = 2048
+    ) -> 'pd.DataFrame':
+        """
+        Area-weighted subbasin averages of gridded data via sparse matmul.
+
+        Parameters
+        ----------
+        data : np.ndarray or xr.DataArray
+            Array of shape (time, lat, lon), or a single (lat, lon) field,
+            on the grid used to build weights. NaN cells are excluded and the
+            remaining weights renormalized.
+        weights : scipy.sparse.csr_matrix
+            Matrix from get_weight_matrix()
+        subbasin_names : List[str], optional
+            Column names (default: "0", "1", ...)
+        time_index : list or pd.Index, optional
+            Row index. Defaults to the 'time' coordinate of a DataArray.
+        chunk_size : int, default 2048
+            Time steps multiplied per sparse product (bounds temporary memory)
+
+        Returns
+        -------
+        pd.DataFrame
+            Subbasin averages with one row per time step and one column per
+            subbasin
+
+        Examples
+        --------
+        >>> ds = xr.open_dataset("aorc.nc")
+        >>> weights, names = HmsGrid.get_weight_matrix(geoms, (ds.longitude, ds.latitude))
+        >>> df = HmsGrid.subbasin_average(ds['APCP_surface'], weights, names)
+        """
+        import numpy as np
+        import pandas as pd
+
+        if time_index is None and hasattr(data, 'coords') and 'time' in data.coords:
+            time_index = pd.Index(data['time'].values, name='time')
+        values = np.asarray(data.values if hasattr(data, 'values') else data)
+        if values.ndim == 2:
+            values = values[np.newaxis]
+        n_time = values.shape[0]
+        flat = values.reshape(n_time, -1)
+        if flat.shape[1] != weights.shape[1]:
+            raise ValueError(
+                f"Grid has {flat.shape[1]} cells but weight matrix expects {weights.shape[1]}"
+            )
+
+        # Only cells that carry weight are gathered; the product then runs on
+        # a small, contiguous (cells, time) block instead of the full grid.
+        weights = weights.tocsr()
+        used = np.unique(weights.indices)
+        weights = weights[:, used]
+
+        result = np.empty((n_time, weights.shape[0]))
+        for start in range(0, n_time, chunk_size):
+            block = np.ascontiguousarray(flat[start:start + chunk_size, used].T, dtype=float)
+            valid = ~np.isnan(block)
+            if valid.all():
+                result[start:start + chunk_size] = (weights @ block).T
+                continue
+            total = weights @ np.where(valid, block, 0.0)
+            covered = weights @ valid.astype(float)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                result[start:start + chunk_size] = np.where(covered > 0, total / covered, np.nan).T
+
+        columns = subbasin_names if subbasin_names is not None else [str(i) for i in range(weights.shape[0])]
+        return pd.DataFrame(result, index=time_index, columns=columns)
 
     @staticmethod
     @log_call
@@ -386,8 +853,9 @@ End:
         aorc_grid: Union[str, Path],
         output_hrapcells: Union[str, Path],
         subbasin_name: Optional[str] = None,
-        method: str = "intersection"
-    ) -> Path:
+        method: str = "intersection",
+        return_area_report: bool = False
+    ) -> Union[Path, Tuple[Path, 'pd.DataFrame']]:
         """
         Generate grid cell mapping file from AORC NetCDF (hrapcells format).
 
@@ -411,12 +879,15 @@ End:
             Mapping method:
                 - "intersection": Spatial intersection (exact, slow)
                 - "centroid": Grid cell centroid within subbasin (fast)
-                - "nearest": Nearest grid cell (approximate)
+                - "nearest": Every touching cell assigned to its nearest subbasin
+            See map_grid_to_subbasins() for details.
+        return_area_report : bool, default False
+            If True, also return the per-subbasin area report.
 
         Returns
         -------
-        Path
-            Path to created hrapcells file
+        Path or (Path, DataFrame)
+            Path to created hrapcells file, plus the area report if requested
 
         Examples
         --------
@@ -493,7 +964,9 @@ End:
         return HmsGrid.map_grid_to_subbasins(
             subbasin_geometries=geometries,
             grid_coords=(lon_coords, lat_coords),
-            output_hrapcells=output_hrapcells
+            output_hrapcells=output_hrapcells,
+            method=method,
+            return_area_report=return_area_report
         )
 
     @staticmethod
@@ -674,6 +1147,9 @@ End:
         """
         Read grid cell mapping from hrapcells file.
 
+        For large files prefer read_hrapcells_array(), which avoids building
+        one dict per cell.
+
         Parameters
         ----------
         hrapcells_file : str or Path
@@ -698,39 +1174,192 @@ End:
         >>> print(f"Subbasins: {list(cells.keys())}")
         >>> print(f"Cells in first subbasin: {len(cells['85'])}")
         """
+        cells, names = HmsGrid.read_hrapcells_array(hrapcells_file, use_cache=False)
+
+        result = {}
+        order = cells['subbasin_id'].argsort(kind='stable')
+        cells = cells[order]
+        bounds = cells['subbasin_id'].searchsorted(range(len(names) + 1))
+        for k, name in enumerate(names):
+            section = cells[bounds[k]:bounds[k + 1]]
+            result[name] = [
+                {'x': x, 'y': y, 'travel_length': t, 'area': a}
+                for x, y, t, a in zip(
+                    section['x'].tolist(), section['y'].tolist(),
+                    section['travel_length'].tolist(), section['area'].tolist()
+                )
+            ]
+
+        logger.info(f"Read hrapcells: {hrapcells_file} ({len(result)} subbasins)")
+        return result
+
+    @staticmethod
+    @log_call
+    def read_hrapcells_array(
+        hrapcells_file: Union[str, Path],
+        use_cache: bool = True
+    ) -> Tuple['np.ndarray', List[str]]:
+        """
+        Read an hrapcells file into a structured array and a name table.
+
+        Each SUBBASIN section is converted with a single NumPy call rather
+        than line by line. With use_cache=True the result is stored in a
+        binary sidecar (<file>.npz) and reused while the text file's size and
+        modification time are unchanged, so repeated loads of large
+        (e.g. CONUS-scale) files take milliseconds.
+
+        Parameters
+        ----------
+        hrapcells_file : str or Path
+            Path to hrapcells file
+        use_cache : bool, default True
+            Read/write the binary sidecar cache
+
+        Returns
+        -------
+        Tuple[np.ndarray, List[str]]
+            Structured array with fields subbasin_id, x, y, travel_length,
+            area (HRAPCELLS_DTYPE), in file order, and the subbasin names
+            indexed by subbasin_id
+
+        Raises
+        ------
+        FileNotFoundError
+            If the file does not exist
+
+        Examples
+        --------
+        >>> cells, names = HmsGrid.read_hrapcells_array("regions/hrapcells")
+        >>> area = np.bincount(cells['subbasin_id'], weights=cells['area'])
+        >>> dict(zip(names, area))
+        """
+        import numpy as np
+
         hrapcells_path = Path(hrapcells_file)
         if not hrapcells_path.exists():
             raise FileNotFoundError(f"hrapcells file not found: {hrapcells_path}")
 
+        stat = hrapcells_path.stat()
+        cache_path = hrapcells_path.with_name(hrapcells_path.name + '.npz')
+        if use_cache and cache_path.exists():
+            try:
+                with np.load(cache_path, allow_pickle=False) as cached:
+                    if (int(cached['source_size']) == stat.st_size
+                            and int(cached['source_mtime_ns']) == stat.st_mtime_ns):
+                        return cached['cells'], cached['names'].tolist()
+            except (OSError, KeyError, ValueError) as e:
+                logger.debug(f"Ignoring unreadable hrapcells cache {cache_path}: {e}")
+
         content = hrapcells_path.read_text(encoding='utf-8')
-        lines = content.strip().split('\n')
+        names = []
+        parts = []
+        headers = list(re.finditer(r'SUBBASIN:[ \t]*([^\r\n]*)', content))
+        for k, header in enumerate(headers):
+            stop = headers[k + 1].start() if k + 1 < len(headers) else len(content)
+            end = content.find('END:', header.end(), stop)
+            section = content[header.end():end if end >= 0 else stop]
+
+            names.append(header.group(1).strip())
+            values = HmsGrid._parse_gridcells(section)
+            part = np.empty(len(values), dtype=HmsGrid.HRAPCELLS_DTYPE)
+            part['subbasin_id'] = k
+            part['x'] = values[:, 0]
+            part['y'] = values[:, 1]
+            part['travel_length'] = values[:, 2]
+            part['area'] = values[:, 3]
+            parts.append(part)
+
+        cells = np.concatenate(parts) if parts else np.empty(0, dtype=HmsGrid.HRAPCELLS_DTYPE)
+
+        if use_cache:
+            try:
+                with open(cache_path, 'wb') as f:
+                    np.savez(
+                        f, cells=cells, names=np.array(names, dtype=str),
+                        source_size=stat.st_size, source_mtime_ns=stat.st_mtime_ns
+                    )
+            except OSError as e:
+                logger.debug(f"Could not write hrapcells cache {cache_path}: {e}")
+
+        logger.info(f"Read hrapcells: {hrapcells_path} ({len(names)} subbasins, {len(cells)} cells)")
+        return cells, names
 
-        result = {}
-        current_subbasin = None
+    @staticmethod
+    def _parse_gridcells(section: str) -> 'np.ndarray':
+        """Parse the GRIDCELL lines of one SUBBASIN section into an (n, 4) array."""
+        import io
+        import numpy as np
+
+        if 'GRIDCELL:' not in section:
+            return np.empty((0, 4))
+        try:
+            return np.loadtxt(io.StringIO(section), usecols=(1, 2, 3, 4), ndmin=2)
+        except ValueError:
+            pass
 
-        for line in lines:
+        # Irregular section (extra columns or stray lines): parse line by line
+        rows = []
+        for line in section.splitlines():
             line = line.strip()
+            if line.startswith('GRIDCELL:'):
+                values = line.split(':', 1)[1].split()
+                if len(values) >= 4:
+                    rows.append([float(v) for v in values[:4]])
+        return np.array(rows, dtype=np.float64).reshape(-1, 4)
 
-            if line.startswith('Parameter Order:') or line.startswith('End:') or line == 'END:':
-                continue
+    @staticmethod
+    @log_call
+    def write_hrapcells_array(
+        output_hrapcells: Union[str, Path],
+        cells: 'np.ndarray',
+        names: List[str]
+    ) -> Path:
+        """
+        Write a structured cell array and name table as an hrapcells file.
 
-            if line.startswith('SUBBASIN:'):
-                current_subbasin = line.split(':', 1)[1].strip()
-                result[current_subbasin] = []
-
-            elif line.startswith('GRIDCELL:') and current_subbasin is not None:
-                parts = line.split(':', 1)[1].strip().split()
-                if len(parts) >= 4:
-                    cell = {
-                        'x': int(parts[0]),
-                        'y': int(parts[1]),
-                        'travel_length': float(parts[2]),
-                        'area': float(parts[3])
-                    }
-                    result[current_subbasin].append(cell)
-
-        logger.info(f"Read hrapcells: {hrapcells_path} ({len(result)} subbasins)")
-        return result
+        Parameters
+        ----------
+        output_hrapcells : str or Path
+            Output hrapcells file path
+        cells : np.ndarray
+            Structured array with HRAPCELLS_DTYPE fields
+        names : List[str]
+            Subbasin names indexed by cells['subbasin_id']. Every name gets
+            a SUBBASIN section, in this order.
+
+        Returns
+        -------
+        Path
+            Path to created hrapcells file
+
+        Examples
+        --------
+        >>> cells, names = HmsGrid.read_hrapcells_array("regions/hrapcells")
+        >>> cells['area'] *= 1.01
+        >>> HmsGrid.write_hrapcells_array("regions/hrapcells_adj", cells, names)
+        """
+        import numpy as np
+
+        output_path = Path(output_hrapcells)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        order = cells['subbasin_id'].argsort(kind='stable')
+        cells = cells[order]
+        bounds = cells['subbasin_id'].searchsorted(np.arange(len(names) + 1))
+
+        fmt = "GRIDCELL:  %d  %d  %.2f  %.2f"
+        lines = ["Parameter Order: xCoord yCoord TravelLength Area", "End:"]
+        for k, name in enumerate(names):
+            section = cells[bounds[k]:bounds[k + 1]]
+            lines.append(f"SUBBASIN:  {name}")
+            lines.extend(map(fmt.__mod__, zip(
+                section['x'].tolist(), section['y'].tolist(),
+                section['travel_length'].tolist(), section['area'].tolist()
+            )))
+            lines.append("END:")
+
+        output_path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+        return output_path
 
     @staticmethod
     def get_info() -> dict:
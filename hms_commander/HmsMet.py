@@ -10,7 +10,8 @@ All methods are static and designed to be used without instantiation.
 
 import re
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Any
+from typing import Dict, List, Optional, Union, Any, Tuple
+import numpy as np
 import pandas as pd
 
 from .LoggingConfig import get_logger
@@ -206,6 +207,9 @@ End:
             f.write(content)
 
         logger.info(f"Set gage '{gage_name}' for subbasin '{subbasin_name}'")
+
+        from .HmsPrj import HmsPrj
+        HmsPrj.notify_file_changed(met_path, subbasin_name, hms_object=hms_object)
         return True
 
     @staticmethod
@@ -439,6 +443,9 @@ End:
             f.write(content)
 
         logger.info(f"Set precipitation method to: {method}")
+
+        from .HmsPrj import HmsPrj
+        HmsPrj.notify_file_changed(met_path, hms_object=hms_object)
         return True
 
     # =========================================================================
@@ -498,7 +505,16 @@ End:
         """
         met_path = Path(met_path)
         content = HmsMet._read_met_file(met_path)
+        params = HmsMet._parse_frequency_storm_params(content)
+        if params['method'] is None:
+            logger.warning(f"No Precip Method Parameters block found in {met_path}")
+        else:
+            logger.info(f"Found {len(params['depths'])} depth values in {met_path.name}")
+        return params
 
+    @staticmethod
+    def _parse_frequency_storm_params(content: str) -> Dict[str, Any]:
+        """Parse Frequency Based Hypothetical parameters from met file content."""
         params = {
             'method': None,
             'exceedance_frequency': None,
@@ -516,7 +532,6 @@ End:
         match = re.search(pattern, content, re.DOTALL)
 
         if not match:
-            logger.warning(f"No Precip Method Parameters block found in {met_path}")
             return params
 
         params['method'] = match.group(1).strip()
@@ -549,9 +564,68 @@ End:
                     except ValueError:
                         pass
 
-        logger.info(f"Found {len(params['depths'])} depth values in {met_path.name}")
         return params
 
+    # Depth lines rewritten by set_precipitation_depths and the scenario generator
+    _DEPTH_LINE_PATTERN = re.compile(r'^(\s*Depth:\s*)[\d.]+\s*$', re.MULTILINE)
+
+    @staticmethod
+    def _build_depth_template(content: str, header_slots: bool = False) -> Tuple[str, int]:
+        """
+        Turn met file content into a str.format template with depth slots.
+
+        Braces in the content are escaped and each Depth line becomes a
+        positional slot ('     Depth: {0:.4f}', ...), so one format() call
+        writes a full file. With header_slots, the Meteorology name and its
+        Description line become {met_name} and {description} slots.
+
+        Returns:
+            Tuple of (template, number of depth slots)
+        """
+        template = content.replace('{', '{{').replace('}', '}}')
+        slot_count = 0
+
+        def depth_slot(match):
+            nonlocal slot_count
+            slot = f"     Depth: {{{slot_count}:.4f}}"
+            slot_count += 1
+            return slot
+
+        template = HmsMet._DEPTH_LINE_PATTERN.sub(depth_slot, template)
+
+        if header_slots:
+            header = re.search(r'^Meteorology:[^\n]*\n.*?^End:', template, re.MULTILINE | re.DOTALL)
+            if header is None:
+                raise ValueError("No Meteorology block found in met file")
+            block = re.sub(r'^Meteorology:[^\n]*', 'Meteorology: {met_name}', header.group(0), count=1)
+            if re.search(r'^\s+Description:', block, re.MULTILINE):
+                block = re.sub(r'^(\s+Description:)[^\n]*', r'\g<1> {description}', block, count=1, flags=re.MULTILINE)
+            else:
+                block = block.replace('Meteorology: {met_name}\n', 'Meteorology: {met_name}\n     Description: {description}\n', 1)
+            template = template[:header.start()] + block + template[header.end():]
+
+        return template, slot_count
+
+    @staticmethod
+    def _write_depths(met_path: Path, content: str, new_depths: List[float]) -> None:
+        """Validate the depth count against content and write the new depths."""
+        existing_depths = HmsMet._parse_frequency_storm_params(content).get('depths', [])
+        if len(new_depths) != len(existing_depths):
+            raise ValueError(
+                f"New depths count ({len(new_depths)}) must match "
+                f"existing count ({len(existing_depths)})"
+            )
+
+        template, slot_count = HmsMet._build_depth_template(content)
+        if slot_count != len(new_depths):
+            raise ValueError(
+                f"Found {slot_count} depth lines but "
+                f"{len(new_depths)} new values provided"
+            )
+
+        with open(met_path, 'w', encoding='utf-8') as f:
+            f.write(template.format(*(float(d) for d in new_depths)))
+
     @staticmethod
     @log_call
     def get_precipitation_depths(
@@ -607,37 +681,12 @@ End:
         """
         met_path = Path(met_path)
         content = HmsMet._read_met_file(met_path)
-
-        # Get existing depths to verify count
-        existing_params = HmsMet.get_frequency_storm_params(met_path)
-        existing_depths = existing_params.get('depths', [])
-
-        if len(new_depths) != len(existing_depths):
-            raise ValueError(
-                f"New depths count ({len(new_depths)}) must match "
-                f"existing count ({len(existing_depths)})"
-            )
-
-        # Find and replace depth lines
-        depth_pattern = r'^(\s*Depth:\s*)[\d.]+\s*$'
-        depth_lines = list(re.finditer(depth_pattern, content, re.MULTILINE))
-
-        if len(depth_lines) != len(new_depths):
-            raise ValueError(
-                f"Found {len(depth_lines)} depth lines but "
-                f"{len(new_depths)} new values provided"
-            )
-
-        # Replace in reverse order to preserve positions
-        for i, match in enumerate(reversed(depth_lines)):
-            idx = len(new_depths) - 1 - i
-            new_line = f"     Depth: {new_depths[idx]:.4f}"
-            content = content[:match.start()] + new_line + content[match.end():]
-
-        with open(met_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        HmsMet._write_depths(met_path, content, new_depths)
 
         logger.info(f"Updated {len(new_depths)} depth values in {met_path.name}")
+
+        from .HmsPrj import HmsPrj
+        HmsPrj.notify_file_changed(met_path, hms_object=hms_object)
         return True
 
     @staticmethod
@@ -668,14 +717,19 @@ End:
         """
         met_path = Path(met_path)
 
-        # Get original values
-        old_depths = HmsMet.get_precipitation_depths(met_path, hms_object)
+        # Get original values (the file is read once for both steps)
+        content = HmsMet._read_met_file(met_path)
+        old_depths = HmsMet._parse_frequency_storm_params(content)['depths']
 
         if not old_depths:
             raise ValueError(f"No precipitation depths found in {met_path}")
 
         # Update depths
-        HmsMet.set_precipitation_depths(met_path, atlas14_depths, hms_object)
+        HmsMet._write_depths(met_path, content, atlas14_depths)
+        logger.info(f"Updated {len(atlas14_depths)} depth values in {met_path.name}")
+
+        from .HmsPrj import HmsPrj
+        HmsPrj.notify_file_changed(met_path, hms_object=hms_object)
 
         # Calculate changes
         changes = []
@@ -698,3 +752,152 @@ End:
             f"Updated {met_path.name}: avg change {result['avg_change_percent']:.1f}%"
         )
         return result
+
+    @staticmethod
+    @log_call
+    def generate_depth_scenarios(
+        template_met: Union[str, Path],
+        depths: Union[pd.DataFrame, np.ndarray],
+        scenario_names: Optional[List[str]] = None,
+        output_dir: Union[str, Path] = None,
+        run_template: Optional[str] = None,
+        description: Optional[str] = None,
+        overwrite: bool = False,
+        hms_object=None
+    ) -> pd.DataFrame:
+        """
+        Write one frequency-storm met file per row of a depth table.
+
+        The template met is parsed once into a format string with a slot per
+        Depth line (plus the Meteorology name and description), so each
+        scenario file is produced by a single format() call instead of a
+        read/regex/write cycle. Optionally clones a run per scenario
+        (HmsRun.clone_runs) and registers the new met models in the project
+        file, each in one write.
+
+        Args:
+            template_met: Name or path of the frequency-storm template met file
+            depths: Table of depth vectors (inches), one row per scenario and
+                one column per Depth line of the template. A DataFrame index is
+                used for the scenario names.
+            scenario_names: Met model names when depths is an array (default:
+                "{template}_{row:03d}")
+            output_dir: Folder for the new met files (default: template folder)
+            run_template: Optional run to clone per scenario; the clone gets
+                the scenario name and points at the scenario met
+            description: Met description (defaults to "Cloned from {template}")
+            overwrite: Overwrite existing met files instead of raising
+            hms_object: Optional HmsPrj instance
+
+        Returns:
+            DataFrame indexed by scenario name with columns met_file and
+            run_name (None without run_template)
+
+        Raises:
+            FileNotFoundError: If the template met is not found
+            FileExistsError: If a scenario met file exists and overwrite is False
+            ValueError: If the depth columns do not match the template's Depth
+                lines or names are not unique
+
+        Example:
+            >>> depths = pd.DataFrame(
+            ...     atlas14_table.to_numpy(), index=[f"1PCT_Site{i:03d}" for i in range(300)]
+            ... )
+            >>> scenarios = HmsMet.generate_depth_scenarios(
+            ...     "1PCT_24HR", depths, run_template="1PCT Run", hms_object=hms
+            ... )
+        """
+        from .HmsPrj import hms
+
+        hms_obj = hms_object or hms
+        project_ready = hms_obj is not None and hms_obj.initialized
+        template_path = Path(template_met)
+
+        if not template_path.exists() and project_ready:
+            matching = hms_obj.met_df[hms_obj.met_df['name'] == str(template_met)]
+            if not matching.empty:
+                template_path = Path(matching.iloc[0]['full_path'])
+        if not template_path.exists() and not template_path.suffix:
+            template_path = template_path.with_suffix('.met')
+        if not template_path.exists():
+            raise FileNotFoundError(f"Template met not found: {template_met}")
+
+        if isinstance(depths, pd.DataFrame):
+            names = [str(name) for name in depths.index]
+            values = depths.to_numpy(dtype=float)
+        else:
+            values = np.atleast_2d(np.asarray(depths, dtype=float))
+            names = (
+                [str(name) for name in scenario_names] if scenario_names is not None
+                else [f"{template_path.stem}_{row:03d}" for row in range(len(values))]
+            )
+        if len(names) != len(values) or len(set(names)) != len(names):
+            raise ValueError("Scenario names must be unique and match the number of depth rows")
+        if not np.isfinite(values).all():
+            raise ValueError("Depth table contains missing or non-finite values")
+
+        template, slot_count = HmsMet._build_depth_template(
+            HmsMet._read_met_file(template_path), header_slots=True
+        )
+        if values.shape[1] != slot_count:
+            raise ValueError(
+                f"Depth table has {values.shape[1]} columns but template "
+                f"{template_path.name} has {slot_count} Depth lines"
+            )
+
+        output_dir = Path(output_dir) if output_dir is not None else template_path.parent
+        output_dir.mkdir(parents=True, exist_ok=True)
+        met_files = [output_dir / f"{name}.met" for name in names]
+        if not overwrite:
+            existing = [p.name for p in met_files if p.exists()]
+            if existing:
+                raise FileExistsError(f"Met files already exist: {existing[:5]}")
+
+        if description is None:
+            description = f"Cloned from {template_path.stem}"
+
+        for name, path, row in zip(names, met_files, values.tolist()):
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(template.format(*row, met_name=name, description=description))
+        logger.info(f"Wrote {len(names)} depth scenarios from {template_path.name}")
+
+        run_names = [None] * len(names)
+        if project_ready:
+            HmsMet._register_mets(hms_obj, names, met_files)
+            if run_template is not None:
+                from .HmsRun import HmsRun
+                HmsRun.clone_runs(
+                    run_template,
+                    pd.DataFrame({'run_name': names, 'met': names}),
+                    hms_object=hms_obj
+                )
+                run_names = names
+        elif run_template is not None:
+            raise RuntimeError("run_template requires an initialized HMS project")
+
+        result = pd.DataFrame({'met_file': [str(p) for p in met_files], 'run_name': run_names}, index=names)
+        result.index.name = 'scenario'
+        return result
+
+    @staticmethod
+    def _register_mets(hms_obj, names: List[str], met_files: List[Path]) -> None:
+        """Append Precipitation blocks for new met models in one project file write."""
+        project_file = Path(hms_obj.project_file)
+        content = HmsFileParser.read_file(project_file)
+        registered = set(hms_obj.met_df['name']) if not hms_obj.met_df.empty else set()
+
+        blocks = []
+        for name, path in zip(names, met_files):
+            if name in registered:
+                continue
+            try:
+                filename = path.resolve().relative_to(Path(hms_obj.project_folder).resolve())
+            except ValueError:
+                filename = path
+            blocks.append(f"Precipitation: {name}\n     Filename: {filename.as_posix()}\nEnd:\n")
+
+        if blocks:
+            with open(project_file, 'w', encoding='utf-8') as f:
+                f.write(content.rstrip('\n') + '\n\n' + '\n'.join(blocks))
+            logger.info(f"Registered {len(blocks)} met models in {project_file.name}")
+        hms_obj.refresh_file(project_file)
@@ -381,41 +381,10 @@ class HmsPrj:
         self.basin_df = pd.DataFrame(records)
 
     def _parse_basin_summary(self, basin_path: Path) -> Dict[str, Any]:
-        """Parse a basin file for summary information."""
-        content = self._read_file(basin_path)
-
-        # Count element types
-        num_subbasins = len(re.findall(r'^Subbasin:', content, re.MULTILINE))
-        num_reaches = len(re.findall(r'^Reach:', content, re.MULTILINE))
-        num_junctions = len(re.findall(r'^Junction:', content, re.MULTILINE))
-        num_reservoirs = len(re.findall(r'^Reservoir:', content, re.MULTILINE))
-        num_sources = len(re.findall(r'^Source:', content, re.MULTILINE))
-        num_sinks = len(re.findall(r'^Sink:', content, re.MULTILINE))
-
-        # Extract areas and sum them
-        areas = re.findall(r'Area:\s*([\d.]+)', content)
-        total_area = sum(float(a) for a in areas) if areas else 0.0
-
-        # Extract unique methods - HMS uses abbreviated field names:
-        # LossRate:, Transform:, Baseflow:, Route: (not "Loss Method:", etc.)
-        loss_methods = set(re.findall(r'^\s+LossRate:\s*(.+?)$', content, re.MULTILINE))
-        transform_methods = set(re.findall(r'^\s+Transform:\s*(.+?)$', content, re.MULTILINE))
-        baseflow_methods = set(re.findall(r'^\s+Baseflow:\s*(.+?)$', content, re.MULTILINE))
-        routing_methods = set(re.findall(r'^\s+Route:\s*(.+?)$', content, re.MULTILINE))
+        """Parse a basin file for summary information (streamed block by block)."""
+        from .HmsBasin import HmsBasin
 
-        return {
-            'num_subbasins': num_subbasins,
-            'num_reaches': num_reaches,
-            'num_junctions': num_junctions,
-            'num_reservoirs': num_reservoirs,
-            'num_sources': num_sources,
-            'num_sinks': num_sinks,
-            'total_area': round(total_area, 2),
-            'loss_methods': ', '.join(sorted(loss_methods)),
-            'transform_methods': ', '.join(sorted(transform_methods)),
-            'baseflow_methods': ', '.join(sorted(baseflow_methods)),
-            'routing_methods': ', '.join(sorted(routing_methods))
-        }
+        return HmsBasin.get_basin_summary(basin_path)
 
     def _build_subbasin_dataframe(self) -> None:
         """Build the subbasin_df DataFrame with detailed subbasin parameters.
@@ -446,71 +415,66 @@ class HmsPrj:
     def _parse_subbasin_details(self, basin_path: Path) -> List[Dict[str, Any]]:
         """Parse detailed subbasin information from a basin file.
 
+        Subbasin blocks are streamed from a memory-mapped view of the file,
+        so only one block is decoded and held at a time.
+
         Args:
             basin_path: Path to the .basin file
 
         Returns:
             List of dictionaries with subbasin parameters
         """
-        content = self._read_file(basin_path)
-        subbasins = []
-
-        # Find all Subbasin blocks
-        pattern = r'Subbasin:\s*(.+?)\n(.*?)End:'
-        matches = re.findall(pattern, content, re.DOTALL | re.IGNORECASE)
-
-        for match in matches:
-            name = match[0].strip()
-            block = match[1]
+        from ._parsing import HmsFileParser
 
-            # Parse all key-value pairs
-            attrs = {}
-            for line in block.splitlines():
-                line = line.strip()
-                if ':' in line and not line.startswith('End'):
-                    key, value = line.split(':', 1)
-                    attrs[key.strip()] = value.strip()
-
-            record = {
-                'name': name,
-                'area': self._safe_float(attrs.get('Area')),
-                'downstream': attrs.get('Downstream', ''),
-
-                # Loss method and parameters
-                'loss_method': attrs.get('LossRate', attrs.get('Loss', '')),
-                'initial_deficit': self._safe_float(attrs.get('Initial Deficit')),
-                'maximum_deficit': self._safe_float(attrs.get('Maximum Deficit')),
-                'constant_rate': self._safe_float(attrs.get('Constant Rate')),
-                'percolation_rate': self._safe_float(attrs.get('Percolation Rate')),
-                'percent_impervious': self._safe_float(attrs.get('Percent Impervious Area')),
-                'curve_number': self._safe_float(attrs.get('Curve Number')),
-                'initial_abstraction': self._safe_float(attrs.get('Initial Abstraction')),
-
-                # Transform method and parameters
-                'transform_method': attrs.get('Transform', ''),
-                'time_of_concentration': self._safe_float(attrs.get('Time of Concentration')),
-                'storage_coefficient': self._safe_float(attrs.get('Storage Coefficient')),
-                'lag_time': self._safe_float(attrs.get('Lag Time')),
-                'snyder_tp': self._safe_float(attrs.get('Snyder Tp')),
-                'snyder_cp': self._safe_float(attrs.get('Snyder Cp')),
-
-                # Baseflow method and parameters
-                'baseflow_method': attrs.get('Baseflow', ''),
-                'recession_factor': self._safe_float(attrs.get('Recession Factor')),
-                'initial_discharge': self._safe_float(attrs.get('Initial Discharge')),
-                'gw1_initial': self._safe_float(attrs.get('GW 1 Initial')),
-                'gw1_coefficient': self._safe_float(attrs.get('GW 1 Coefficient')),
-
-                # Canvas position
-                'canvas_x': self._safe_float(attrs.get('Canvas X')),
-                'canvas_y': self._safe_float(attrs.get('Canvas Y')),
-
-                # Source file
-                'source_file': str(basin_path),
-            }
-            subbasins.append(record)
+        return [
+            self._subbasin_record(name, attrs, basin_path)
+            for _, name, attrs in HmsFileParser.iter_blocks(basin_path, block_types=['Subbasin'])
+        ]
 
-        return subbasins
+    def _subbasin_record(
+        self,
+        name: str,
+        attrs: Dict[str, str],
+        basin_path: Path
+    ) -> Dict[str, Any]:
+        """Build a subbasin_df record from the attributes of one Subbasin block."""
+        return {
+            'name': name,
+            'area': self._safe_float(attrs.get('Area')),
+            'downstream': attrs.get('Downstream', ''),
+
+            # Loss method and parameters
+            'loss_method': attrs.get('LossRate', attrs.get('Loss', '')),
+            'initial_deficit': self._safe_float(attrs.get('Initial Deficit')),
+            'maximum_deficit': self._safe_float(attrs.get('Maximum Deficit')),
+            'constant_rate': self._safe_float(attrs.get('Constant Rate')),
+            'percolation_rate': self._safe_float(attrs.get('Percolation Rate')),
+            'percent_impervious': self._safe_float(attrs.get('Percent Impervious Area')),
+            'curve_number': self._safe_float(attrs.get('Curve Number')),
+            'initial_abstraction': self._safe_float(attrs.get('Initial Abstraction')),
+
+            # Transform method and parameters
+            'transform_method': attrs.get('Transform', ''),
+            'time_of_concentration': self._safe_float(attrs.get('Time of Concentration')),
+            'storage_coefficient': self._safe_float(attrs.get('Storage Coefficient')),
+            'lag_time': self._safe_float(attrs.get('Lag Time')),
+            'snyder_tp': self._safe_float(attrs.get('Snyder Tp')),
+            'snyder_cp': self._safe_float(attrs.get('Snyder Cp')),
+
+            # Baseflow method and parameters
+            'baseflow_method': attrs.get('Baseflow', ''),
+            'recession_factor': self._safe_float(attrs.get('Recession Factor')),
+            'initial_discharge': self._safe_float(attrs.get('Initial Discharge')),
+            'gw1_initial': self._safe_float(attrs.get('GW 1 Initial')),
+            'gw1_coefficient': self._safe_float(attrs.get('GW 1 Coefficient')),
+
+            # Canvas position
+            'canvas_x': self._safe_float(attrs.get('Canvas X')),
+            'canvas_y': self._safe_float(attrs.get('Canvas Y')),
+
+            # Source file
+            'source_file': str(basin_path),
+        }
 
     def _safe_float(self, value: Optional[str]) -> Optional[float]:
         """Safely convert a string to float, returning None on failure."""
@@ -903,6 +867,242 @@ class HmsPrj:
                     except Exception as e:
                         logger.debug(f"Could not read DSS metadata for {row['name']}: {e}")
 
+    # =========================================================================
+    # Incremental refresh (change notifications from file writers)
+    # =========================================================================
+
+    @staticmethod
+    def notify_file_changed(
+        file_path: Union[str, Path],
+        element_name: Optional[str] = None,
+        hms_object: Optional['HmsPrj'] = None
+    ) -> bool:
+        """Notify a project that one of its component files was written.
+
+        File writers (HmsBasin, HmsMet, HmsGage, HmsRun) call this after
+        saving so the project DataFrames stay current without a full
+        re-initialization. Files that do not belong to the project are ignored.
+
+        Args:
+            file_path: Path of the file that was modified
+            element_name: Optional name of the block that changed (e.g. a
+                subbasin name). Limits the subbasin_df refresh to that row.
+            hms_object: Optional HmsPrj instance (uses global hms if None)
+
+        Returns:
+            True if a project tracked the file and was refreshed
+
+        Example:
+            >>> HmsBasin.set_loss_parameters("model.basin", "Sub1", curve_number=80)
+            >>> # set_loss_parameters already notifies; manual edits can too:
+            >>> HmsPrj.notify_file_changed("model.basin", "Sub1", hms_object=hms)
+        """
+        hms_obj = hms_object if hms_object is not None else hms
+        if hms_obj is None or not hms_obj.initialized:
+            return False
+        return hms_obj.refresh_file(file_path, element_name)
+
+    def refresh_file(
+        self,
+        file_path: Union[str, Path],
+        element_name: Optional[str] = None
+    ) -> bool:
+        """Re-parse a single project file and update only the affected rows.
+
+        Dispatches on the file extension:
+            .basin   -> basin_df summary row and subbasin_df rows
+            .met     -> met_df summary row
+            .control -> control_df row
+            .run     -> run_df rows from that run file
+            .gage    -> gage_df rows from that gage file
+            .pdata   -> pdata_df rows from that paired data file
+            .hms     -> full re-initialization (project registry changed)
+
+        Args:
+            file_path: Path of the modified file
+            element_name: Optional block name. For .basin files only the
+                matching subbasin row is rebuilt (removed if the block is gone).
+
+        Returns:
+            True if the file belongs to this project and was refreshed
+
+        Example:
+            >>> hms.refresh_file("model.basin", element_name="Sub1")
+            True
+        """
+        self.check_initialized()
+        file_path = Path(file_path)
+        suffix = file_path.suffix.lower()
+
+        if suffix == '.hms':
+            if file_path.resolve() != self.project_file.resolve():
+                return False
+            self.initialize(self.project_folder, self.hms_exe_path)
+            return True
+
+        refreshers = {
+            '.basin': self._refresh_basin_file,
+            '.met': self._refresh_met_file,
+            '.control': self._refresh_control_file,
+            '.run': self._refresh_run_file,
+            '.gage': self._refresh_gage_file,
+            '.pdata': self._refresh_pdata_file,
+        }
+        refresher = refreshers.get(suffix)
+        if refresher is None:
+            return False
+
+        refreshed = refresher(file_path, element_name)
+        if refreshed:
+            logger.debug(
+                f"Refreshed {file_path.name}"
+                + (f" ({element_name})" if element_name else "")
+            )
+        return refreshed
+
+    def _refresh_basin_file(self, basin_path: Path, element_name: Optional[str]) -> bool:
+        """Refresh basin_df and subbasin_df rows for one basin file."""
+        mask = self._rows_for_file(self.basin_df, 'full_path', basin_path)
+        if not mask.any():
+            return False
+
+        idx = self.basin_df.index[mask.to_numpy()][0]
+        full_path = self.basin_df.at[idx, 'full_path']
+        basin_name = self.basin_df.at[idx, 'name']
+
+        for key, value in self._parse_basin_summary(Path(full_path)).items():
+            self.basin_df.at[idx, key] = value
+
+        if self.subbasin_df.empty or 'source_file' not in self.subbasin_df.columns:
+            row_mask = pd.Series(False, index=self.subbasin_df.index, dtype=bool)
+        else:
+            row_mask = self.subbasin_df['source_file'] == full_path
+
+        if element_name is not None:
+            from ._parsing import HmsFileParser
+
+            attrs = HmsFileParser.read_block(full_path, 'Subbasin', element_name)
+            records = [self._subbasin_record(element_name, attrs, Path(full_path))] if attrs else []
+            if not self.subbasin_df.empty:
+                row_mask = row_mask & (self.subbasin_df['name'] == element_name)
+        else:
+            records = self._parse_subbasin_details(Path(full_path))
+
+        for record in records:
+            record['basin_model'] = basin_name
+
+        self.subbasin_df = self._replace_rows(self.subbasin_df, row_mask, records)
+        return True
+
+    def _refresh_met_file(self, met_path: Path, element_name: Optional[str]) -> bool:
+        """Refresh the met_df summary row for one met file."""
+        mask = self._rows_for_file(self.met_df, 'full_path', met_path)
+        if not mask.any():
+            return False
+
+        idx = self.met_df.index[mask.to_numpy()][0]
+        summary = self._parse_met_summary(Path(self.met_df.at[idx, 'full_path']))
+        for key, value in summary.items():
+            self.met_df.at[idx, key] = value
+        return True
+
+    def _refresh_control_file(self, control_path: Path, element_name: Optional[str]) -> bool:
+        """Refresh the control_df row for one control file."""
+        mask = self._rows_for_file(self.control_df, 'full_path', control_path)
+        if not mask.any():
+            return False
+
+        idx = self.control_df.index[mask.to_numpy()][0]
+        summary = self._parse_control_summary(Path(self.control_df.at[idx, 'full_path']))
+        for key, value in summary.items():
+            self.control_df.at[idx, key] = value
+        return True
+
+    def _refresh_run_file(self, run_path: Path, element_name: Optional[str]) -> bool:
+        """Replace run_df rows parsed from one .run file."""
+        if not self._in_project_folder(run_path):
+            return False
+        mask = self._rows_for_file(self.run_df, 'full_path', run_path)
+        records = self._parse_run_file(run_path) if run_path.exists() else []
+        self.run_df = self._replace_rows(self.run_df, mask, records)
+        return True
+
+    def _refresh_gage_file(self, gage_path: Path, element_name: Optional[str]) -> bool:
+        """Replace gage_df rows parsed from one .gage file."""
+        if not self._in_project_folder(gage_path):
+            return False
+        mask = self._rows_for_file(self.gage_df, 'source_file', gage_path)
+        records = self._parse_gage_file(gage_path) if gage_path.exists() else []
+        self.gage_df = self._replace_rows(self.gage_df, mask, records)
+        return True
+
+    def _refresh_pdata_file(self, pdata_path: Path, element_name: Optional[str]) -> bool:
+        """Replace pdata_df rows parsed from one .pdata file."""
+        if not self._in_project_folder(pdata_path):
+            return False
+        mask = self._rows_for_file(self.pdata_df, 'source_file', pdata_path)
+        records = self._parse_pdata_file(pdata_path) if pdata_path.exists() else []
+        self.pdata_df = self._replace_rows(self.pdata_df, mask, records)
+        return True
+
+    def _in_project_folder(self, file_path: Path) -> bool:
+        """Check whether a file lives directly in the project folder."""
+        return file_path.resolve().parent == self.project_folder.resolve()
+
+    @staticmethod
+    def _rows_for_file(df: pd.DataFrame, column: str, file_path: Path) -> pd.Series:
+        """Boolean mask of rows whose path column refers to file_path.
+
+        Each distinct path string is resolved once, so the cost scales with
+        the number of files rather than the number of rows.
+        """
+        if df.empty or column not in df.columns:
+            return pd.Series(False, index=df.index, dtype=bool)
+
+        target = Path(file_path).resolve()
+        matching = [
+            p for p in df[column].dropna().unique()
+            if p and Path(p).resolve() == target
+        ]
+        return df[column].isin(matching)
+
+    @staticmethod
+    def _replace_rows(
+        df: pd.DataFrame,
+        mask: pd.Series,
+        records: List[Dict[str, Any]]
+    ) -> pd.DataFrame:
+        """Replace the rows selected by mask with new records.
+
+        New rows take the position of the first replaced row so DataFrame
+        ordering matches a full rebuild. A one-for-one replacement is done
+        in place without copying the frame.
+        """
+        positions = mask.to_numpy().nonzero()[0]
+
+        if len(positions) == 1 and len(records) == 1:
+            idx = df.index[positions[0]]
+            for key, value in records[0].items():
+                df.at[idx, key] = value
+            return df
+
+        new_rows = pd.DataFrame(records)
+        if len(positions) == 0:
+            if new_rows.empty:
+                return df
+            if df.empty:
+                return new_rows
+            return pd.concat([df, new_rows], ignore_index=True)
+
+        first = positions[0]
+        keep = ~mask.to_numpy()
+        before = df.iloc[:first]
+        after = df.iloc[first:][keep[first:]]
+        parts = [part for part in (before, new_rows, after) if not part.empty]
+        if not parts:
+            return df.iloc[0:0]
+        return pd.concat(parts, ignore_index=True)
+
     # =========================================================================
     # Public accessor methods
     # =========================================================================
@@ -30,6 +30,7 @@ import re
 import logging
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Union
+import pandas as pd
 
 from .LoggingConfig import log_call, get_logger
 
@@ -224,9 +225,9 @@ class HmsRun:
             HmsRun._write_file(run_file_path, new_content)
             logger.info(f"Updated DSS output for run '{run_name}' to '{dss_file}'")
 
-            # Refresh the project to update run_df
-            if hasattr(hms_obj, '_build_run_dataframe'):
-                hms_obj._build_run_dataframe()
+            # Refresh the run_df rows for this run file
+            if hasattr(hms_obj, 'refresh_file'):
+                hms_obj.refresh_file(run_file_path, run_name)
 
             return True
         else:
@@ -565,13 +566,109 @@ class HmsRun:
         logger.info(f"Cloned run: {source_run} → {new_run_name}")
         logger.info(f"  Basin: {new_basin}, Met: {new_met}, DSS: {output_dss}")
 
-        # Refresh project
-        if hasattr(hms_obj, '_build_run_dataframe'):
-            hms_obj._build_run_dataframe()
-            logger.info(f"Re-initialized project to register new run '{new_run_name}'")
+        # Refresh only the run_df rows for this run file
+        if hasattr(hms_obj, 'refresh_file'):
+            hms_obj.refresh_file(run_file_path, new_run_name)
+            logger.info(f"Refreshed run_df to register new run '{new_run_name}'")
 
         return True
 
+    @staticmethod
+    @log_call
+    def clone_runs(
+        source_run: str,
+        new_runs: Union[pd.DataFrame, List[Dict[str, Any]]],
+        hms_object: Optional[Any] = None
+    ) -> int:
+        """
+        Clone one run many times in a single read/write of the run file.
+
+        Batch counterpart of clone_run() for scenario sweeps: the source run
+        block is parsed once into a template and every clone is formatted
+        from it, then all blocks are appended in one write.
+
+        Args:
+            source_run: Name of run to clone
+            new_runs: DataFrame or list of dicts with a 'run_name' column and
+                optional 'basin', 'met', 'control', 'output_dss' and
+                'description' columns (defaults as in clone_run)
+            hms_object: Optional HmsPrj instance. If None, uses global hms.
+
+        Returns:
+            Number of runs created
+
+        Raises:
+            ValueError: If source_run is not found, 'run_name' is missing, or
+                a run name is duplicated or already exists
+
+        Example:
+            >>> HmsRun.clone_runs("1PCT_24HR", pd.DataFrame({
+            ...     'run_name': ['Scenario 001', 'Scenario 002'],
+            ...     'met': ['Scenario_001', 'Scenario_002'],
+            ... }), hms_object=hms)
+            2
+        """
+        hms_obj = HmsRun._get_hms_object(hms_object)
+        new_runs = pd.DataFrame(new_runs)
+
+        if 'run_name' not in new_runs.columns:
+            raise ValueError("new_runs must have a 'run_name' column")
+        names = new_runs['run_name'].astype(str)
+        clashes = sorted(set(names[names.duplicated()]) | (set(names) & set(HmsRun.get_run_names(hms_object=hms_obj))))
+        if clashes:
+            raise ValueError(f"Runs already exist or are duplicated: {clashes}")
+
+        config = HmsRun.get_dss_config(source_run, hms_object=hms_obj)
+        run_file_path = Path(config['run_file'])
+        content = HmsRun._read_file(run_file_path)
+
+        escaped_name = re.escape(source_run)
+        match = re.search(rf'(Run:\s*{escaped_name}\s*\n.*?End:)', content, re.DOTALL)
+        if not match:
+            raise ValueError(f"Could not find run block for '{source_run}'")
+
+        # Same edits as clone_run(), but inserting format slots instead of values
+        template = match.group(1).replace('{', '{{').replace('}', '}}')
+        template = re.sub(rf'Run:\s*{escaped_name}', 'Run: {run_name}', template)
+        slots = [
+            (r'(\s+Basin:\s*)([^\n]*)', 'basin', None),
+            (r'(\s+(?:Precip|Meteorology):\s*)([^\n]*)', 'met', None),
+            (r'(\s+Control:\s*)([^\n]*)', 'control', None),
+            (r'(\s+DSS File:\s*)([^\n]*)', 'output_dss', 'DSS File'),
+            (r'(\s+Log File:\s*)([^\n]*)', 'log_file', 'Log File'),
+        ]
+        for pattern, slot, added_key in slots:
+            if re.search(pattern, template):
+                template = re.sub(pattern, rf'\g<1>{{{slot}}}', template)
+            elif added_key:
+                template = template.replace('End:', f'     {added_key}: {{{slot}}}\nEnd:')
+        if re.search(r'\s+Description:', template):
+            template = re.sub(r'(\s+Description:\s*)([^\n]*)', r'\g<1>{description}', template)
+        else:
+            template = template.replace('Run: {run_name}\n', 'Run: {run_name}\n     Description: {description}\n', 1)
+
+        defaults = {
+            'basin': config.get('basin_model', ''),
+            'met': config.get('met_model', ''),
+            'control': config.get('control_spec', ''),
+            'description': f"Cloned from {source_run}",
+        }
+        blocks = []
+        for run in new_runs.to_dict('records'):
+            values = {**defaults, **{k: v for k, v in run.items() if pd.notna(v)}}
+            values['run_name'] = str(run['run_name'])
+            values.setdefault('output_dss', f"{values['run_name']}.dss")
+            values['log_file'] = Path(values['output_dss']).stem + '.log'
+            blocks.append(template.format(**values))
+
+        HmsRun._write_file(run_file_path, content.rstrip() + '\n\n' + '\n\n'.join(blocks) + '\n')
+        logger.info(f"Cloned run '{source_run}' {len(blocks)} times in {run_file_path.name}")
+
+        if hasattr(hms_obj, 'refresh_file'):
+            hms_obj.refresh_file(run_file_path)
+
+        return len(blocks)
+
     @staticmethod
     @log_call
     def set_dss_file_direct(
@@ -1063,9 +1160,9 @@ class HmsRun:
 
         success = HmsRun.set_basin_direct(run_file_path, run_name, basin_model)
 
-        # Refresh project to update run_df
-        if success and hasattr(hms_obj, '_build_run_dataframe'):
-            hms_obj._build_run_dataframe()
+        # Refresh the run_df rows for this run file
+        if success and hasattr(hms_obj, 'refresh_file'):
+            hms_obj.refresh_file(run_file_path, run_name)
 
         return success
 
@@ -1211,9 +1308,9 @@ class HmsRun:
 
         success = HmsRun.set_precip_direct(run_file_path, run_name, met_model)
 
-        # Refresh project to update run_df
-        if success and hasattr(hms_obj, '_build_run_dataframe'):
-            hms_obj._build_run_dataframe()
+        # Refresh the run_df rows for this run file
+        if success and hasattr(hms_obj, 'refresh_file'):
+            hms_obj.refresh_file(run_file_path, run_name)
 
         return success
 
@@ -1362,9 +1459,9 @@ class HmsRun:
 
         success = HmsRun.set_control_direct(run_file_path, run_name, control_spec)
 
-        # Refresh project to update run_df
-        if success and hasattr(hms_obj, '_build_run_dataframe'):
-            hms_obj._build_run_dataframe()
+        # Refresh the run_df rows for this run file
+        if success and hasattr(hms_obj, 'refresh_file'):
+            hms_obj.refresh_file(run_file_path, run_name)
 
         return success
 
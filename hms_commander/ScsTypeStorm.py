@@ -23,7 +23,8 @@ Use FrequencyStorm for variable duration storms.
 Pattern Data:
     Extracted from HEC-HMS 4.13 source code (aH.java)
     Arrays contain 1441 cumulative values (0 to 1) at 1-minute intervals
-    Bundled as .npy files in hms_commander/data/
+    Bundled in hms_commander/data/storm_patterns.npy (memory-mapped, shared
+    with FrequencyStorm)
 
 Reference:
     - NRCS TR-55 (Technical Release 55)
@@ -43,13 +44,13 @@ Example:
     >>> print(f"Total depth: {hyeto['cumulative_depth'].iloc[-1]:.6f} inches")
 """
 
-from pathlib import Path
-from typing import Dict, Optional, Union, List
+from typing import Dict, Optional, Union, List, Tuple
 import numpy as np
 import pandas as pd
 
 from .LoggingConfig import get_logger
 from .Decorators import log_call
+from ._storms import PATTERN_CACHE, as_list, as_vector, broadcast_depths, bundled_pattern
 
 logger = get_logger(__name__)
 
@@ -86,13 +87,6 @@ class ScsTypeStorm:
     # Fixed 24-hour duration (HMS constraint)
     DURATION_MINUTES = 1440
 
-    # Pattern file locations (relative to this module)
-    _PATTERN_FILES = {
-        'I': 'data/scs_type_i.npy',
-        'IA': 'data/scs_type_ia.npy',
-        'II': 'data/scs_type_ii.npy',
-        'III': 'data/scs_type_iii.npy'
-    }
 
     # Peak positions from TR-55 (approximate % of duration)
     # These are verified against HMS source code extraction
@@ -103,14 +97,14 @@ class ScsTypeStorm:
         'III': 0.50   # ~50% of duration (Gulf/Atlantic coastal)
     }
 
-    # Cached patterns
-    _pattern_cache: Dict[str, np.ndarray] = {}
-
     @staticmethod
     def _load_pattern(scs_type: str) -> np.ndarray:
         """
         Load SCS cumulative distribution pattern from bundled data.
 
+        The pattern is a read-only view of the memory-mapped pattern store
+        shared with FrequencyStorm (data/storm_patterns.npy).
+
         Args:
             scs_type: SCS type ('I', 'IA', 'II', or 'III')
 
@@ -129,27 +123,7 @@ class ScsTypeStorm:
                 f"Valid types: {ScsTypeStorm.SCS_TYPES}"
             )
 
-        # Check cache
-        if scs_type in ScsTypeStorm._pattern_cache:
-            return ScsTypeStorm._pattern_cache[scs_type]
-
-        # Load pattern file
-        pattern_file = Path(__file__).parent / ScsTypeStorm._PATTERN_FILES[scs_type]
-
-        if not pattern_file.exists():
-            raise FileNotFoundError(
-                f"SCS pattern file not found: {pattern_file}\n"
-                "This file should be bundled with hms-commander.\n"
-                "Try reinstalling: pip install --upgrade hms-commander"
-            )
-
-        pattern = np.load(pattern_file)
-        logger.debug(f"Loaded SCS Type {scs_type} pattern: {len(pattern)} values")
-
-        # Cache for future use
-        ScsTypeStorm._pattern_cache[scs_type] = pattern
-
-        return pattern
+        return bundled_pattern(f"SCS-{scs_type}")
 
     @staticmethod
     @log_call
@@ -200,40 +174,10 @@ class ScsTypeStorm:
             Duration is ALWAYS 24 hours (hardcoded in HMS).
             Use FrequencyStorm.generate_hyetograph() for variable durations.
         """
-        # Validate inputs
         scs_type = scs_type.upper()
-        if scs_type not in ScsTypeStorm.SCS_TYPES:
-            raise ValueError(
-                f"Invalid SCS type: '{scs_type}'. "
-                f"Valid types: {ScsTypeStorm.SCS_TYPES}"
-            )
-
-        if time_interval_min <= 0:
-            raise ValueError(f"Time interval must be positive: {time_interval_min}")
-
-        if ScsTypeStorm.DURATION_MINUTES % time_interval_min != 0:
-            raise ValueError(
-                f"Time interval {time_interval_min} min does not evenly divide "
-                f"24-hour duration (1440 min). "
-                f"Common intervals: 5, 10, 15, 30, 60 minutes."
-            )
-
-        # Load cumulative pattern (1441 values at 1-minute intervals)
-        cumulative_1min = ScsTypeStorm._load_pattern(scs_type)
 
-        # Resample to requested interval
-        num_output_steps = ScsTypeStorm.DURATION_MINUTES // time_interval_min + 1
-        output_times = np.linspace(0, 1440, num_output_steps)
-        source_times = np.linspace(0, 1440, 1441)
-
-        cumulative_resampled = np.interp(output_times, source_times, cumulative_1min)
-
-        # Scale to total depth
-        cumulative_depth = cumulative_resampled * total_depth_inches
-
-        # Convert to incremental (prepend 0 at t=0)
-        # HMS: dArray[0] = 0.0
-        incremental = np.diff(cumulative_depth, prepend=0.0)
+        # Scale the unit-depth increments to total depth
+        incremental = ScsTypeStorm._unit_hyetograph(scs_type, time_interval_min) * total_depth_inches
 
         # Verify depth conservation
         total_check = incremental.sum()
@@ -264,6 +208,118 @@ class ScsTypeStorm:
             'cumulative_depth': np.cumsum(incremental)
         })
 
+    @staticmethod
+    @log_call
+    def generate_hyetographs(
+        total_depths_inches: Union[float, List[float], np.ndarray],
+        scs_types: Union[str, List[str]] = 'II',
+        time_intervals_min: Union[int, List[int]] = 60
+    ) -> Tuple[np.ndarray, pd.DataFrame]:
+        """
+        Generate many SCS hyetographs at once as a (scenario, time) array.
+
+        Each (type, interval) pattern is interpolated once; all depths are
+        scaled by broadcasting. Each row equals the 'incremental_depth'
+        column of generate_hyetograph() for the same arguments.
+
+        Args:
+            total_depths_inches: Total depth(s) in inches
+            scs_types: SCS type(s) ('I', 'IA', 'II', 'III')
+            time_intervals_min: Time step(s) in minutes (must divide 1440)
+
+        Returns:
+            Tuple of:
+                - np.ndarray of shape (scenario, time) with incremental depths
+                  (inches), including t=0; rows with coarser intervals are
+                  padded with NaN
+                - pd.DataFrame scenario index with columns total_depth_inches,
+                  scs_type, time_interval_min and num_steps
+
+        Raises:
+            ValueError: If a type or interval is invalid
+
+        Example:
+            >>> values, index = ScsTypeStorm.generate_hyetographs(
+            ...     np.linspace(2, 12, 50), scs_types=ScsTypeStorm.SCS_TYPES
+            ... )
+            >>> values.shape
+            (200, 25)
+        """
+        depths = as_vector(total_depths_inches, "total_depths_inches")
+        patterns = [
+            (
+                {'scs_type': scs_type.upper(), 'time_interval_min': int(interval)},
+                ScsTypeStorm._unit_hyetograph(scs_type.upper(), interval)
+            )
+            for scs_type in as_list(scs_types)
+            for interval in as_list(time_intervals_min)
+        ]
+        return broadcast_depths(patterns, depths)
+
+    @staticmethod
+    def _unit_hyetograph(scs_type: str, time_interval_min: int) -> np.ndarray:
+        """
+        Incremental hyetograph for a unit total depth, including t=0.
+
+        Memoized in the shared pattern cache; the returned array is read-only.
+
+        Raises:
+            ValueError: If scs_type is not valid or interval invalid
+        """
+        # Validate inputs
+        if scs_type not in ScsTypeStorm.SCS_TYPES:
+            raise ValueError(
+                f"Invalid SCS type: '{scs_type}'. "
+                f"Valid types: {ScsTypeStorm.SCS_TYPES}"
+            )
+
+        if time_interval_min <= 0:
+            raise ValueError(f"Time interval must be positive: {time_interval_min}")
+
+        if ScsTypeStorm.DURATION_MINUTES % time_interval_min != 0:
+            raise ValueError(
+                f"Time interval {time_interval_min} min does not evenly divide "
+                f"24-hour duration (1440 min). "
+                f"Common intervals: 5, 10, 15, 30, 60 minutes."
+            )
+
+        num_output_steps = int(ScsTypeStorm.DURATION_MINUTES // time_interval_min + 1)
+        return PATTERN_CACHE.get(
+            (f'SCS-{scs_type}', num_output_steps, None),
+            lambda: ScsTypeStorm._build_unit_hyetograph(scs_type, num_output_steps)
+        )
+
+    @staticmethod
+    def _build_unit_hyetograph(scs_type: str, num_output_steps: int) -> np.ndarray:
+        """Interpolate the 1-minute cumulative curve to the output steps (uncached)."""
+        # Load cumulative pattern (1441 values at 1-minute intervals)
+        cumulative_1min = ScsTypeStorm._load_pattern(scs_type)
+
+        # Resample to requested interval
+        output_times = np.linspace(0, 1440, num_output_steps)
+        source_times = np.linspace(0, 1440, 1441)
+
+        cumulative_resampled = np.interp(output_times, source_times, cumulative_1min)
+
+        # Convert to incremental (prepend 0 at t=0)
+        # HMS: dArray[0] = 0.0
+        return np.diff(cumulative_resampled, prepend=0.0)
+
+    @staticmethod
+    def get_pattern_cache_info() -> dict:
+        """
+        Statistics of the unit-pattern cache shared with FrequencyStorm.
+
+        Returns:
+            Dictionary with hits, misses, hit_rate, size and maxsize
+        """
+        return PATTERN_CACHE.info()
+
+    @staticmethod
+    def clear_pattern_cache() -> None:
+        """Clear the unit-pattern cache shared with FrequencyStorm."""
+        PATTERN_CACHE.clear()
+
     @staticmethod
     @log_call
     def generate_all_types(
@@ -289,14 +345,18 @@ class ScsTypeStorm:
             ...     peak = hyeto['incremental_depth'].max()
             ...     print(f"Type {scs_type}: peak={peak:.2f} inches")
         """
-        results = {}
-        for scs_type in ScsTypeStorm.SCS_TYPES:
-            results[scs_type] = ScsTypeStorm.generate_hyetograph(
-                total_depth_inches=total_depth_inches,
-                scs_type=scs_type,
-                time_interval_min=time_interval_min
-            )
-        return results
+        values, index = ScsTypeStorm.generate_hyetographs(
+            total_depth_inches, ScsTypeStorm.SCS_TYPES, time_interval_min
+        )
+        hours = np.arange(1, values.shape[1] + 1) * (time_interval_min / 60.0)
+        return {
+            scs_type: pd.DataFrame({
+                'hour': hours,
+                'incremental_depth': row,
+                'cumulative_depth': np.cumsum(row)
+            })
+            for scs_type, row in zip(index['scs_type'], values)
+        }
 
     @staticmethod
     def get_peak_position(scs_type: str) -> float:
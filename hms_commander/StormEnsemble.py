@@ -0,0 +1,306 @@
+"""
+StormEnsemble - Seeded Design-Storm Ensembles for Monte Carlo Studies
+
+Generates thousands of hyetographs with randomly sampled AEP, temporal
+pattern (Atlas 14 quartile, TP-40 peak position or SCS type) in one
+vectorized pass, using Atlas14Storm, FrequencyStorm and ScsTypeStorm as
+backends.
+
+Algorithm:
+    1. Draw every sample's parameters up front from one seeded generator
+       (AEP log-uniform over a range, then the backend's pattern choice;
+       for Atlas 14 also the temporal-pattern probability column)
+    2. Look up each sample's total depth from a depth-frequency curve
+    3. Build the hyetographs chunk by chunk from the cached patterns
+
+Because all parameters are drawn before any hyetograph is built, the
+ensemble for a given seed is identical whether it is built in memory or
+streamed to disk in chunks of any size.
+
+Example:
+    >>> from hms_commander import StormEnsemble
+    >>> values, samples = StormEnsemble.generate(
+    ...     5000,
+    ...     depth_frequency={50: 5.5, 10: 8.4, 2: 12.2, 1: 14.5, 0.2: 20.3},
+    ...     backend="atlas14", seed=42
+    ... )
+    >>> values.shape
+    (5000, 49)
+"""
+
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .LoggingConfig import get_logger
+from .Decorators import log_call
+from .Atlas14Storm import Atlas14Storm
+from .FrequencyStorm import FrequencyStorm
+from .ScsTypeStorm import ScsTypeStorm
+
+logger = get_logger(__name__)
+
+
+class StormEnsemble:
+    """
+    Static class for reproducible random design-storm ensembles.
+
+    All methods are static - no instantiation required.
+
+    Backends:
+        - 'atlas14': Atlas 14 temporal distributions
+          (Atlas14Storm.interpolate_hyetographs); the probability column is
+          sampled independently of the AEP (AEPs rarer than 10% would all
+          share the 10% curve), and the quartile is either sampled from a
+          list or continuous between First and Fourth
+        - 'frequency': TP-40 pattern (FrequencyStorm) with a sampled peak
+          position
+        - 'scs': SCS distributions (ScsTypeStorm) with a sampled type
+
+    Example:
+        >>> values, samples = StormEnsemble.generate(
+        ...     10000, {10: 8.4, 1: 14.5, 0.2: 20.3}, backend="frequency",
+        ...     peak_positions_pct=[33, 50, 67], seed=7,
+        ...     output_path="ensemble.npy", chunk_size=2000
+        ... )
+    """
+
+    BACKENDS = ['atlas14', 'frequency', 'scs']
+
+    # Default chunk size when streaming to disk
+    DEFAULT_CHUNK_SIZE = 10000
+
+    @staticmethod
+    @log_call
+    def generate(
+        n_samples: int,
+        depth_frequency: Union[Dict[float, float], pd.Series],
+        backend: str = "atlas14",
+        seed: Optional[int] = None,
+        aep_range: Tuple[float, float] = (0.2, 50.0),
+        aep_percents: Optional[Sequence[float]] = None,
+        quartiles: Optional[Sequence[str]] = None,
+        probability_range: Optional[Tuple[float, float]] = (10.0, 90.0),
+        peak_positions_pct: Sequence[float] = (25.0, 33.0, 50.0, 67.0, 75.0),
+        scs_types: Sequence[str] = ('II',),
+        duration_hours: int = 24,
+        time_interval_min: int = 5,
+        state: str = "tx",
+        region: int = 3,
+        cache_dir: Optional[Path] = None,
+        output_path: Optional[Union[str, Path]] = None,
+        chunk_size: Optional[int] = None
+    ) -> Tuple[np.ndarray, pd.DataFrame]:
+        """
+        Generate a seeded ensemble of hyetographs as a (sample, time) array.
+
+        Args:
+            n_samples: Number of storms
+            depth_frequency: Total storm depth (inches) by AEP (percent) for
+                the storm duration, e.g. an Atlas 14 DDF column. Depths are
+                interpolated linearly in log10(AEP) and held constant
+                outside the given AEPs.
+            backend: 'atlas14', 'frequency' or 'scs'
+            seed: Seed for numpy.random.default_rng (None: not reproducible)
+            aep_range: (min, max) AEP in percent, sampled log-uniformly
+            aep_percents: Optional AEPs (percent) to use instead of sampling;
+                must have n_samples values
+            quartiles: atlas14 only. Quartile names sampled uniformly per
+                storm; None samples a continuous quartile position in [1, 4]
+            probability_range: atlas14 only. (min, max) temporal-pattern
+                probability (percent, within 10-90) sampled uniformly per
+                storm; None derives it from the AEP like generate_hyetograph
+                (clipped to 10-50, so rare storms share one pattern)
+            peak_positions_pct: frequency only. Peak positions sampled
+                uniformly per storm
+            scs_types: scs only. SCS types sampled uniformly per storm
+            duration_hours: atlas14 and frequency storm duration in hours
+                (SCS storms are always 24 hours)
+            time_interval_min: frequency and scs time step in minutes (atlas14
+                uses the published step)
+            state: atlas14 two-letter state code
+            region: atlas14 region number
+            cache_dir: atlas14 cache directory
+            output_path: Optional .npy file. The array is written chunk by
+                chunk to a memory-mapped file and the sample table to
+                "<stem>_samples.csv" beside it.
+            chunk_size: Storms per chunk (default: all at once in memory,
+                DEFAULT_CHUNK_SIZE when writing to output_path)
+
+        Returns:
+            Tuple of:
+                - np.ndarray of shape (sample, time) with incremental depths
+                  (inches), including the leading t=0 value; a read-only
+                  memmap when output_path is given
+                - pd.DataFrame sample table with columns aep_percent,
+                  total_depth_inches and the sampled pattern parameters
+                  (probability and quartile / quartile_position,
+                  peak_position_pct or scs_type)
+
+        Raises:
+            ValueError: If the backend, depth curve or AEP inputs are invalid
+
+        Example:
+            >>> values, samples = StormEnsemble.generate(
+            ...     1000, {10: 8.4, 1: 14.5}, backend="scs",
+            ...     scs_types=["II", "III"], time_interval_min=15, seed=1
+            ... )
+            >>> samples.groupby('scs_type').size()
+        """
+        if backend not in StormEnsemble.BACKENDS:
+            raise ValueError(f"Invalid backend: '{backend}'. Valid backends: {StormEnsemble.BACKENDS}")
+        if n_samples < 1:
+            raise ValueError(f"n_samples must be positive: {n_samples}")
+
+        samples = StormEnsemble.sample_parameters(
+            n_samples, depth_frequency, backend, seed, aep_range, aep_percents,
+            quartiles, probability_range, peak_positions_pct, scs_types
+        )
+
+        def build(rows: slice) -> np.ndarray:
+            return StormEnsemble._build_chunk(
+                samples.iloc[rows], backend, duration_hours, time_interval_min,
+                state, region, cache_dir
+            )
+
+        if chunk_size is None:
+            chunk_size = StormEnsemble.DEFAULT_CHUNK_SIZE if output_path is not None else n_samples
+        chunks = [slice(start, min(start + chunk_size, n_samples)) for start in range(0, n_samples, chunk_size)]
+
+        first = build(chunks[0])
+        if output_path is None:
+            values = np.empty((n_samples, first.shape[1]))
+        else:
+            output_path = Path(output_path)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            values = np.lib.format.open_memmap(output_path, mode='w+', shape=(n_samples, first.shape[1]))
+
+        values[chunks[0]] = first
+        for rows in chunks[1:]:
+            values[rows] = build(rows)
+
+        if output_path is not None:
+            values.flush()
+            del values
+            samples.to_csv(output_path.with_name(f"{output_path.stem}_samples.csv"))
+            values = np.load(output_path, mmap_mode='r')
+            logger.info(f"Wrote {n_samples} {backend} storms to {output_path} in {len(chunks)} chunks")
+        else:
+            logger.info(f"Generated {n_samples} {backend} storms")
+
+        return values, samples
+
+    @staticmethod
+    def sample_parameters(
+        n_samples: int,
+        depth_frequency: Union[Dict[float, float], pd.Series],
+        backend: str = "atlas14",
+        seed: Optional[int] = None,
+        aep_range: Tuple[float, float] = (0.2, 50.0),
+        aep_percents: Optional[Sequence[float]] = None,
+        quartiles: Optional[Sequence[str]] = None,
+        probability_range: Optional[Tuple[float, float]] = (10.0, 90.0),
+        peak_positions_pct: Sequence[float] = (25.0, 33.0, 50.0, 67.0, 75.0),
+        scs_types: Sequence[str] = ('II',)
+    ) -> pd.DataFrame:
+        """
+        Draw the ensemble's sample table without building hyetographs.
+
+        Arguments are as in generate(). The same seed and arguments always
+        give the same table.
+
+        Returns:
+            pd.DataFrame indexed by 'sample'
+        """
+        rng = np.random.default_rng(seed)
+
+        if aep_percents is None:
+            low, high = aep_range
+            if not 0 < low <= high < 100:
+                raise ValueError(f"aep_range must satisfy 0 < min <= max < 100: {aep_range}")
+            aeps = 10 ** rng.uniform(np.log10(low), np.log10(high), n_samples)
+        else:
+            aeps = np.asarray(aep_percents, dtype=float)
+            if aeps.shape != (n_samples,):
+                raise ValueError(f"aep_percents must have {n_samples} values")
+
+        curve = pd.Series(depth_frequency, dtype=float).sort_index()
+        if curve.empty or (curve.index <= 0).any():
+            raise ValueError("depth_frequency must map positive AEPs (percent) to depths")
+
+        samples = pd.DataFrame({
+            'aep_percent': aeps,
+            'total_depth_inches': np.interp(
+                np.log10(aeps), np.log10(curve.index.to_numpy(dtype=float)), curve.to_numpy()
+            ),
+        })
+        samples.index.name = 'sample'
+
+        if backend == 'atlas14':
+            if probability_range is None:
+                samples['probability'] = Atlas14Storm._aep_to_probability(aeps)
+            else:
+                low, high = probability_range
+                if not 10 <= low <= high <= 90:
+                    raise ValueError(f"probability_range must satisfy 10 <= min <= max <= 90: {probability_range}")
+                samples['probability'] = rng.uniform(low, high, n_samples)
+            if quartiles is None:
+                samples['quartile_position'] = rng.uniform(1.0, 4.0, n_samples)
+            else:
+                samples['quartile'] = rng.choice(np.asarray(list(quartiles), dtype=object), n_samples)
+        elif backend == 'frequency':
+            samples['peak_position_pct'] = rng.choice(np.asarray(peak_positions_pct, dtype=float), n_samples)
+        elif backend == 'scs':
+            types = [t.upper() for t in scs_types]
+            samples['scs_type'] = rng.choice(np.asarray(types, dtype=object), n_samples)
+        return samples
+
+    @staticmethod
+    def _build_chunk(
+        samples: pd.DataFrame,
+        backend: str,
+        duration_hours: int,
+        time_interval_min: int,
+        state: str,
+        region: int,
+        cache_dir: Optional[Path]
+    ) -> np.ndarray:
+        """Hyetographs (sample, time) for one chunk of the sample table."""
+        depths = samples['total_depth_inches'].to_numpy()
+
+        if backend == 'atlas14':
+            common = dict(duration_hours=duration_hours, state=state, region=region, cache_dir=cache_dir)
+            aeps = samples['aep_percent'].to_numpy()
+            probabilities = samples['probability'].to_numpy()
+            if 'quartile_position' in samples.columns:
+                values, _ = Atlas14Storm.interpolate_hyetographs(
+                    depths, aeps, quartile_positions=samples['quartile_position'].to_numpy(),
+                    probabilities=probabilities, **common
+                )
+                return values
+
+            values = None
+            for quartile, rows in samples.groupby('quartile', sort=False).indices.items():
+                group, _ = Atlas14Storm.interpolate_hyetographs(
+                    depths[rows], aeps[rows], quartile=quartile, probabilities=probabilities[rows], **common
+                )
+                if values is None:
+                    values = np.empty((len(samples), group.shape[1]))
+                values[rows] = group
+            return values
+
+        # Unit patterns are shared by every storm with the same parameter
+        if backend == 'frequency':
+            column = samples['peak_position_pct']
+            unit = lambda peak: FrequencyStorm._unit_hyetograph(
+                int(duration_hours * 60), time_interval_min, peak
+            )
+        else:
+            column = samples['scs_type']
+            unit = lambda scs_type: ScsTypeStorm._unit_hyetograph(scs_type, time_interval_min)
+
+        choices, codes = np.unique(column.to_numpy(), return_inverse=True)
+        patterns = np.stack([unit(choice) for choice in choices])
+        return patterns[codes] * depths[:, None]
@@ -0,0 +1,441 @@
+"""
+SubbasinTable - Columnar Subbasin Parameters
+
+This module provides the SubbasinTable class, a column-oriented view of the
+subbasins in a HEC-HMS basin model file (.basin). Every numeric parameter is
+held in one NumPy float64 array (NaN where a subbasin does not define it, or
+defines a value that cannot be parsed, which is logged as a warning) and
+subbasin names map to row positions, so calibration and sensitivity sweeps
+can edit whole parameter vectors at once and write the changed values back
+in a single batched pass.
+
+Example:
+    >>> from hms_commander import SubbasinTable
+    >>> table = SubbasinTable.from_file("model.basin")
+    >>> huc = table.select(r"^HUC0401")
+    >>> table.scale("curve_number", 1.05, rows=huc, upper=98)
+    >>> table.write()
+"""
+
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from .LoggingConfig import get_logger
+from ._parsing import HmsFileParser
+from ._constants import (
+    LOSS_PARAMETER_KEYS, TRANSFORM_PARAMETER_KEYS, BASEFLOW_PARAMETER_KEYS
+)
+
+logger = get_logger(__name__)
+
+RowSelector = Union[None, str, Sequence[str], Sequence[int], Sequence[bool], np.ndarray]
+
+
+class SubbasinTable:
+    """
+    Subbasin parameters as NumPy columns with a name -> row index.
+
+    Numeric columns use the snake_case names returned by the HmsBasin
+    get_*_parameters methods (e.g. 'curve_number', 'lag_time'), plus 'area',
+    'canvas_x' and 'canvas_y'. Text columns hold the method names,
+    'downstream', 'graph_type' and 'threshold_type'.
+
+    Edits made with set()/scale() (or directly on the arrays) are detected by
+    comparison with the values read from the file; write() sends only those
+    values back through HmsBasin.set_parameters_batch().
+
+    Example:
+        >>> table = SubbasinTable.from_file("model.basin")
+        >>> table["curve_number"].mean()
+        74.2
+        >>> table.loss_parameters("Sub1")
+        {'method': 'SCS Curve Number', 'curve_number': 75.0, ...}
+    """
+
+    METHOD_KEYS = {
+        'loss': ('loss_method', LOSS_PARAMETER_KEYS),
+        'transform': ('transform_method', TRANSFORM_PARAMETER_KEYS),
+        'baseflow': ('baseflow_method', BASEFLOW_PARAMETER_KEYS),
+    }
+    """Parameter group -> (method column, {parameter: .basin key})"""
+
+    TEXT_COLUMNS = {
+        'downstream': ('Downstream',),
+        'loss_method': ('LossRate', 'Loss'),
+        'transform_method': ('Transform',),
+        'baseflow_method': ('Baseflow',),
+        'graph_type': ('Graph Type',),
+        'threshold_type': ('Threshold Type',),
+    }
+    """Text columns -> .basin keys, first key present wins"""
+
+    NUMERIC_COLUMNS = {
+        'area': 'Area',
+        'canvas_x': 'Canvas X',
+        'canvas_y': 'Canvas Y',
+        **{
+            name: key
+            for keys in (LOSS_PARAMETER_KEYS, TRANSFORM_PARAMETER_KEYS, BASEFLOW_PARAMETER_KEYS)
+            for name, key in keys.items()
+            if name not in ('graph_type', 'threshold_type')
+        },
+    }
+    """Numeric (float64) columns -> .basin keys"""
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        columns: Dict[str, np.ndarray],
+        file_path: Optional[Union[str, Path]] = None
+    ):
+        """
+        Create a table from column arrays.
+
+        Most callers should use from_file() or from_records().
+
+        Args:
+            names: Subbasin names, one per row
+            columns: Column name -> array of len(names)
+            file_path: Basin file the values came from (used by write())
+        """
+        self.names = np.asarray(names, dtype=object)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        if len(self.index) != len(self.names):
+            raise ValueError("Subbasin names must be unique")
+
+        self.columns = {}
+        for column, values in columns.items():
+            values = np.array(values, dtype=np.float64 if column in self.NUMERIC_COLUMNS else object)
+            if values.shape != (len(self.names),):
+                raise ValueError(
+                    f"Column '{column}' has shape {values.shape}, expected ({len(self.names)},)"
+                )
+            self.columns[column] = values
+        self._original = {c: v.copy() for c, v in self.columns.items()}
+        self.file_path = Path(file_path) if file_path else None
+
+    # -------------------------------------------------------------------------
+    # Construction
+    # -------------------------------------------------------------------------
+
+    @classmethod
+    def from_records(
+        cls,
+        blocks: Iterable[tuple],
+        file_path: Optional[Union[str, Path]] = None
+    ) -> 'SubbasinTable':
+        """
+        Build a table from (name, attributes) pairs of Subbasin blocks.
+
+        Args:
+            blocks: Iterable of (subbasin_name, {basin_key: value_str})
+            file_path: Basin file the blocks came from
+
+        Returns:
+            SubbasinTable
+        """
+        names = []
+        text = {column: [] for column in cls.TEXT_COLUMNS}
+        raw = {column: [] for column in cls.NUMERIC_COLUMNS}
+
+        for name, attrs in blocks:
+            names.append(name)
+            for column, keys in cls.TEXT_COLUMNS.items():
+                text[column].append(next((attrs[k] for k in keys if k in attrs), None))
+            for column, key in cls.NUMERIC_COLUMNS.items():
+                raw[column].append(attrs.get(key))
+
+        columns = {column: np.array(values, dtype=object) for column, values in text.items()}
+        for column, values in raw.items():
+            # One vectorized conversion per column; '' and unparsable text -> NaN
+            series = pd.Series(values, dtype=object)
+            numeric = pd.to_numeric(series, errors='coerce')
+            # A present value that fails to parse is reported, not silently missing
+            stripped = series.astype(str).str.strip().str.lower()
+            bad = numeric.isna() & series.notna() & ~stripped.isin(['', 'nan'])
+            for row in np.flatnonzero(bad.to_numpy()):
+                logger.warning(
+                    f"Subbasin '{names[row]}': cannot parse {cls.NUMERIC_COLUMNS[column]}: "
+                    f"'{values[row]}' (treated as missing)"
+                    + (f" in {Path(file_path).name}" if file_path else "")
+                )
+            columns[column] = numeric.to_numpy(dtype=np.float64)
+
+        return cls(names, columns, file_path=file_path)
+
+    @classmethod
+    def from_file(
+        cls,
+        basin_path: Union[str, Path],
+        names: Optional[Iterable[str]] = None
+    ) -> 'SubbasinTable':
+        """
+        Read subbasins from a basin file into a table.
+
+        Blocks are streamed with HmsFileParser.iter_blocks, so only the
+        requested subbasins are parsed and reading stops once all of them
+        have been found.
+
+        Args:
+            basin_path: Path to the .basin file
+            names: Optional subset of subbasin names to load
+
+        Returns:
+            SubbasinTable with one row per subbasin, in file order
+
+        Example:
+            >>> table = SubbasinTable.from_file("model.basin")
+            >>> len(table)
+            120
+        """
+        basin_path = Path(basin_path)
+        wanted = set(names) if names is not None else None
+
+        def blocks():
+            found = 0
+            for _, name, attrs in HmsFileParser.iter_blocks(
+                basin_path, block_types=['Subbasin'], names=wanted
+            ):
+                yield name, attrs
+                found += 1
+                if wanted is not None and found == len(wanted):
+                    return
+
+        table = cls.from_records(blocks(), file_path=basin_path)
+        logger.debug(f"Loaded {len(table)} subbasins from {basin_path.name}")
+        return table
+
+    # -------------------------------------------------------------------------
+    # Access
+    # -------------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.index
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        """Column array (a view: in-place edits are picked up by write())."""
+        if column not in self.columns:
+            raise KeyError(f"Unknown column '{column}'. Available: {list(self.columns)}")
+        return self.columns[column]
+
+    def rows(self, rows: RowSelector = None) -> np.ndarray:
+        """
+        Resolve a row selector to an array of row positions.
+
+        Args:
+            rows: None (all rows), a subbasin name, a list of names, a boolean
+                mask of len(table), or integer positions
+
+        Returns:
+            Integer index array
+
+        Raises:
+            ValueError: If a subbasin name is not in the table
+        """
+        if rows is None:
+            return np.arange(len(self.names))
+        if isinstance(rows, str):
+            rows = [rows]
+        rows = np.asarray(rows)
+        if rows.dtype == bool:
+            if rows.shape != (len(self.names),):
+                raise ValueError(f"Boolean mask must have length {len(self.names)}")
+            return np.flatnonzero(rows)
+        if rows.dtype.kind in 'iu':
+            return rows.astype(np.intp)
+
+        missing = [name for name in rows if name not in self.index]
+        if missing:
+            raise ValueError(f"Subbasins not found: {missing}")
+        return np.fromiter((self.index[name] for name in rows), dtype=np.intp, count=len(rows))
+
+    def select(self, pattern: str) -> np.ndarray:
+        """
+        Boolean mask of subbasins whose name matches a regular expression.
+
+        Example:
+            >>> mask = table.select(r"^HUC0401")
+            >>> table["curve_number"][mask]
+        """
+        regex = re.compile(pattern)
+        return np.fromiter(
+            (regex.search(name) is not None for name in self.names),
+            dtype=bool, count=len(self.names)
+        )
+
+    def get(self, column: str, rows: RowSelector = None) -> np.ndarray:
+        """Values of one column for the selected rows (a copy)."""
+        return self[column][self.rows(rows)]
+
+    def _parameters(self, name: str, group: str) -> Dict[str, Any]:
+        """Build the HmsBasin-style parameter dict for one subbasin."""
+        if name not in self.index:
+            raise ValueError(f"Subbasin '{name}' not found")
+        i = self.index[name]
+        method_column, keys = self.METHOD_KEYS[group]
+        method = self.columns[method_column][i]
+
+        params = {'method': method if method is not None else 'None'}
+        for param in keys:
+            value = self.columns[param][i]
+            if param in self.TEXT_COLUMNS:
+                if value is not None:
+                    params[param] = value
+            elif not np.isnan(value):
+                params[param] = float(value)
+        return params
+
+    def loss_parameters(self, name: str) -> Dict[str, Any]:
+        """Loss method and parameters of one subbasin (as HmsBasin.get_loss_parameters)."""
+        return self._parameters(name, 'loss')
+
+    def transform_parameters(self, name: str) -> Dict[str, Any]:
+        """Transform method and parameters of one subbasin (as HmsBasin.get_transform_parameters)."""
+        return self._parameters(name, 'transform')
+
+    def baseflow_parameters(self, name: str) -> Dict[str, Any]:
+        """Baseflow method and parameters of one subbasin (as HmsBasin.get_baseflow_parameters)."""
+        return self._parameters(name, 'baseflow')
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Table as a DataFrame with a 'name' column followed by all columns."""
+        return pd.DataFrame({'name': self.names, **self.columns})
+
+    # -------------------------------------------------------------------------
+    # Vectorized edits
+    # -------------------------------------------------------------------------
+
+    def _numeric(self, column: str) -> np.ndarray:
+        if column not in self.NUMERIC_COLUMNS:
+            raise ValueError(
+                f"'{column}' is not a numeric parameter column. "
+                f"Valid: {sorted(self.NUMERIC_COLUMNS)}"
+            )
+        return self.columns[column]
+
+    def set(self, column: str, values: Any, rows: RowSelector = None) -> None:
+        """
+        Assign a scalar or array to a numeric column for the selected rows.
+
+        Args:
+            column: Numeric column (e.g. 'curve_number')
+            values: Scalar or array broadcastable to the selected rows
+            rows: Row selector (see rows())
+
+        Example:
+            >>> table.set("lag_time", [30.0, 45.0], rows=["Sub1", "Sub2"])
+        """
+        self._numeric(column)[self.rows(rows)] = values
+
+    def scale(
+        self,
+        column: str,
+        factor: Any,
+        rows: RowSelector = None,
+        lower: Optional[float] = None,
+        upper: Optional[float] = None
+    ) -> None:
+        """
+        Multiply a numeric column by a factor, optionally clipping the result.
+
+        Subbasins without the parameter (NaN) are left unchanged.
+
+        Args:
+            column: Numeric column (e.g. 'curve_number')
+            factor: Scalar or per-row array
+            rows: Row selector (see rows())
+            lower: Optional lower bound for the scaled values
+            upper: Optional upper bound for the scaled values
+
+        Example:
+            >>> table.scale("curve_number", 1.05, rows=table.select("^HUC0401"), upper=98)
+        """
+        values = self._numeric(column)
+        idx = self.rows(rows)
+        scaled = values[idx] * factor
+        if lower is not None or upper is not None:
+            scaled = np.clip(scaled, lower, upper)
+        values[idx] = scaled
+
+    def changes(self) -> pd.DataFrame:
+        """
+        Values that differ from the ones read from the file.
+
+        Returns:
+            DataFrame with columns: name, column, old_value, new_value
+        """
+        frames = []
+        for column in self.NUMERIC_COLUMNS:
+            new, old = self.columns[column], self._original[column]
+            changed = ~((new == old) | (np.isnan(new) & np.isnan(old)))
+            if changed.any():
+                frames.append(pd.DataFrame({
+                    'name': self.names[changed],
+                    'column': column,
+                    'old_value': old[changed],
+                    'new_value': new[changed],
+                }))
+        if not frames:
+            return pd.DataFrame(columns=['name', 'column', 'old_value', 'new_value'])
+        return pd.concat(frames, ignore_index=True)
+
+    def write(
+        self,
+        basin_path: Optional[Union[str, Path]] = None,
+        hms_object=None
+    ) -> int:
+        """
+        Write changed values back to the basin file in one batched pass.
+
+        Uses HmsBasin.set_parameters_batch(), so the file is indexed once,
+        every value is an O(1) line edit, the write is atomic, and nothing is
+        written if any changed parameter line does not exist in the file.
+
+        Args:
+            basin_path: Target basin file (default: the file it was read from)
+            hms_object: Optional HmsPrj instance to refresh
+
+        Returns:
+            Number of parameter values written
+
+        Raises:
+            ValueError: If there is no target file, or a changed parameter
+                line is missing from its Subbasin block
+
+        Example:
+            >>> table.scale("curve_number", 1.05)
+            >>> table.write()
+            120
+        """
+        basin_path = Path(basin_path) if basin_path else self.file_path
+        if basin_path is None:
+            raise ValueError("No basin file to write to; pass basin_path")
+
+        changes = self.changes()
+        if changes.empty:
+            return 0
+        if changes['new_value'].isna().any():
+            bad = changes.loc[changes['new_value'].isna(), ['name', 'column']]
+            raise ValueError(f"Cannot write NaN values: {bad.to_dict(orient='records')}")
+
+        edits: Dict[str, Dict[str, Any]] = {}
+        for name, column, value in zip(changes['name'], changes['column'], changes['new_value']):
+            edits.setdefault(name, {})[self.NUMERIC_COLUMNS[column]] = float(value)
+
+        from .HmsBasin import HmsBasin
+        count = HmsBasin.set_parameters_batch(basin_path, edits, hms_object=hms_object)
+
+        if basin_path == self.file_path:
+            self._original = {c: v.copy() for c, v in self.columns.items()}
+        return count
+
+    def __repr__(self) -> str:
+        source = self.file_path.name if self.file_path else '<memory>'
+        return f"SubbasinTable('{source}', subbasins={len(self)}, columns={len(self.columns)})"
@@ -69,6 +69,8 @@ from .HmsGeo import HmsGeo
 
 # File operations (Phase 2)
 from .HmsBasin import HmsBasin
+from .BasinModel import BasinModel
+from .SubbasinTable import SubbasinTable
 from .HmsControl import HmsControl
 from .HmsMet import HmsMet
 from .HmsGage import HmsGage
@@ -108,6 +110,9 @@ from .FrequencyStorm import FrequencyStorm
 # SCS Type I, IA, II, III Hyetograph Generation
 from .ScsTypeStorm import ScsTypeStorm
 
+# Seeded Design-Storm Ensembles
+from .StormEnsemble import StormEnsemble
+
 # Public API exports
 __all__ = [
     # Version
@@ -120,6 +125,8 @@ __all__ = [
 
     # File Operations
     "HmsBasin",
+    "BasinModel",
+    "SubbasinTable",
     "HmsControl",
     "HmsMet",
     "HmsGage",
@@ -163,6 +170,9 @@ __all__ = [
     # SCS Type Storms
     "ScsTypeStorm",
 
+    # Design-Storm Ensembles
+    "StormEnsemble",
+
     # Logging
     "setup_logging",
     "get_logger",
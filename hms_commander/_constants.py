@@ -303,6 +303,78 @@ ROUTING_METHODS: Final[List[str]] = [
 ]
 """Valid channel routing methods for reaches"""
 
+# =========================================================================
+# BASIN PARAMETER KEYS
+# =========================================================================
+# Mapping of snake_case parameter names (as returned by the HmsBasin
+# get_*_parameters methods) to the key text used in .basin files.
+
+LOSS_PARAMETER_KEYS: Final[Dict[str, str]] = {
+    'initial_deficit': 'Initial Deficit',
+    'maximum_deficit': 'Maximum Deficit',
+    'constant_rate': 'Constant Rate',
+    'percolation_rate': 'Percolation Rate',
+    'percent_impervious': 'Percent Impervious Area',
+    'curve_number': 'Curve Number',
+    'initial_abstraction': 'Initial Abstraction',
+    'conductivity': 'Conductivity',
+    'suction': 'Suction',
+    'initial_content': 'Initial Content',
+    'saturated_content': 'Saturated Content',
+}
+"""Loss method parameter names to .basin keys"""
+
+TRANSFORM_PARAMETER_KEYS: Final[Dict[str, str]] = {
+    'time_of_concentration': 'Time of Concentration',
+    'storage_coefficient': 'Storage Coefficient',
+    'lag_time': 'Lag Time',
+    'graph_type': 'Graph Type',
+    'snyder_tp': 'Snyder Tp',
+    'snyder_cp': 'Snyder Cp',
+}
+"""Transform method parameter names to .basin keys"""
+
+BASEFLOW_PARAMETER_KEYS: Final[Dict[str, str]] = {
+    'recession_factor': 'Recession Factor',
+    'initial_discharge': 'Initial Discharge',
+    'threshold_type': 'Threshold Type',
+    'gw1_initial': 'GW 1 Initial',
+    'gw1_coefficient': 'GW 1 Coefficient',
+    'gw2_initial': 'GW 2 Initial',
+    'gw2_coefficient': 'GW 2 Coefficient',
+}
+"""Baseflow method parameter names to .basin keys"""
+
+ROUTING_PARAMETER_KEYS: Final[Dict[str, str]] = {
+    'muskingum_k': 'Muskingum K',
+    'muskingum_x': 'Muskingum x',
+    'muskingum_steps': 'Muskingum Steps',
+    'lag': 'Lag',
+    'reach_length': 'Reach Length',
+    'reach_slope': 'Reach Slope',
+    'mannings_n': 'Manning n',
+}
+"""Routing method parameter names to .basin keys"""
+
+BASIN_PARAMETER_KEYS: Final[Dict[str, str]] = {
+    **LOSS_PARAMETER_KEYS,
+    **TRANSFORM_PARAMETER_KEYS,
+    **BASEFLOW_PARAMETER_KEYS,
+    **ROUTING_PARAMETER_KEYS,
+}
+"""All editable basin element parameter names to .basin keys"""
+
+BASIN_ELEMENT_TYPES: Final[List[str]] = [
+    "Subbasin",
+    "Reach",
+    "Junction",
+    "Reservoir",
+    "Source",
+    "Sink",
+    "Diversion",
+]
+"""Element block types that can appear in a .basin file"""
+
 # =========================================================================
 # PRECIPITATION METHODS
 # =========================================================================
@@ -4,17 +4,30 @@ Shared parsing utilities for HMS text files.
 Consolidates file reading, encoding fallback, and block parsing
 used across HmsBasin, HmsMet, HmsControl, and HmsGage.
 
-All methods are static and designed for internal use by HMS file
-operation classes.
+HmsFileParser methods are static and designed for internal use by HMS
+file operation classes. HmsBlockFile is a mutable, line-indexed view of a
+single file for workflows that make many edits before writing once.
 """
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Any, Tuple, Union, Optional
+from typing import Dict, Any, Iterable, Iterator, List, Tuple, Union, Optional
+import mmap
+import numbers
+import os
 import re
+import shutil
+import tempfile
 
 from .LoggingConfig import get_logger
 
 logger = get_logger(__name__)
 
+# Column-0 "Keyword: Name" lines; block headers and "End:" terminators.
+# Parameter lines are indented, so they never match.
+_STREAM_HEADER_PATTERN = re.compile(
+    rb'^([A-Za-z][^:\r\n]*?):[ \t]*([^\r\n]*?)\r?$', re.MULTILINE
+)
+
 
 class HmsFileParser:
     """
@@ -61,7 +74,13 @@ class HmsFileParser:
                 return f.read()
 
     @staticmethod
-    def write_file(file_path: Union[str, Path], content: str, encoding: str = 'utf-8') -> None:
+    def write_file(
+        file_path: Union[str, Path],
+        content: str,
+        encoding: str = 'utf-8',
+        atomic: bool = False,
+        newline: Optional[str] = None
+    ) -> None:
         """
         Write HMS file with specified encoding.
 
@@ -69,14 +88,44 @@ class HmsFileParser:
             file_path: Output file path
             content: File content string
             encoding: Character encoding (default: utf-8)
+            atomic: If True, write to a temporary file in the same folder and
+                rename it over file_path, so readers (and HEC-HMS) never see
+                a partially written file.
+            newline: Newline translation passed to open(). Use '' to write
+                content whose line endings are already final (e.g. CRLF text
+                read with newline='').
 
         Example:
             >>> HmsFileParser.write_file("model.basin", updated_content)
+            >>> HmsFileParser.write_file("model.basin", updated_content, atomic=True)
         """
         file_path = Path(file_path)
-        with open(file_path, 'w', encoding=encoding) as f:
-            f.write(content)
-        logger.debug(f"Wrote {len(content)} characters to {file_path}")
+
+        if not atomic:
+            with open(file_path, 'w', encoding=encoding, newline=newline) as f:
+                f.write(content)
+            logger.debug(f"Wrote {len(content)} characters to {file_path}")
+            return
+
+        fd, tmp_name = tempfile.mkstemp(
+            prefix=f".{file_path.name}.", suffix=".tmp", dir=file_path.parent
+        )
+        try:
+            with os.fdopen(fd, 'w', encoding=encoding, newline=newline) as f:
+                f.write(content)
+            # mkstemp creates 0600 files; keep the original permissions, or
+            # the umask default a plain open() would give a new file
+            if file_path.exists():
+                shutil.copymode(file_path, tmp_name)
+            else:
+                umask = os.umask(0)
+                os.umask(umask)
+                os.chmod(tmp_name, 0o666 & ~umask)
+            os.replace(tmp_name, file_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        logger.debug(f"Atomically wrote {len(content)} characters to {file_path}")
 
     @staticmethod
     def parse_blocks(content: str, block_keyword: str) -> Dict[str, Dict[str, str]]:
@@ -115,6 +164,100 @@ class HmsFileParser:
 
         return elements
 
+    @staticmethod
+    def iter_blocks(
+        file_path: Union[str, Path],
+        block_types: Optional[Iterable[str]] = None,
+        names: Optional[Iterable[str]] = None
+    ) -> Iterator[Tuple[str, str, Dict[str, str]]]:
+        """
+        Stream "Type: Name ... End:" blocks from a file without loading it.
+
+        The file is memory-mapped and scanned for column-0 header and "End:"
+        lines; only the blocks that pass the filters are decoded and parsed,
+        one at a time. Memory use is bounded by the largest selected block,
+        so very large .basin files (e.g. with embedded geometry) can be
+        summarized or queried for a single element cheaply.
+
+        Args:
+            file_path: Path to HMS file (.basin, .met, .gage, etc.)
+            block_types: Optional block types to yield (e.g. ["Subbasin"])
+            names: Optional block names to yield
+
+        Yields:
+            Tuple of (block_type, block_name, attributes_dict) in file order
+
+        Example:
+            >>> for block_type, name, attrs in HmsFileParser.iter_blocks(
+            ...     "model.basin", block_types=["Subbasin"]
+            ... ):
+            ...     print(name, attrs.get("Area"))
+        """
+        file_path = Path(file_path)
+        block_types = set(block_types) if block_types is not None else None
+        names = set(names) if names is not None else None
+
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                current = None
+                for match in _STREAM_HEADER_PATTERN.finditer(mm):
+                    keyword = match.group(1)
+                    if keyword == b'End':
+                        if current is not None:
+                            block_type, name, body_start = current
+                            body = HmsFileParser._decode(mm[body_start:match.start()])
+                            yield block_type, name, HmsFileParser._parse_attribute_block(body)
+                            current = None
+                        continue
+
+                    block_type = HmsFileParser._decode(keyword)
+                    name = HmsFileParser._decode(match.group(2)).strip()
+                    wanted = (
+                        (block_types is None or block_type in block_types)
+                        and (names is None or name in names)
+                    )
+                    current = (block_type, name, match.end()) if wanted else None
+
+    @staticmethod
+    def read_block(
+        file_path: Union[str, Path],
+        block_keyword: str,
+        block_name: str
+    ) -> Optional[Dict[str, str]]:
+        """
+        Read a single named block from a file, stopping at the first match.
+
+        Streaming counterpart of parse_blocks(content, ...)[block_name] that
+        does not read or parse the rest of the file.
+
+        Args:
+            file_path: Path to HMS file
+            block_keyword: Block type (e.g., "Subbasin", "Reach", "Gage")
+            block_name: Name of the block
+
+        Returns:
+            Attribute dictionary, or None if the block is not found
+
+        Example:
+            >>> attrs = HmsFileParser.read_block("model.basin", "Subbasin", "Sub-1")
+            >>> print(attrs["Area"])
+        """
+        for _, _, attrs in HmsFileParser.iter_blocks(
+            file_path, block_types=[block_keyword], names=[block_name]
+        ):
+            return attrs
+        return None
+
+    @staticmethod
+    def _decode(data: bytes) -> str:
+        """Decode bytes as UTF-8 with Latin-1 fallback."""
+        try:
+            return data.decode('utf-8')
+        except UnicodeDecodeError:
+            return data.decode('latin-1')
+
     @staticmethod
     def _parse_attribute_block(block: str) -> Dict[str, str]:
         """
@@ -212,9 +355,10 @@ class HmsFileParser:
         match = re.search(pattern, content, re.MULTILINE)
 
         if match:
-            old_line = match.group(0)
+            # Splice at the match offsets rather than str.replace(), which would
+            # rescan the content and could hit an identical earlier substring
             new_line = f"{match.group(1)}{new_value}"
-            new_content = content.replace(old_line, new_line, 1)
+            new_content = content[:match.start()] + new_line + content[match.end():]
             return new_content, True
 
         return content, False
@@ -316,3 +460,370 @@ class HmsFileParser:
             return float(value)
         except (ValueError, TypeError):
             return value
+
+
+@dataclass
+class HmsBlock:
+    """
+    Line index for one block of an HMS text file.
+
+    Attributes:
+        block_type: Header keyword (e.g. 'Subbasin', 'Gage', 'Meteorology')
+        name: Block name from the header line (may be empty)
+        start: Line number of the header line
+        end: Line number of the 'End:' line (None if the block is unterminated)
+        params: Parameter key -> line numbers (keys such as 'Depth' may repeat)
+    """
+    block_type: str
+    name: str
+    start: int
+    end: Optional[int] = None
+    params: Dict[str, List[int]] = field(default_factory=dict)
+
+
+class HmsBlockFile:
+    """
+    Mutable in-memory HMS block file with O(1) parameter access.
+
+    The file is split into lines once and every block and parameter line is
+    indexed by line number, so get/set by (block name, key) do not rescan the
+    content. Untouched lines (including CRLF line endings, indentation and
+    trailing whitespace) are serialized byte-for-byte as read.
+
+    Works for any HMS file built from "Type: Name ... End:" blocks
+    (.basin, .met, .gage, .control, .run, .pdata). See BasinModel for the
+    basin-specific layer.
+
+    Example:
+        >>> met = HmsBlockFile.from_file("model.met")
+        >>> met.get("Sub1", "Precip Gage", block_type="Subbasin")
+        'Gage-1'
+        >>> met.set("Sub1", "Precip Gage", "Gage-2", block_type="Subbasin")
+        True
+        >>> met.save()
+    """
+
+    DEFAULT_BLOCK_TYPES: Optional[Tuple[str, ...]] = None
+    """Block types searched when no block_type is given (None = all)"""
+
+    _HEADER_PATTERN = re.compile(r'^([A-Za-z][^:\r\n]*?):[ \t]*(.*?)[ \t]*\r?\n?$')
+
+    def __init__(
+        self,
+        content: str,
+        file_path: Optional[Union[str, Path]] = None,
+        encoding: str = 'utf-8'
+    ):
+        """
+        Index HMS file content.
+
+        Args:
+            content: File content. Read with newline='' to keep CRLF endings.
+            file_path: Optional source path used by save()
+            encoding: Encoding used by save()
+        """
+        self.file_path: Optional[Path] = Path(file_path) if file_path else None
+        self.encoding = encoding
+        self._lines: List[str] = content.splitlines(keepends=True)
+        self._blocks: List[HmsBlock] = []
+        self._by_name: Dict[str, List[HmsBlock]] = {}
+        self._modified: set = set()
+        self._index_blocks()
+
+    @classmethod
+    def from_file(cls, file_path: Union[str, Path]) -> 'HmsBlockFile':
+        """
+        Read and index an HMS file (UTF-8 with Latin-1 fallback).
+
+        Args:
+            file_path: Path to the HMS file
+
+        Returns:
+            Indexed file object
+
+        Example:
+            >>> gage_file = HmsBlockFile.from_file("model.gage")
+        """
+        file_path = Path(file_path)
+        try:
+            with open(file_path, 'r', encoding='utf-8', newline='') as f:
+                return cls(f.read(), file_path=file_path, encoding='utf-8')
+        except UnicodeDecodeError:
+            logger.debug(f"UTF-8 decode failed for {file_path}, falling back to Latin-1")
+            with open(file_path, 'r', encoding='latin-1', newline='') as f:
+                return cls(f.read(), file_path=file_path, encoding='latin-1')
+
+    def _index_blocks(self) -> None:
+        """Build the block and parameter line index in a single pass."""
+        current = None
+        for i, line in enumerate(self._lines):
+            if current is None:
+                if not line[:1].strip():
+                    continue
+                match = self._HEADER_PATTERN.match(line)
+                if match and match.group(1) != 'End':
+                    current = HmsBlock(match.group(1), match.group(2), start=i)
+                continue
+
+            if line.strip() == 'End:':
+                current.end = i
+                self._register(current)
+                current = None
+                continue
+
+            key, sep, _ = line.partition(':')
+            if sep:
+                current.params.setdefault(key.strip(), []).append(i)
+
+        if current is not None:
+            self._register(current)
+
+    def _register(self, block: HmsBlock) -> None:
+        self._blocks.append(block)
+        self._by_name.setdefault(block.name, []).append(block)
+
+    def _find(self, name: str, block_type: Optional[str] = None) -> HmsBlock:
+        """Look up a block by name, optionally restricted to one type."""
+        candidates = self._by_name.get(name, [])
+        if block_type is not None:
+            candidates = [b for b in candidates if b.block_type == block_type]
+        elif self.DEFAULT_BLOCK_TYPES is not None:
+            candidates = [b for b in candidates if b.block_type in self.DEFAULT_BLOCK_TYPES]
+
+        if not candidates:
+            kind = f"{block_type} " if block_type else ""
+            raise ValueError(f"{kind}block '{name}' not found")
+        if len(candidates) > 1 and block_type is None:
+            types = sorted({b.block_type for b in candidates})
+            if len(types) > 1:
+                raise ValueError(
+                    f"Block name '{name}' is ambiguous ({types}); pass block_type"
+                )
+        return candidates[0]
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def blocks(self, block_type: Optional[str] = None) -> List[HmsBlock]:
+        """Indexed blocks in file order, optionally filtered by type."""
+        if block_type is None:
+            return list(self._blocks)
+        return [b for b in self._blocks if b.block_type == block_type]
+
+    def names(self, block_type: Optional[str] = None) -> List[str]:
+        """Block names in file order, optionally filtered by type."""
+        return [b.name for b in self.blocks(block_type)]
+
+    def has_block(self, name: str, block_type: Optional[str] = None) -> bool:
+        """Check whether a block exists."""
+        try:
+            self._find(name, block_type)
+            return True
+        except ValueError:
+            return False
+
+    def keys(self, name: str, block_type: Optional[str] = None) -> List[str]:
+        """Parameter keys of a block in file order."""
+        return list(self._find(name, block_type).params)
+
+    def get(
+        self,
+        name: str,
+        key: str,
+        default: Optional[str] = None,
+        block_type: Optional[str] = None,
+        occurrence: int = 0
+    ) -> Optional[str]:
+        """
+        Get a parameter value as the stripped string from the file.
+
+        Args:
+            name: Block name (e.g. subbasin or gage name)
+            key: Parameter key as written in the file (e.g. 'Curve Number')
+            default: Returned if the block has no such key
+            block_type: Optional block type to disambiguate names
+            occurrence: Which occurrence of a repeated key to read
+
+        Returns:
+            Value string, or default if the key is absent
+
+        Raises:
+            ValueError: If the block does not exist
+        """
+        line_numbers = self._find(name, block_type).params.get(key)
+        if not line_numbers or occurrence >= len(line_numbers):
+            return default
+        return self._value_of(self._lines[line_numbers[occurrence]])
+
+    def get_all(
+        self,
+        name: str,
+        key: str,
+        block_type: Optional[str] = None
+    ) -> List[str]:
+        """Get every value of a repeated key (e.g. 'Depth' in a met file)."""
+        block = self._find(name, block_type)
+        return [self._value_of(self._lines[i]) for i in block.params.get(key, [])]
+
+    def attributes(self, name: str, block_type: Optional[str] = None) -> Dict[str, str]:
+        """All parameters of a block (first occurrence of repeated keys)."""
+        block = self._find(name, block_type)
+        return {key: self._value_of(self._lines[lines[0]]) for key, lines in block.params.items()}
+
+    # -------------------------------------------------------------------------
+    # Edits
+    # -------------------------------------------------------------------------
+
+    def set(
+        self,
+        name: str,
+        key: str,
+        value: Any,
+        block_type: Optional[str] = None,
+        occurrence: int = 0,
+        insert: bool = False
+    ) -> bool:
+        """
+        Set a parameter value, rewriting only that line.
+
+        Args:
+            name: Block name
+            key: Parameter key as written in the file
+            value: New value (numbers are formatted with format_value())
+            block_type: Optional block type to disambiguate names
+            occurrence: Which occurrence of a repeated key to set
+            insert: If True and the key is absent, add it before 'End:'.
+                Inserting shifts later line numbers and costs O(blocks).
+
+        Returns:
+            True if the line text changed
+
+        Raises:
+            ValueError: If the block, or the key (with insert=False), is missing
+        """
+        block = self._find(name, block_type)
+        line_numbers = block.params.get(key, [])
+
+        if occurrence < len(line_numbers):
+            i = line_numbers[occurrence]
+            old_line = self._lines[i]
+            head, _, old_value = old_line.partition(':')
+            spacing = old_value[:len(old_value) - len(old_value.lstrip(' \t'))] or ' '
+            newline = old_line[len(old_line.rstrip('\r\n')):]
+            new_line = f"{head}:{spacing}{self.format_value(value, old_value)}{newline}"
+        elif insert and occurrence == len(line_numbers):
+            i = block.end if block.end is not None else len(self._lines)
+            self._insert_line(block, i, key, value)
+            return True
+        else:
+            raise ValueError(f"Parameter '{key}' not found in block '{name}'")
+
+        if new_line == old_line:
+            return False
+        self._lines[i] = new_line
+        self._modified.add((block.block_type, block.name))
+        return True
+
+    def set_all(
+        self,
+        name: str,
+        key: str,
+        values: List[Any],
+        block_type: Optional[str] = None
+    ) -> int:
+        """
+        Set every occurrence of a repeated key (e.g. all 'Depth' lines).
+
+        Raises:
+            ValueError: If the number of values differs from the number of lines
+        """
+        block = self._find(name, block_type)
+        line_numbers = block.params.get(key, [])
+        if len(values) != len(line_numbers):
+            raise ValueError(
+                f"Block '{name}' has {len(line_numbers)} '{key}' lines but "
+                f"{len(values)} values were provided"
+            )
+        return sum(
+            self.set(name, key, value, block_type=block.block_type, occurrence=k)
+            for k, value in enumerate(values)
+        )
+
+    def _insert_line(self, block: HmsBlock, position: int, key: str, value: Any) -> None:
+        """Insert a new parameter line and shift the line index."""
+        first_param = min((lines[0] for lines in block.params.values()), default=None)
+        reference = self._lines[first_param] if first_param is not None else '     '
+        indent = reference[:len(reference) - len(reference.lstrip())] or '     '
+        header = self._lines[block.start]
+        newline = header[len(header.rstrip('\r\n')):] or '\n'
+
+        self._lines.insert(position, f"{indent}{key}: {self.format_value(value, '')}{newline}")
+
+        for other in self._blocks:
+            if other.start >= position:
+                other.start += 1
+            if other.end is not None and other.end >= position:
+                other.end += 1
+            for lines in other.params.values():
+                lines[:] = [n + 1 if n >= position else n for n in lines]
+        block.params.setdefault(key, []).append(position)
+        self._modified.add((block.block_type, block.name))
+
+    # -------------------------------------------------------------------------
+    # Serialization
+    # -------------------------------------------------------------------------
+
+    @property
+    def is_modified(self) -> bool:
+        """True if any line has changed since the file was indexed."""
+        return bool(self._modified)
+
+    @property
+    def modified_blocks(self) -> List[Tuple[str, str]]:
+        """(block_type, name) of every block edited so far."""
+        return sorted(self._modified)
+
+    def to_string(self) -> str:
+        """Serialize the file; untouched lines are returned exactly as read."""
+        return ''.join(self._lines)
+
+    def save(self, file_path: Optional[Union[str, Path]] = None, atomic: bool = True) -> Path:
+        """
+        Write the file back to disk.
+
+        Args:
+            file_path: Destination (defaults to the path the file was read from)
+            atomic: Write via temporary file + rename (default True)
+
+        Returns:
+            Path written
+        """
+        file_path = Path(file_path) if file_path else self.file_path
+        if file_path is None:
+            raise ValueError("No file_path given and the content was not read from a file")
+        HmsFileParser.write_file(
+            file_path, self.to_string(), encoding=self.encoding, atomic=atomic, newline=''
+        )
+        self._modified.clear()
+        return file_path
+
+    @staticmethod
+    def _value_of(line: str) -> str:
+        return line.partition(':')[2].strip()
+
+    @staticmethod
+    def format_value(value: Any, old_value: str = '') -> str:
+        """
+        Format a parameter value for writing.
+
+        Whole-number floats are written as integers when the existing value is
+        an integer (e.g. 'Muskingum Steps: 3'), so DataFrame round trips do not
+        turn integer fields into '3.0'.
+        """
+        if isinstance(value, numbers.Real) and not isinstance(value, bool):
+            value = float(value)
+            if value.is_integer() and re.fullmatch(r'[+-]?\d+', old_value.strip()):
+                return str(int(value))
+            return f"{value}"
+        return str(value)
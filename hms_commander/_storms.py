@@ -0,0 +1,167 @@
+"""
+Shared helpers for design-storm generation (Atlas14Storm, FrequencyStorm,
+ScsTypeStorm).
+
+Batched hyetographs are built by scaling a small number of dimensionless
+incremental patterns (one per unique pattern configuration) by vectors of
+total depths with NumPy broadcasting, instead of building one DataFrame per
+storm.
+
+Dimensionless unit hyetographs (resampled and peak-shifted patterns) are
+memoized in PATTERN_CACHE, an LRU cache shared by FrequencyStorm and
+ScsTypeStorm, so repeated requests for the same configuration cost only a
+multiply.
+
+The bundled dimensionless patterns (SCS Types I, IA, II, III and TP-40) live
+in one structured array file, data/storm_patterns.npy, that is memory-mapped
+once per process on first use (bundled_pattern).
+"""
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+# Bundled pattern store: one row per pattern with fields name, length and
+# values (NaN-padded to the longest pattern, the 1441-point SCS curves)
+PATTERN_STORE_FILE = Path(__file__).parent / "data" / "storm_patterns.npy"
+
+_pattern_store: Optional[Tuple[np.ndarray, Dict[str, int]]] = None
+
+
+def bundled_pattern(name: str) -> np.ndarray:
+    """
+    Return a bundled pattern as a read-only view of the memory-mapped store.
+
+    Args:
+        name: 'SCS-I', 'SCS-IA', 'SCS-II', 'SCS-III' or 'TP40'
+
+    Raises:
+        FileNotFoundError: If the pattern store is missing
+        KeyError: If name is not in the store
+    """
+    global _pattern_store
+    if _pattern_store is None:
+        if not PATTERN_STORE_FILE.exists():
+            raise FileNotFoundError(
+                f"Storm pattern file not found: {PATTERN_STORE_FILE}\n"
+                "This file should be bundled with hms-commander.\n"
+                "Try reinstalling: pip install --upgrade hms-commander"
+            )
+        store = np.load(PATTERN_STORE_FILE, mmap_mode='r')
+        _pattern_store = (store, {str(n): row for row, n in enumerate(store['name'])})
+
+    store, rows = _pattern_store
+    row = rows[name]
+    return store['values'][row, :store['length'][row]]
+
+
+def as_vector(values: Any, name: str) -> np.ndarray:
+    """Return a scalar or sequence as a non-empty 1D float array."""
+    array = np.atleast_1d(np.asarray(values, dtype=float))
+    if array.ndim != 1 or array.size == 0:
+        raise ValueError(f"{name} must be a scalar or a non-empty 1D sequence")
+    return array
+
+
+def as_list(values: Any) -> List[Any]:
+    """Return a scalar or sequence (strings count as scalars) as a list."""
+    if isinstance(values, (str, bytes)) or np.ndim(values) == 0:
+        return [values]
+    return list(values)
+
+
+def broadcast_depths(
+    patterns: Sequence[Tuple[Dict[str, Any], np.ndarray]],
+    total_depths: np.ndarray
+) -> Tuple[np.ndarray, pd.DataFrame]:
+    """
+    Scale dimensionless incremental patterns by every total depth.
+
+    Args:
+        patterns: (parameters, unit_increments) per pattern configuration;
+            unit_increments sum to 1 and may differ in length
+        total_depths: Total depths (inches)
+
+    Returns:
+        Tuple of a (scenario, time) array and the scenario index. Rows are
+        ordered pattern-major, depth-minor. Rows of storms shorter than the
+        longest one are padded with NaN; the index 'num_steps' column gives
+        each row's length.
+    """
+    n_depths = len(total_depths)
+    n_steps = max(len(increments) for _, increments in patterns)
+    values = np.full((len(patterns) * n_depths, n_steps), np.nan)
+
+    records = []
+    for k, (params, increments) in enumerate(patterns):
+        rows = slice(k * n_depths, (k + 1) * n_depths)
+        np.multiply(total_depths[:, None], increments[None, :], out=values[rows, :len(increments)])
+        records.append({**params, 'num_steps': len(increments)})
+
+    index = pd.DataFrame(records).loc[np.repeat(np.arange(len(patterns)), n_depths)]
+    index.insert(0, 'total_depth_inches', np.tile(total_depths, len(patterns)))
+    index = index.reset_index(drop=True)
+    index.index.name = 'scenario'
+    return values, index
+
+
+class PatternCache:
+    """
+    Thread-safe LRU cache of read-only unit hyetographs with hit/miss counts.
+
+    Keys are (pattern, num_intervals, peak_position) tuples, e.g.
+    ('TP40', 288, 67.0) or ('SCS-II', 25, None).
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, build: Callable[[], np.ndarray]) -> np.ndarray:
+        """Return the cached array for key, calling build() on a miss."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        array = np.array(build(), dtype=float)
+        array.flags.writeable = False
+
+        with self._lock:
+            self._entries[key] = array
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return array
+
+    def info(self) -> Dict[str, Any]:
+        """Return hits, misses, hit_rate, size and maxsize."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+            }
+
+    def clear(self) -> None:
+        """Drop all entries and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+PATTERN_CACHE = PatternCache()
@@ -5,4 +5,9 @@
 Data files in this package:
 
 - m3_hms_catalog.csv: Catalog of HMS projects in HCFCD M3 Models
+- storm_patterns.npy: SCS Type I, IA, II, III cumulative curves and the
+  TP-40 dimensionless pattern in one structured array (fields name, length,
+  values), memory-mapped by ScsTypeStorm and FrequencyStorm
+- atlas14_temporal_v1.npy (optional): Atlas 14 temporal distribution store
+  written by Atlas14Storm.build_temporal_store()
 """
@@ -894,6 +894,106 @@ class DssCore:
 
         return results
 
+    @staticmethod
+    def write_multiple_timeseries(
+        dss_file: Union[str, Path],
+        timeseries_records: List[Dict[str, Any]]
+    ) -> Dict[str, bool]:
+        """
+        Write multiple regular time series records to DSS file.
+
+        Keeps the DSS file open for all writes, so large batches (e.g.
+        design-storm ensembles) avoid one open/close per record.
+
+        Args:
+            dss_file: Path to DSS file (created if doesn't exist)
+            timeseries_records: List of dicts with keys:
+                - pathname: DSS pathname (/A/B/C/D/E/F/)
+                - values: numpy array of values
+                - times: numpy array of HEC times (minutes since 1899-12-31)
+                - units: (optional) Data units (default: "IN")
+                - data_type: (optional) DSS data type (default: "PER-CUM")
+
+        Returns:
+            Dict mapping pathname to success status (True/False)
+
+        Example:
+            >>> times = DssCore.datetime_to_hec_minutes("2000-01-01") + 60 * np.arange(25)
+            >>> records = [{"pathname": "//STORM/PRECIP-INC/01JAN2000/1HOUR/S0001/",
+            ...             "values": hyetograph, "times": times}]
+            >>> results = DssCore.write_multiple_timeseries("storms.dss", records)
+        """
+        # Configure JVM (must be before first jnius import)
+        DssCore._configure_jvm()
+
+        # Import Java classes via pyjnius (lazy)
+        from jnius import autoclass
+
+        HecDss = autoclass('hec.heclib.dss.HecDss')
+        TimeSeriesContainer = autoclass('hec.io.TimeSeriesContainer')
+
+        dss_file = str(Path(dss_file).resolve())
+        results = {}
+
+        # Open DSS file once for all writes
+        dss = HecDss.open(dss_file)
+
+        try:
+            dss.setMessageLevel(0)
+        except Exception:
+            pass
+
+        try:
+            for record in timeseries_records:
+                pathname = record['pathname']
+                try:
+                    values = np.asarray(record['values'], dtype=np.float64)
+                    times = np.asarray(record['times'], dtype=np.int64)
+                    if len(values) != len(times):
+                        raise ValueError(
+                            f"Mismatched array lengths: {len(values)} values, {len(times)} times"
+                        )
+
+                    container = TimeSeriesContainer()
+                    container.setFullName(pathname)
+                    container.setUnits(record.get('units', 'IN'))
+                    container.setType(record.get('data_type', 'PER-CUM'))
+
+                    # Fields are public on the container; times are int[] minutes
+                    container.times = times.astype(np.int32).tolist()
+                    container.values = values.tolist()
+                    container.numberValues = len(values)
+
+                    dss.put(container)
+                    results[pathname] = True
+
+                except Exception as e:
+                    logger.error(f"Error writing {pathname}: {e}")
+                    results[pathname] = False
+
+            logger.info(f"Wrote {sum(results.values())}/{len(results)} time series records")
+
+        finally:
+            dss.done()
+
+        return results
+
+    @staticmethod
+    def datetime_to_hec_minutes(timestamp: Union[str, 'pd.Timestamp']) -> int:
+        """
+        Convert a datetime to HEC time (minutes since 1899-12-31).
+
+        Inverse of _hec_time_to_datetime().
+
+        Args:
+            timestamp: Datetime string or Timestamp
+
+        Returns:
+            Minutes since HEC epoch (1899-12-31 00:00:00)
+        """
+        HEC_EPOCH = pd.Timestamp('1899-12-31 00:00:00')
+        return int((pd.Timestamp(timestamp) - HEC_EPOCH) // pd.Timedelta(minutes=1))
+
     @staticmethod
     def read_paired_data(
         dss_file: Union[str, Path],
@@ -88,6 +88,14 @@ class HmsDss:
         'et': r'/ET[^/]*/|/ET/',
     }
 
+    # Regular DSS time series intervals (minutes -> E-part)
+    DSS_INTERVALS = {
+        1: '1MIN', 2: '2MIN', 3: '3MIN', 4: '4MIN', 5: '5MIN', 6: '6MIN',
+        10: '10MIN', 12: '12MIN', 15: '15MIN', 20: '20MIN', 30: '30MIN',
+        60: '1HOUR', 120: '2HOUR', 180: '3HOUR', 240: '4HOUR', 360: '6HOUR',
+        480: '8HOUR', 720: '12HOUR', 1440: '1DAY',
+    }
+
     @staticmethod
     def is_available() -> bool:
         """
@@ -967,6 +975,132 @@ class HmsDss:
         logger.info(f"Importing {len(records)} temporal distributions to {dss_file}")
         return DssCore.write_multiple_paired_data(dss_file, records)
 
+    @staticmethod
+    @log_call
+    def write_design_storms(
+        dss_file: Union[str, Path],
+        values,
+        index: Optional[pd.DataFrame] = None,
+        start_time: str = "2000-01-01 00:00",
+        interval_minutes: Optional[int] = None,
+        a_part: str = "",
+        b_part: str = "DESIGN-STORM",
+        f_part: str = "S{scenario:04d}",
+        units: str = "IN"
+    ) -> pd.DataFrame:
+        """
+        Write a batch of design-storm hyetographs as DSS precipitation records.
+
+        Takes the (scenario, time) array and index returned by the
+        generate_hyetographs() methods of Atlas14Storm, FrequencyStorm and
+        ScsTypeStorm and writes one PRECIP-INC / PER-CUM record per scenario,
+        all through a single open DSS handle. Column k of each row is the
+        increment ending at start_time + k * interval; NaN padding beyond a
+        row's 'num_steps' is dropped.
+
+        Args:
+            dss_file: Output DSS file path (created if doesn't exist)
+            values: Array of shape (scenario, time) with incremental depths
+            index: Scenario index (one row per scenario). Its columns are
+                available to the f_part template and a 'time_interval_min'
+                column sets each scenario's interval.
+            start_time: Storm start date/time
+            interval_minutes: Time step in minutes, used when index has no
+                'time_interval_min' column (the Atlas 14, FrequencyStorm and
+                ScsTypeStorm batch indexes all have one)
+            a_part: DSS A-part
+            b_part: DSS B-part (location)
+            f_part: F-part template, formatted per scenario with 'scenario'
+                (row number) and the index columns,
+                e.g. "AEP{aep_percent:g}-{quartile}"
+            units: Data units (default: "IN")
+
+        Returns:
+            Copy of the index with added 'pathname' and 'written' columns
+
+        Raises:
+            ValueError: If an interval is missing or not a regular DSS interval,
+                or if F-parts are not unique
+
+        Example:
+            >>> values, index = ScsTypeStorm.generate_hyetographs(
+            ...     np.linspace(5, 15, 500), scs_types=['II', 'III'], time_intervals_min=15
+            ... )
+            >>> storms = HmsDss.write_design_storms(
+            ...     "storms.dss", values, index, f_part="SCS{scs_type}-{scenario:04d}"
+            ... )
+            >>> HmsGage.create_gages("model.gage", pd.DataFrame({
+            ...     'name': 'Storm-' + storms.index.astype(str),
+            ...     'dss_file': 'storms.dss',
+            ...     'pathname': storms['pathname'],
+            ... }))
+        """
+        import numpy as np
+
+        if not DSS_AVAILABLE:
+            raise ImportError(
+                "DSS functionality requires pyjnius.\n"
+                "Install with: pip install pyjnius\n"
+                "Also requires Java 8+ (JRE or JDK)"
+            )
+
+        values = np.atleast_2d(np.asarray(values, dtype=float))
+        if index is None:
+            index = pd.DataFrame(index=pd.RangeIndex(len(values), name='scenario'))
+        if len(index) != len(values):
+            raise ValueError(f"index has {len(index)} rows but values has {len(values)}")
+
+        if 'time_interval_min' in index.columns:
+            intervals = index['time_interval_min'].to_numpy(dtype=int)
+        elif interval_minutes is not None:
+            intervals = np.full(len(values), int(interval_minutes))
+        else:
+            raise ValueError("interval_minutes is required when index has no 'time_interval_min' column")
+
+        unknown = sorted(set(intervals.tolist()) - set(HmsDss.DSS_INTERVALS))
+        if unknown:
+            raise ValueError(
+                f"Intervals {unknown} min are not regular DSS intervals. "
+                f"Valid: {sorted(HmsDss.DSS_INTERVALS)}"
+            )
+
+        if 'num_steps' in index.columns:
+            num_steps = index['num_steps'].to_numpy(dtype=int)
+        else:
+            num_steps = np.full(len(values), values.shape[1])
+
+        start = pd.Timestamp(start_time)
+        start_minutes = DssCore.datetime_to_hec_minutes(start)
+        d_part = start.strftime('%d%b%Y').upper()
+        steps = np.arange(values.shape[1], dtype=np.int64)
+
+        records = []
+        pathnames = []
+        for row, (params, interval, n) in enumerate(
+            zip(index.to_dict('records'), intervals, num_steps)
+        ):
+            f_value = f_part.format(scenario=row, **params).upper().replace('/', '-')
+            pathname = f"/{a_part}/{b_part}/PRECIP-INC/{d_part}/{HmsDss.DSS_INTERVALS[interval]}/{f_value}/"
+            pathnames.append(pathname)
+            records.append({
+                'pathname': pathname,
+                'values': values[row, :n],
+                'times': start_minutes + interval * steps[:n],
+                'units': units,
+                'data_type': 'PER-CUM',
+            })
+
+        if len(set(pathnames)) != len(pathnames):
+            raise ValueError("f_part template does not give a unique F-part per scenario")
+
+        logger.info(f"Writing {len(records)} design storms to {dss_file}")
+        written = DssCore.write_multiple_timeseries(Path(dss_file), records)
+
+        result = index.copy()
+        result['pathname'] = pathnames
+        result['written'] = [written.get(p, False) for p in pathnames]
+        return result
+
     @staticmethod
     @log_call
     def read_paired_data(
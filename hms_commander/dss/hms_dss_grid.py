@@ -11,6 +11,7 @@ Classes:
 
 Key Functions:
     write_grid_timeseries: Write gridded precipitation time series to DSS
+    get_grid_times: Times of grid records already stored under a pathname
     get_info: Get information about DSS grid format
 
 Dependencies:
@@ -62,7 +63,7 @@ References:
 """
 
 from pathlib import Path
-from typing import Union, List, Optional
+from typing import Callable, Union, Iterable, Iterator, List, Optional, Sequence, Tuple
 from datetime import datetime
 import logging
 
@@ -154,12 +155,15 @@ class HmsDssGrid:
     def write_grid_timeseries(
         dss_file: Union[str, Path],
         pathname: str,
-        grid_data: 'np.ndarray',
+        grid_data: Union['np.ndarray', 'xr.DataArray', Iterable],
         lat_coords: 'np.ndarray',
         lon_coords: 'np.ndarray',
-        timestamps: List[datetime],
+        timestamps: Optional[Sequence[datetime]] = None,
         units: str = "MM",
-        data_type: str = "PER-CUM"
+        data_type: str = "PER-CUM",
+        chunk_size: int = 24,
+        skip_times: Optional[Iterable[datetime]] = None,
+        progress_callback: Optional[Callable[[int, Optional[int]], None]] = None
     ) -> Path:
         """
         Write gridded precipitation time series to DSS file.
@@ -167,6 +171,12 @@ class HmsDssGrid:
         Converts NumPy grid arrays to DSS grid format using HEC Monolith,
         following the pattern from HEC-Vortex's DssDataWriter.
 
+        Timesteps are streamed: arrays and (lazy or dask-backed) DataArrays
+        are read chunk_size timesteps at a time, and iterators are consumed
+        one grid at a time. A single DSS handle, grid definition and float32
+        buffer are reused for every timestep, so memory stays bounded by one
+        chunk regardless of the record length.
+
         Parameters
         ----------
         dss_file : str or Path
@@ -178,18 +188,23 @@ class HmsDssGrid:
             - B: Location/grid name
             - C: Parameter (e.g., "PRECIP")
             - D-F: Time/version (handled internally)
-        grid_data : np.ndarray
-            Precipitation data as 3D array with shape (time, lat, lon).
+        grid_data : np.ndarray, xr.DataArray, or iterable
+            Precipitation data, one of:
+            - 3D array with shape (time, lat, lon) (np.memmap works too)
+            - xarray DataArray with dims (time, lat, lon); timestamps
+              default to its first coordinate
+            - Iterable of 2D (lat, lon) arrays (requires timestamps)
+            - Iterable of (timestamp, 2D array) pairs
             Values should be in units specified by `units` parameter.
         lat_coords : np.ndarray
             1D array of latitude values in decimal degrees (WGS84).
-            Must match grid_data.shape[1].
+            Must match the grid lat dimension.
         lon_coords : np.ndarray
             1D array of longitude values in decimal degrees (WGS84).
-            Must match grid_data.shape[2].
-        timestamps : List[datetime]
-            List of datetime objects for each timestep.
-            Must match grid_data.shape[0].
+            Must match the grid lon dimension.
+        timestamps : sequence of datetime, optional
+            Timestamp of each timestep. Required for arrays and iterables of
+            plain 2D grids; must match the time dimension of an array.
         units : str, default "MM"
             Data units string. Common values:
             - "MM" - millimeters
@@ -199,6 +214,15 @@ class HmsDssGrid:
             - "PER-CUM" - Period cumulative (for precipitation)
             - "PER-AVER" - Period average (for temperature)
             - "INST-VAL" - Instantaneous value
+        chunk_size : int, default 24
+            Timesteps loaded at once from arrays and DataArrays
+        skip_times : iterable of datetime, optional
+            Timesteps not to write, e.g. get_grid_times() of the target file
+            when resuming an interrupted run. Array chunks whose timesteps
+            are all skipped are not loaded.
+        progress_callback : callable, optional
+            Called as ``progress_callback(done, total)`` after every timestep
+            (written or skipped); total is None for iterables.
 
         Returns
         -------
@@ -236,6 +260,13 @@ class HmsDssGrid:
         ...     timestamps=times,
         ...     units="MM"
         ... )
+        >>>
+        >>> # Stream a multi-year NetCDF without loading it
+        >>> da = xr.open_dataset("aorc.nc", chunks={"time": 24})["APCP_surface"]
+        >>> HmsDssGrid.write_grid_timeseries(
+        ...     "precip.dss", "/AORC/WATERSHED/PRECIP////", da,
+        ...     da.latitude.values, da.longitude.values
+        ... )
 
         Notes
         -----
@@ -252,35 +283,43 @@ class HmsDssGrid:
         _check_dss_dependencies()
 
         import numpy as np
-        import pandas as pd
 
         dss_file = Path(dss_file)
+        lat_coords = np.asarray(lat_coords, dtype=np.float64)
+        lon_coords = np.asarray(lon_coords, dtype=np.float64)
+        nlat, nlon = len(lat_coords), len(lon_coords)
+
+        # Validate array dimensions up front when the shape is known
+        shape = getattr(grid_data, 'shape', None)
+        nt = None
+        if shape is not None:
+            if len(shape) != 3:
+                raise ValueError(
+                    f"grid_data must be 3D (time, lat, lon), got shape {shape}"
+                )
+            nt = shape[0]
+            if shape[1] != nlat:
+                raise ValueError(
+                    f"lat_coords length ({nlat}) must match "
+                    f"grid_data lat dimension ({shape[1]})"
+                )
+            if shape[2] != nlon:
+                raise ValueError(
+                    f"lon_coords length ({nlon}) must match "
+                    f"grid_data lon dimension ({shape[2]})"
+                )
+            if timestamps is not None and len(timestamps) != nt:
+                raise ValueError(
+                    f"timestamps length ({len(timestamps)}) must match "
+                    f"grid_data time dimension ({nt})"
+                )
 
-        # Validate array dimensions
-        if grid_data.ndim != 3:
-            raise ValueError(
-                f"grid_data must be 3D (time, lat, lon), got shape {grid_data.shape}"
-            )
-
-        nt, nlat, nlon = grid_data.shape
-
-        if len(lat_coords) != nlat:
-            raise ValueError(
-                f"lat_coords length ({len(lat_coords)}) must match "
-                f"grid_data lat dimension ({nlat})"
-            )
-
-        if len(lon_coords) != nlon:
-            raise ValueError(
-                f"lon_coords length ({len(lon_coords)}) must match "
-                f"grid_data lon dimension ({nlon})"
-            )
-
-        if len(timestamps) != nt:
-            raise ValueError(
-                f"timestamps length ({len(timestamps)}) must match "
-                f"grid_data time dimension ({nt})"
-            )
+        fmt = '%Y-%m-%dT%H:%M:%S'
+        skip = None
+        if skip_times is not None:
+            import pandas as pd
+            skip = set(pd.DatetimeIndex(list(skip_times)).strftime(fmt))
+        frames = HmsDssGrid._iter_timesteps(grid_data, timestamps, chunk_size, skip)
 
         # Ensure HEC Monolith is ready
         logger.info("Configuring HEC Monolith for DSS grid writing...")
@@ -301,10 +340,6 @@ class HmsDssGrid:
                 "Ensure pyjnius is properly installed with Java 8+."
             )
 
-        # Calculate grid parameters
-        lat_coords = np.asarray(lat_coords, dtype=np.float64)
-        lon_coords = np.asarray(lon_coords, dtype=np.float64)
-
         # Cell size (average of lat and lon spacing)
         dlat = abs(lat_coords[1] - lat_coords[0]) if nlat > 1 else 0.01
         dlon = abs(lon_coords[1] - lon_coords[0]) if nlon > 1 else 0.01
@@ -333,78 +368,199 @@ class HmsDssGrid:
         logger.info(f"Writing DSS grid to: {dss_file}")
         logger.info(f"  Pathname: {pathname}")
         logger.info(f"  Grid: {nlat} lat x {nlon} lon = {nlat * nlon} cells")
-        logger.info(f"  Timesteps: {nt}")
+        logger.info(f"  Timesteps: {nt if nt is not None else 'streamed'}")
         logger.info(f"  Cell size: {cell_size:.6f} degrees")
         logger.info(f"  Origin: ({lon_min:.4f}, {lat_min:.4f})")
         logger.info(f"  Units: {units}, Type: {data_type}")
 
-        # Write each timestep (Vortex pattern: one write per timestep)
-        for t_idx, timestamp in enumerate(timestamps):
-            try:
-                # Create SpecifiedGridInfo for this timestep (Vortex DssUtil.java lines 141-159)
-                grid_info = SpecifiedGridInfo()
+        # Grid definition shared by all timesteps (Vortex DssUtil.java lines 141-159);
+        # only the grid times change per write
+        grid_info = SpecifiedGridInfo()
+        grid_info.setSpatialReference("WGS 84", HmsDssGrid.WKT_WGS84, 0, 0)
+        grid_info.setCellInfo(min_x, min_y, nlon, nlat, float(cell_size))
+        grid_info.setDataUnits(units)
+        grid_info.setDataType(dss_data_type.value())
 
-                # Set spatial reference (WGS84)
-                grid_info.setSpatialReference("WGS 84", HmsDssGrid.WKT_WGS84, 0, 0)
+        # One DSS handle for the whole series (Vortex DssDataWriter.java lines 294-316)
+        gridded_data = GriddedData()
+        gridded_data.setDSSFileName(str(dss_file))
+        gridded_data.setPathname(pathname)
 
-                # Set cell info (minX, minY, nx, ny, cellSize)
-                grid_info.setCellInfo(min_x, min_y, nlon, nlat, float(cell_size))
+        # Reused (lat, lon) float32 buffer, flattened in C order (row-major)
+        buffer = np.empty((nlat, nlon), dtype=np.float32)
 
-                # Set units and data type
-                grid_info.setDataUnits(units)
-                grid_info.setDataType(dss_data_type.value())
+        written = 0
+        skipped = 0
+        try:
+            for t_idx, (time_str, frame) in enumerate(frames):
+                if frame is None:
+                    skipped += 1
+                    if progress_callback is not None:
+                        progress_callback(t_idx + 1, nt)
+                    continue
+                try:
+                    if np.shape(frame) != (nlat, nlon):
+                        raise ValueError(
+                            f"grid shape {np.shape(frame)} does not match "
+                            f"(lat, lon) = ({nlat}, {nlon})"
+                        )
+                    np.copyto(buffer, frame, casting='unsafe')
+
+                    # Same start and end time for a single timestep (Vortex pattern)
+                    hec_time = HecTime(time_str)
+                    grid_info.setGridTimes(hec_time, hec_time)
+
+                    # pyjnius converts the Python list to a Java float[]
+                    grid_data_obj = GridData(buffer.ravel().tolist(), grid_info)
+
+                    gridded_data.setGriddedTimeWindow(hec_time, hec_time)
+                    status = gridded_data.storeGriddedData(grid_info, grid_data_obj)
+                    if status != 0:
+                        raise RuntimeError(f"status code {status}")
+                except Exception as e:
+                    raise RuntimeError(
+                        f"DSS grid write failed at timestep {t_idx} ({time_str}): {e}"
+                    )
 
-                # Set times (Vortex pattern: same start and end for single timestep)
-                time_str = timestamp.strftime('%Y-%m-%dT%H:%M:%S')
-                hec_time = HecTime(time_str)
-                grid_info.setGridTimes(hec_time, hec_time)
+                written += 1
+                if written % 100 == 0 or written + skipped == nt:
+                    logger.info(f"  Wrote {written}/{nt if nt is not None else '?'} timesteps")
+                if progress_callback is not None:
+                    progress_callback(t_idx + 1, nt)
+        finally:
+            gridded_data.done()
 
-                # Extract and flatten grid for this timestep
-                # Grid is (lat, lon), flatten in C order (row-major)
-                precip_2d = grid_data[t_idx, :, :]
-                precip_flat = precip_2d.flatten(order='C').astype(np.float32)
+        # Final summary
+        file_size_mb = dss_file.stat().st_size / (1024 * 1024) if dss_file.exists() else 0
+        logger.info(f"DSS grid write complete: {dss_file}")
+        logger.info(f"  File size: {file_size_mb:.2f} MB")
+        logger.info(f"  Total cells: {written * nlat * nlon:,}")
+        if skipped:
+            logger.info(f"  Skipped {skipped} timesteps already present")
 
-                # Convert numpy array to Java float array
-                # pyjnius handles Python list to Java array conversion
-                precip_list = precip_flat.tolist()
+        return dss_file
 
-                # Create GridData (Vortex pattern: GridData constructor takes float[] and GridInfo)
-                grid_data_obj = GridData(precip_list, grid_info)
+    @staticmethod
+    def _iter_timesteps(
+        grid_data: Union['np.ndarray', 'xr.DataArray', Iterable],
+        timestamps: Optional[Sequence[datetime]],
+        chunk_size: int,
+        skip: Optional[set] = None
+    ) -> Iterator[Tuple[str, Optional['np.ndarray']]]:
+        """
+        Yield (HecTime string, 2D grid) pairs with bounded memory.
 
-                # Create GriddedData writer (Vortex DssDataWriter.java lines 294-316)
-                gridded_data = GriddedData()
-                gridded_data.setDSSFileName(str(dss_file))
-                gridded_data.setPathname(pathname)
+        Arrays and DataArrays are sliced chunk_size timesteps at a time (a
+        lazy DataArray only loads the current chunk); timestamps are
+        formatted per chunk with vectorized pandas strftime. Timesteps whose
+        string is in ``skip`` are yielded with a None grid, and a chunk that
+        is skipped entirely is never loaded.
+        """
+        import pandas as pd
 
-                # Set time window
-                gridded_data.setGriddedTimeWindow(hec_time, hec_time)
+        fmt = '%Y-%m-%dT%H:%M:%S'
+
+        if hasattr(grid_data, 'shape') and hasattr(grid_data, '__getitem__'):
+            if timestamps is None:
+                if hasattr(grid_data, 'dims'):
+                    timestamps = grid_data[grid_data.dims[0]].values
+                else:
+                    raise ValueError("timestamps are required for array input")
+            times = pd.DatetimeIndex(timestamps)
+            chunk_size = max(1, int(chunk_size))
+            for start in range(0, grid_data.shape[0], chunk_size):
+                stop = min(start + chunk_size, grid_data.shape[0])
+                labels = times[start:stop].strftime(fmt)
+                if skip and all(label in skip for label in labels):
+                    for time_str in labels:
+                        yield time_str, None
+                    continue
+                chunk = grid_data[start:stop]
+                chunk = chunk.values if hasattr(chunk, 'dims') else chunk
+                for time_str, frame in zip(labels, chunk):
+                    yield time_str, (None if skip and time_str in skip else frame)
+            return
+
+        if timestamps is not None:
+            for timestamp, frame in zip(timestamps, grid_data):
+                time_str = pd.Timestamp(timestamp).strftime(fmt)
+                yield time_str, (None if skip and time_str in skip else frame)
+            return
+
+        for item in grid_data:
+            if not (isinstance(item, tuple) and len(item) == 2):
+                raise ValueError(
+                    "Iterable grid_data must yield (timestamp, grid) pairs "
+                    "when timestamps is not given"
+                )
+            timestamp, frame = item
+            time_str = pd.Timestamp(timestamp).strftime(fmt)
+            yield time_str, (None if skip and time_str in skip else frame)
 
-                # WRITE TO DSS! (The critical call from Vortex)
-                status = gridded_data.storeGriddedData(grid_info, grid_data_obj)
-                if status != 0:
-                    raise RuntimeError(
-                        f"DSS grid write failed at {timestamp}: status code {status}"
-                    )
+    @staticmethod
+    def get_grid_times(dss_file: Union[str, Path], pathname: str) -> 'pd.DatetimeIndex':
+        """
+        Times of the grid records already stored under a pathname.
 
-                # Cleanup (Vortex pattern: done() after each write)
-                gridded_data.done()
+        Records match when their A, B, C and F parts equal those of
+        ``pathname``; the record time is taken from the D part.
 
-                # Progress update
-                if (t_idx + 1) % 10 == 0 or (t_idx + 1) == nt:
-                    logger.info(f"  Wrote {t_idx + 1}/{nt} timesteps")
+        Parameters
+        ----------
+        dss_file : str or Path
+            DSS file to catalog. A missing file has no records.
+        pathname : str
+            DSS grid pathname, e.g. "/AORC/GRID/PRECIP////"
 
-            except Exception as e:
-                raise RuntimeError(
-                    f"DSS grid write failed at timestep {t_idx} ({timestamp}): {e}"
-                )
+        Returns
+        -------
+        pd.DatetimeIndex
+            Sorted, unique record times.
 
-        # Final summary
-        file_size_mb = dss_file.stat().st_size / (1024 * 1024) if dss_file.exists() else 0
-        logger.info(f"DSS grid write complete: {dss_file}")
-        logger.info(f"  File size: {file_size_mb:.2f} MB")
-        logger.info(f"  Total cells: {nt * nlat * nlon:,}")
+        Examples
+        --------
+        >>> done = HmsDssGrid.get_grid_times("aorc.dss", "/AORC/GRID/PRECIP////")
+        >>> HmsDssGrid.write_grid_timeseries(..., skip_times=done)
+        """
+        import pandas as pd
 
-        return dss_file
+        dss_file = Path(dss_file)
+        if not dss_file.exists():
+            return pd.DatetimeIndex([])
+
+        _check_dss_dependencies()
+        from .core import DssCore
+        return HmsDssGrid._grid_times_from_catalog(DssCore.get_catalog(dss_file), pathname)
+
+    @staticmethod
+    def _grid_times_from_catalog(catalog: List[str], pathname: str) -> 'pd.DatetimeIndex':
+        """Parse the D-part times of catalog paths matching pathname's A/B/C/F parts."""
+        import pandas as pd
+
+        def split(path):
+            # /A/B/C/D/E/F/ -> [A, B, C, D, E, F]; empty parts keep their slot
+            parts = path.strip().split('/')[1:7]
+            return parts + [''] * (6 - len(parts))
+
+        def key(parts):
+            return tuple(p.strip().upper() for p in (parts[0], parts[1], parts[2], parts[5]))
+
+        target = key(split(pathname))
+        d_parts = pd.Series([
+            parts[3]
+            for parts in (split(path) for path in catalog if path.count('/') >= 6)
+            if key(parts) == target
+        ], dtype=object)
+        if d_parts.empty:
+            return pd.DatetimeIndex([])
+
+        # DSS writes midnight as 2400 of the previous day
+        d_parts = d_parts.str.strip().str.upper()
+        midnight = d_parts.str.endswith(':2400')
+        d_parts = d_parts.where(~midnight, d_parts.str[:-4] + '0000')
+        times = pd.to_datetime(d_parts, format='%d%b%Y:%H%M', errors='coerce')
+        times = times + pd.to_timedelta(midnight.astype(int), unit='D')
+        return pd.DatetimeIndex(times.dropna()).unique().sort_values()
 
     @staticmethod
     def get_info() -> dict: